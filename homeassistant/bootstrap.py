@@ -451,6 +451,8 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    # Reuse the manifests read during the previous start
+    await loader.async_load_manifest_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -972,9 +974,18 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    resolve_start = monotonic()
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
+    if manifest_cache := hass.data.get(loader.DATA_MANIFEST_CACHE):
+        _LOGGER.debug(
+            "Resolved %s integrations in %.3fs (manifest cache: %s hits, %s misses)",
+            len(integration_cache),
+            monotonic() - resolve_start,
+            manifest_cache.hits,
+            manifest_cache.misses,
+        )
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
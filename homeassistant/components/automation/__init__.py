@@ -5,9 +5,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from functools import cached_property, partial
 import logging
+import time
 from typing import Any, Protocol, cast
 
 import voluptuous as vol
@@ -127,6 +128,19 @@ ATTR_VARIABLES = "variables"
 SERVICE_TRIGGER = "trigger"
 
 
+@dataclass(slots=True)
+class AutomationEvaluationStats:
+    """Counters of the evaluations of an automation."""
+
+    # Number of times the automation was triggered
+    triggered: int = 0
+    # Number of times the conditions were evaluated and failed
+    conditions_evaluated: int = 0
+    conditions_failed: int = 0
+    # Total time spent evaluating the conditions in seconds
+    conditions_time: float = 0.0
+
+
 class IfAction(Protocol):
     """Define the format of if_action."""
 
@@ -344,6 +358,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     websocket_api.async_register_command(hass, websocket_config)
+    websocket_api.async_register_command(hass, websocket_evaluation_stats)
 
     return True
 
@@ -354,6 +369,7 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     _entity_component_unrecorded_attributes = frozenset(
         (ATTR_LAST_TRIGGERED, ATTR_MODE, ATTR_CUR, ATTR_MAX, CONF_ID)
     )
+    evaluation_stats: AutomationEvaluationStats
     raw_config: ConfigType | None
 
     @property
@@ -426,6 +442,7 @@ class UnavailableAutomationEntity(BaseAutomationEntity):
         self.raw_config = raw_config
         self._validation_error = validation_error
         self._validation_status = validation_status
+        self.evaluation_stats = AutomationEvaluationStats()
 
     @cached_property
     def referenced_labels(self) -> set[str]:
@@ -525,6 +542,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         self._blueprint_inputs = blueprint_inputs
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
+        self.evaluation_stats = AutomationEvaluationStats()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -704,17 +722,23 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             trace_element = TraceElement(variables, trigger_path)
             trace_append_element(trace_element)
 
-            if (
-                not skip_condition
-                and self._cond_func is not None
-                and not self._cond_func(variables)
-            ):
-                self._logger.debug(
-                    "Conditions not met, aborting automation. Condition summary: %s",
-                    trace_get(clear=False),
-                )
-                script_execution_set("failed_conditions")
-                return None
+            stats = self.evaluation_stats
+            stats.triggered += 1
+            if not skip_condition and self._cond_func is not None:
+                start = time.perf_counter()
+                try:
+                    conditions_passed = self._cond_func(variables)
+                finally:
+                    stats.conditions_evaluated += 1
+                    stats.conditions_time += time.perf_counter() - start
+                if not conditions_passed:
+                    stats.conditions_failed += 1
+                    self._logger.debug(
+                        "Conditions not met, aborting automation. Condition summary: %s",
+                        trace_get(clear=False),
+                    )
+                    script_execution_set("failed_conditions")
+                    return None
 
             self.async_set_context(trigger_context)
             event_data = {
@@ -1220,6 +1244,26 @@ def websocket_config(
     )
 
 
+@websocket_api.websocket_command(
+    {"type": "automation/evaluation_stats", "entity_id": str}
+)
+def websocket_evaluation_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get the evaluation counters of an automation."""
+    automation = hass.data[DATA_COMPONENT].get_entity(msg["entity_id"])
+
+    if automation is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Entity not found"
+        )
+        return
+
+    connection.send_result(msg["id"], asdict(automation.evaluation_stats))
+
+
 # These can be removed if no deprecated constant are in this module anymore
 __getattr__ = partial(check_if_deprecated_constant, module_globals=globals())
 __dir__ = partial(
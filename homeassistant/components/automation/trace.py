@@ -7,6 +7,7 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
     ActionTrace,
     async_store_trace,
@@ -58,7 +59,12 @@ def trace_automation(
 ) -> Generator[AutomationTrace]:
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    async_store_trace(
+        hass,
+        trace,
+        trace_config[CONF_STORED_TRACES],
+        trace_config[CONF_SAMPLE_INTERVAL],
+    )
 
     try:
         yield trace
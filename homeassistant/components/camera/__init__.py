@@ -80,6 +80,7 @@ from .const import (  # noqa: F401
     CameraState,
     StreamType,
 )
+from .image_cache import CameraImageCache
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
@@ -508,6 +509,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._image_cache: CameraImageCache | None = None
 
     @cached_property
     def entity_picture(self) -> str:
@@ -654,6 +656,28 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             partial(self.camera_image, width=width, height=height)
         )
 
+    @final
+    async def async_get_cached_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> Image:
+        """Return a still image, sharing it between requests.
+
+        One snapshot is fetched per frame interval of the camera, images of
+        other sizes are scaled from it. Cameras which do not return jpeg
+        images are asked for images of the requested size instead.
+        """
+        if (image_cache := self._image_cache) is None:
+            image_cache = self._image_cache = CameraImageCache(
+                self.hass, partial(_async_get_image, self, CAMERA_IMAGE_TIMEOUT)
+            )
+        content_type = self.content_type
+        return await image_cache.async_get_image(
+            width,
+            height,
+            self.frame_interval,
+            "jpeg" in content_type or "jpg" in content_type,
+        )
+
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
@@ -828,9 +852,7 @@ class CameraImageView(CameraView):
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
-                camera,
-                CAMERA_IMAGE_TIMEOUT,
+            image = await camera.async_get_cached_image(
                 int(width) if width else None,
                 int(height) if height else None,
             )
@@ -0,0 +1,142 @@
+"""Share the still images of a camera between requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+import attr
+
+from homeassistant.core import HomeAssistant
+
+from .img_util import scale_jpeg_camera_image
+
+if TYPE_CHECKING:
+    from . import Image
+
+# Maximum number of scaled images cached for a snapshot, and of images
+# fetched at a requested size
+MAX_CACHED_SIZES = 8
+
+type ImageSize = tuple[int, int]
+
+
+class CameraImageCache:
+    """Cache the snapshot of a camera and the images scaled from it.
+
+    The snapshot is reused until it is older than the frame interval of the
+    camera. Concurrent requests wait for the same fetch, so the camera is
+    only asked for one snapshot per frame interval whatever the requested
+    sizes. Scaled images are created from the snapshot once per size.
+
+    Images which cannot be scaled, because the camera does not return jpeg
+    images, are fetched from the camera at the requested size instead, and
+    cached per size in the same way as the snapshot.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_fetch",
+        "_fetch_tasks",
+        "_images",
+        "_scaled",
+        "hits",
+        "misses",
+        "shared",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fetch: Callable[[int | None, int | None], Awaitable[Image]],
+    ) -> None:
+        """Initialize the cache with the function fetching an image."""
+        self._hass = hass
+        self._fetch = fetch
+        self._fetch_tasks: dict[ImageSize | None, asyncio.Task[Image]] = {}
+        # The fetched images and the time they were fetched, by requested
+        # size, the snapshot is requested without a size
+        self._images: dict[ImageSize | None, tuple[float, Image]] = {}
+        self._scaled: dict[ImageSize, Image] = {}
+        # Requests served from the cache, by a new fetch or by a running fetch
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    async def async_get_image(
+        self,
+        width: int | None,
+        height: int | None,
+        max_age: float,
+        scalable: bool = True,
+    ) -> Image:
+        """Return an image from a snapshot not older than max_age seconds.
+
+        If scalable is False, images of a requested size are fetched from
+        the camera at that size instead of being scaled from the snapshot.
+        """
+        if width is None or height is None:
+            return await self._async_get_fetched_image(None, max_age)
+        size = (width, height)
+        if not scalable:
+            return await self._async_get_fetched_image(size, max_age)
+        snapshot = await self._async_get_fetched_image(None, max_age)
+        return self._scaled_image(snapshot, size)
+
+    async def _async_get_fetched_image(
+        self, size: ImageSize | None, max_age: float
+    ) -> Image:
+        """Return an image fetched at size not older than max_age seconds."""
+        if (
+            cached := self._images.get(size)
+        ) is not None and self._hass.loop.time() - cached[0] < max_age:
+            self.hits += 1
+            return cached[1]
+        if (fetch := self._fetch_tasks.get(size)) is None:
+            self.misses += 1
+            fetch = self._fetch_tasks[size] = self._hass.async_create_task(
+                self._async_fetch(size), "camera image fetch", eager_start=False
+            )
+        else:
+            self.shared += 1
+        # Other requests may wait for the fetch, do not cancel it when
+        # this request is cancelled
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch(self, size: ImageSize | None) -> Image:
+        """Fetch an image at size and cache it."""
+        fetched_at = self._hass.loop.time()
+        try:
+            image = await (
+                self._fetch(None, None) if size is None else self._fetch(*size)
+            )
+        finally:
+            del self._fetch_tasks[size]
+        images = self._images
+        if size is None:
+            self._scaled.clear()
+        elif size not in images and len(images) > MAX_CACHED_SIZES:
+            del images[next(key for key in images if key is not None)]
+        images[size] = (fetched_at, image)
+        return image
+
+    def _scaled_image(self, snapshot: Image, size: ImageSize) -> Image:
+        """Return the snapshot scaled to size, scaling it once per snapshot."""
+        content_type = snapshot.content_type
+        if "jpeg" not in content_type and "jpg" not in content_type:
+            return snapshot
+        if (cached := self._images.get(None)) is None or snapshot is not cached[1]:
+            # A newer snapshot was fetched while waiting for this one
+            return _scale_image(snapshot, size)
+        scaled = self._scaled
+        if (image := scaled.get(size)) is None:
+            if len(scaled) >= MAX_CACHED_SIZES:
+                del scaled[next(iter(scaled))]
+            image = scaled[size] = _scale_image(snapshot, size)
+        return image
+
+
+def _scale_image(image: Image, size: ImageSize) -> Image:
+    """Return a copy of a jpeg image scaled to size."""
+    return attr.evolve(image, content=scale_jpeg_camera_image(image, *size))
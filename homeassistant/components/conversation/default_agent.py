@@ -13,7 +13,13 @@ import time
 from typing import IO, Any, cast
 
 from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.intents import (
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -160,6 +166,12 @@ class DefaultAgent(ConversationEntity):
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
 
+        # Slot list values, kept up to date per entity/registry
+        self._entity_names: dict[str, list[TextSlotValue]] | None = None
+        self._dirty_entity_ids: set[str] = set()
+        self._area_names: TextSlotList | None = None
+        self._floor_names: TextSlotList | None = None
+
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
@@ -193,20 +205,20 @@ class DefaultAgent(ConversationEntity):
         self._unsub_clear_slot_list = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_area_slot_list,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_floor_slot_list,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_entity_slot_list,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_clear_entity_slot_list,
                 event_filter=self._filter_state_changes,
             ),
             async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
@@ -805,15 +817,41 @@ class DefaultAgent(ConversationEntity):
 
     @core.callback
     def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
-        # Two subscribers can be scheduled at same time
+        """Clear all slot lists, e.g. when the exposed entities have changed."""
         _LOGGER.debug("Clearing slot lists")
-        if self._unsub_clear_slot_list is None:
-            return
         self._slot_lists = None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
+        self._entity_names = None
+        self._dirty_entity_ids.clear()
+        self._area_names = None
+        self._floor_names = None
+
+    @core.callback
+    def _async_clear_area_slot_list(
+        self, event: core.Event[ar.EventAreaRegistryUpdatedData]
+    ) -> None:
+        """Clear the area slot list when the area registry has changed."""
+        self._slot_lists = None
+        self._area_names = None
+
+    @core.callback
+    def _async_clear_floor_slot_list(
+        self, event: core.Event[fr.EventFloorRegistryUpdatedData]
+    ) -> None:
+        """Clear the floor slot list when the floor registry has changed."""
+        self._slot_lists = None
+        self._floor_names = None
+
+    @core.callback
+    def _async_clear_entity_slot_list(
+        self,
+        event: core.Event[er.EventEntityRegistryUpdatedData]
+        | core.Event[core.EventStateChangedData],
+    ) -> None:
+        """Mark the names of a single entity as changed."""
+        self._slot_lists = None
+        if self._entity_names is None:
+            return
+        self._dirty_entity_ids.add(event.data["entity_id"])
 
     @core.callback
     def _make_slot_lists(self) -> dict[str, SlotList]:
@@ -823,48 +861,97 @@ class DefaultAgent(ConversationEntity):
 
         start = time.monotonic()
 
+        self._slot_lists = {
+            "area": self._make_area_slot_list(),
+            "name": TextSlotList(
+                name=None,
+                values=[
+                    value
+                    for values in self._make_entity_names().values()
+                    for value in values
+                ],
+            ),
+            "floor": self._make_floor_slot_list(),
+        }
+
+        if self._unsub_clear_slot_list is None:
+            self._listen_clear_slot_list()
+
+        _LOGGER.debug(
+            "Created slot lists in %.2f seconds",
+            time.monotonic() - start,
+        )
+
+        return self._slot_lists
+
+    @core.callback
+    def _make_entity_names(self) -> dict[str, list[TextSlotValue]]:
+        """Return the names of exposed entities, only updating changed entities.
+
+        NOTE: We do not pass entity ids in here because multiple entities may
+        have the same name. The intent matcher doesn't gather all matching
+        values for a list, just the first. So we will need to match by name no
+        matter what.
+        """
         entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
 
-        # Gather exposed entity names.
-        #
-        # NOTE: We do not pass entity ids in here because multiple entities may
-        # have the same name. The intent matcher doesn't gather all matching
-        # values for a list, just the first. So we will need to match by name no
-        # matter what.
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
+        if (entity_names := self._entity_names) is None:
+            entity_names = self._entity_names = {}
+            for state in self.hass.states.async_all():
+                if values := self._make_entity_values(entity_registry, state):
+                    entity_names[state.entity_id] = values
+            _LOGGER.debug("Exposed entities: %s", len(entity_names))
+            return entity_names
+
+        for entity_id in self._dirty_entity_ids:
+            # Updated entities keep their position and new entities are added
+            # at the end, like in the state machine
+            if (new_state := self.hass.states.get(entity_id)) and (
+                values := self._make_entity_values(entity_registry, new_state)
+            ):
+                entity_names[entity_id] = values
+            else:
+                entity_names.pop(entity_id, None)
+            _LOGGER.debug("Updated exposed entity: %s", entity_id)
+        self._dirty_entity_ids.clear()
 
-            entity = entity_registry.async_get(state.entity_id)
+        return entity_names
 
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
+    @core.callback
+    def _make_entity_values(
+        self, entity_registry: er.EntityRegistry, state: core.State
+    ) -> list[TextSlotValue]:
+        """Return the slot values for the names/aliases of an exposed entity."""
+        if not async_should_expose(self.hass, DOMAIN, state.entity_id):
+            return []
+
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
+        names: list[tuple[str, str, dict[str, Any]]] = []
+        if (entity := entity_registry.async_get(state.entity_id)) and entity.aliases:
+            for alias in entity.aliases:
+                if not alias.strip():
+                    continue
 
-                    entity_names.append((alias, alias, context))
+                names.append((alias, alias, context))
 
-            # Default name
-            entity_names.append((state.name, state.name, context))
+        # Default name
+        names.append((state.name, state.name, context))
 
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+        return [TextSlotValue.from_tuple(name, allow_template=False) for name in names]
+
+    @core.callback
+    def _make_area_slot_list(self) -> TextSlotList:
+        """Create the slot list with area names/aliases."""
+        if self._area_names is not None:
+            return self._area_names
 
         # Expose all areas.
         areas = ar.async_get(self.hass)
@@ -881,6 +968,15 @@ class DefaultAgent(ConversationEntity):
 
                 area_names.append((alias, alias))
 
+        self._area_names = TextSlotList.from_tuples(area_names, allow_template=False)
+        return self._area_names
+
+    @core.callback
+    def _make_floor_slot_list(self) -> TextSlotList:
+        """Create the slot list with floor names/aliases."""
+        if self._floor_names is not None:
+            return self._floor_names
+
         # Expose all floors.
         floors = fr.async_get(self.hass)
         floor_names = []
@@ -896,20 +992,8 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
-        self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
-        }
-
-        self._listen_clear_slot_list()
-
-        _LOGGER.debug(
-            "Created slot lists in %.2f seconds",
-            time.monotonic() - start,
-        )
-
-        return self._slot_lists
+        self._floor_names = TextSlotList.from_tuples(floor_names, allow_template=False)
+        return self._floor_names
 
     def _make_intent_context(
         self, user_input: ConversationInput
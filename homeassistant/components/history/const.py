@@ -1,7 +1,13 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The historical states of a stream are fetched and sent in chunks
+# of this period to limit the memory used for long periods
+HISTORY_STREAM_CHUNK_TIME = timedelta(days=1)
@@ -38,7 +38,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,6 +57,7 @@ class HistoryLiveStream:
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
+    events_dropped: bool = False
 
 
 @callback
@@ -192,7 +197,7 @@ def _async_send_empty_response(
     connection.send_result(msg_id)
     stream_end_time = end_time or dt_util.utcnow()
     connection.send_message(
-        _generate_websocket_response(msg_id, start_time, stream_end_time, {})
+        _generate_websocket_response(msg_id, start_time, stream_end_time, {}, False)
     )
 
 
@@ -201,13 +206,18 @@ def _generate_websocket_response(
     start_time: dt,
     end_time: dt,
     states: dict[str, list[dict[str, Any]]],
+    compact_states: bool,
 ) -> bytes:
     """Generate a websocket response."""
-    return json_bytes(
-        messages.event_message(
-            msg_id, _generate_stream_message(states, start_time, end_time)
-        )
-    )
+    stream_message = _generate_stream_message(states, start_time, end_time)
+    if compact_states:
+        stream_message[messages.ATTRIBUTE_KEYS] = messages.intern_attribute_keys(states)
+    return json_bytes(messages.event_message(msg_id, stream_message))
+
+
+def _compact_states(connection: ActiveConnection) -> bool:
+    """Return if the connection supports compact states."""
+    return websocket_api.FEATURE_COMPACT_STATES in connection.supported_features
 
 
 def _generate_historical_response(
@@ -221,6 +231,7 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    compact_states: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
     states = cast(
@@ -260,7 +271,9 @@ def _generate_historical_response(
     return (
         last_time_ts,
         last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        _generate_websocket_response(
+            msg_id, start_time, last_time_dt, states, compact_states
+        ),
     )
 
 
@@ -277,24 +290,48 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    Long periods are fetched and sent in chunks of HISTORY_STREAM_CHUNK_TIME.
+    The next chunk is only fetched once the previous one has been written
+    to the client.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    compact_states = _compact_states(connection)
+    last_event_time: dt | None = None
+    chunk_start_time = start_time
+    chunk_end_time = start_time
+    while True:
+        chunk_end_time = min(chunk_end_time + HISTORY_STREAM_CHUNK_TIME, end_time)
+        is_last_chunk = chunk_end_time == end_time
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start_time,
+            chunk_end_time,
+            entity_ids,
+            # Only the first chunk includes the start time state
+            include_start_time_state and chunk_start_time == start_time,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty and is_last_chunk and last_event_time is None,
+            compact_states,
+        )
+        if last_time_ts != 0:
+            last_event_time = last_time_dt
+        if payload:
+            connection.send_message(payload)
+        if is_last_chunk:
+            return last_event_time
+        await connection.async_drain()
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical states
+            return last_event_time
+        # The start of the window is exclusive, start one microsecond
+        # earlier so states at the end of the previous chunk are included
+        chunk_start_time = chunk_end_time - timedelta(microseconds=1)
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -333,6 +370,7 @@ async def _async_events_consumer(
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
+    compact_states = _compact_states(connection)
     while True:
         events: list[Event] = [await stream_queue.get()]
         # If the event is older than the last db
@@ -348,13 +386,13 @@ async def _async_events_consumer(
             events.append(stream_queue.get_nowait())
 
         if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
+            stream_message: dict[str, Any] = {"states": history_states}
+            if compact_states:
+                stream_message[messages.ATTRIBUTE_KEYS] = (
+                    messages.intern_attribute_keys(history_states)
                 )
+            connection.send_message(
+                json_bytes(messages.event_message(msg_id, stream_message))
             )
 
 
@@ -503,6 +541,11 @@ async def ws_stream(
         try:
             stream_queue.put_nowait(event)
         except asyncio.QueueFull:
+            if live_stream.task is None:
+                # Still sending the historical states, the dropped
+                # events are fetched from the database afterwards
+                live_stream.events_dropped = True
+                return
             _LOGGER.debug(
                 "Client exceeded max pending messages of %s",
                 MAX_PENDING_HISTORY_STATES,
@@ -539,6 +582,13 @@ async def ws_stream(
         # Unsubscribe happened while sending historical states
         return
 
+    if live_stream.events_dropped:
+        # The queue overflowed while sending the historical states,
+        # discard it and fetch everything up to now from the database
+        while not stream_queue.empty():
+            stream_queue.get_nowait()
+        subscriptions_setup_complete_time = dt_util.utcnow()
+
     live_stream.task = create_eager_task(
         _async_events_consumer(
             subscriptions_setup_complete_time,
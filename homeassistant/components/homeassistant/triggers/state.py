@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from datetime import timedelta
+from functools import partial
+from itertools import count
 import logging
 
 import voluptuous as vol
@@ -31,9 +34,12 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_STATE_TRIGGER_INDEX: HassKey[StateTriggerIndex] = HassKey("state_trigger_index")
+
 CONF_ENTITY_ID = "entity_id"
 CONF_FROM = "from"
 CONF_TO = "to"
@@ -69,6 +75,121 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+type _StateTriggerListener = tuple[int, Callable[[Event[EventStateChangedData]], None]]
+
+
+class _EntityStateTriggers:
+    """The state triggers of an entity."""
+
+    __slots__ = ("by_to_state", "other", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the triggers."""
+        self.by_to_state: defaultdict[str, list[_StateTriggerListener]] = defaultdict(
+            list
+        )
+        self.other: list[_StateTriggerListener] = []
+        self.unsub: CALLBACK_TYPE | None = None
+
+
+class StateTriggerIndex:
+    """Route the state changes of entities to their state triggers.
+
+    The triggers of an entity share a single state change listener. The
+    triggers waiting for the entity to change to specific states are
+    indexed by those states, so a state change only runs the triggers
+    waiting for the new state and the triggers matching any state.
+    """
+
+    __slots__ = ("_entities", "_hass", "_sequence")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._entities: dict[str, _EntityStateTriggers] = {}
+        # Listeners run in the order they were added
+        self._sequence = count()
+
+    @callback
+    def async_add(
+        self,
+        entity_ids: str | Iterable[str],
+        to_states: Iterable[str] | None,
+        listener: Callable[[Event[EventStateChangedData]], None],
+    ) -> CALLBACK_TYPE:
+        """Add a listener for state changes of entities.
+
+        When to_states is not None, the listener only runs for state
+        changes to one of those states.
+        """
+        item = (next(self._sequence), listener)
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids,)
+        entity_ids = {entity_id.lower() for entity_id in entity_ids}
+        if to_states is not None:
+            to_states = set(to_states)
+        for entity_id in entity_ids:
+            if (triggers := self._entities.get(entity_id)) is None:
+                triggers = self._entities[entity_id] = _EntityStateTriggers()
+                triggers.unsub = async_track_state_change_event(
+                    self._hass, entity_id, partial(self._async_dispatch, triggers)
+                )
+            if to_states is None:
+                triggers.other.append(item)
+            else:
+                for to_state in to_states:
+                    triggers.by_to_state[to_state].append(item)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            for entity_id in entity_ids:
+                triggers = self._entities[entity_id]
+                if to_states is None:
+                    triggers.other.remove(item)
+                else:
+                    for to_state in to_states:
+                        listeners = triggers.by_to_state[to_state]
+                        listeners.remove(item)
+                        if not listeners:
+                            del triggers.by_to_state[to_state]
+                if not triggers.other and not triggers.by_to_state:
+                    del self._entities[entity_id]
+                    assert triggers.unsub is not None
+                    triggers.unsub()
+
+        return async_remove
+
+    @callback
+    def _async_dispatch(
+        self, triggers: _EntityStateTriggers, event: Event[EventStateChangedData]
+    ) -> None:
+        """Run the listeners matching a state change."""
+        listeners = triggers.other
+        if (new_state := event.data["new_state"]) is not None and (
+            matching := triggers.by_to_state.get(new_state.state)
+        ):
+            # Both lists are ordered, the sort merges them
+            listeners = sorted([*listeners, *matching]) if listeners else matching
+        for _, listener in listeners.copy():
+            try:
+                listener(event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching state change of %s to %s",
+                    event.data["entity_id"],
+                    listener,
+                )
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -232,7 +353,14 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Triggers of state changes to specific states are only run for changes
+    # to those states, attribute values are not indexed
+    to_states: Iterable[str] | None = None
+    if attribute is None and to_state and to_state != MATCH_ALL:
+        to_states = [to_state] if isinstance(to_state, str) else to_state
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids, to_states, state_automation_listener
+    )
 
     @callback
     def async_remove() -> None:
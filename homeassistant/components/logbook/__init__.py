@@ -36,6 +36,7 @@ from homeassistant.util.event_type import EventType
 from . import rest_api, websocket_api
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
+    BUILT_IN_EVENTS,
     DOMAIN,
     LOGBOOK_ENTRY_CONTEXT_ID,
     LOGBOOK_ENTRY_DOMAIN,
@@ -44,8 +45,9 @@ from .const import (  # noqa: F401
     LOGBOOK_ENTRY_MESSAGE,
     LOGBOOK_ENTRY_NAME,
     LOGBOOK_ENTRY_SOURCE,
+    MAX_RECENT_CONTEXTS,
 )
-from .models import LazyEventPartialState, LogbookConfig
+from .models import LazyEventPartialState, LogbookConfig, RecentContexts
 
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
@@ -137,7 +139,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    # Only the events logbook describes are indexed, they are the contexts
+    # shown for the rows. Indexing every state change would evict them
+    # within seconds on a busy system.
+    recent_contexts = RecentContexts(MAX_RECENT_CONTEXTS)
+    for event_type in BUILT_IN_EVENTS:
+        hass.bus.async_listen(event_type, recent_contexts.async_add)
+    hass.data[DOMAIN] = LogbookConfig(
+        external_events, filters, entities_filter, recent_contexts
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -160,6 +170,11 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
         describe_callback: Callable[[LazyEventPartialState], dict[str, Any]],
     ) -> None:
         """Teach logbook how to describe a new event."""
+        if (
+            event_name not in external_events
+            and (recent_contexts := logbook_config.recent_contexts) is not None
+        ):
+            hass.bus.async_listen(event_name, recent_contexts.async_add)
         external_events[event_name] = (domain, describe_callback)
 
     platform.async_describe_events(hass, _async_describe_event)
@@ -22,6 +22,9 @@ ATTR_MESSAGE = "message"
 
 DOMAIN = "logbook"
 
+# Maximum number of recent contexts kept in memory to augment the rows
+MAX_RECENT_CONTEXTS = 2048
+
 CONTEXT_USER_ID = "context_user_id"
 CONTEXT_ENTITY_ID = "context_entity_id"
 CONTEXT_ENTITY_ID_NAME = "context_entity_id_name"
@@ -33,6 +33,44 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    recent_contexts: RecentContexts | None = None
+
+
+class RecentContexts:
+    """Index the events which originated the recent contexts.
+
+    The index is fed from the bus with the events logbook describes so
+    the context of a row can be looked up without querying the database.
+    The index is bounded, the oldest contexts are dropped first.
+
+    Events are added from the event loop and looked up from the
+    event loop and the threads running logbook queries.
+    """
+
+    __slots__ = ("_max_size", "_origin_events")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the index."""
+        self._max_size = max_size
+        self._origin_events: dict[str, Event] = {}
+
+    @callback
+    def async_add(self, event: Event) -> None:
+        """Add an event if it originated its context."""
+        if (context := event.context).origin_event is not event:
+            return
+        origin_events = self._origin_events
+        origin_events[context.id] = event
+        if len(origin_events) > self._max_size:
+            del origin_events[next(iter(origin_events))]
+
+    def get(self, context_id_bin: bytes) -> EventAsRow | None:
+        """Return the row of the event which originated a context."""
+        if (context_id := bytes_to_ulid_or_none(context_id_bin)) is None or (
+            event := self._origin_events.get(context_id)
+        ) is None:
+            return None
+        return async_event_to_row(event)
 
 
 class LazyEventPartialState:
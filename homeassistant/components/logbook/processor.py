@@ -77,6 +77,7 @@ from .models import (
     EventAsRow,
     LazyEventPartialState,
     LogbookConfig,
+    RecentContexts,
     async_event_to_row,
 )
 from .queries import statement_for_request
@@ -99,6 +100,7 @@ class LogbookRun:
     include_entity_name: bool
     timestamp: bool
     memoize_new_contexts: bool = True
+    recent_contexts: RecentContexts | None = None
 
 
 class EventProcessor:
@@ -133,6 +135,7 @@ class EventProcessor:
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
+            recent_contexts=logbook_config.recent_contexts,
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
 
@@ -320,15 +323,21 @@ class ContextAugmenter:
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
         self.include_entity_name = logbook_run.include_entity_name
+        self.recent_contexts = logbook_run.recent_contexts
 
     def get_context(
         self, context_id_bin: bytes | None, row: Row | EventAsRow | None
     ) -> Row | EventAsRow | None:
         """Get the context row from the id or row context."""
-        if context_id_bin is not None and (
-            context_row := self.context_lookup.get(context_id_bin)
-        ):
-            return context_row
+        if context_id_bin is not None:
+            if context_row := self.context_lookup.get(context_id_bin):
+                return context_row
+            # Contexts which are not part of the query results, and all
+            # the contexts once streaming live, are found in memory
+            if (recent_contexts := self.recent_contexts) is not None and (
+                context_row := recent_contexts.get(context_id_bin)
+            ):
+                return context_row
         if (
             type(row) is EventAsRow
             and (context := row[CONTEXT_POS]) is not None
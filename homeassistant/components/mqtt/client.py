@@ -7,7 +7,7 @@ from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any
 import uuid
 
 import certifi
+from lru import LRU
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -83,6 +84,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -117,6 +119,9 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# The number of received topics of which the matching subscriptions are cached
+MATCH_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -267,7 +272,6 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -377,6 +381,8 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_trie: TopicTrie[Subscription] = TopicTrie()
+        self._match_cache: LRU[str, list[Subscription]] = LRU(MATCH_CACHE_SIZE)
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -435,6 +441,22 @@ class MQTT:
             *self._wildcard_subscriptions,
         }
 
+    @callback
+    def async_get_subscription_stats(self) -> dict[str, int]:
+        """Return statistics of the subscriptions and the topic match cache."""
+        hits, misses = self._match_cache.get_stats()
+        return {
+            "simple_subscriptions": sum(
+                len(subscriptions)
+                for subscriptions in self._simple_subscriptions.values()
+            ),
+            "wildcard_subscriptions": len(self._wildcard_subscriptions),
+            "match_cache_size": len(self._match_cache),
+            "match_cache_max_size": self._match_cache.get_size(),
+            "match_cache_hits": hits,
+            "match_cache_misses": misses,
+        }
+
     def cleanup(self) -> None:
         """Clean up listeners."""
         while self._cleanup_on_unload:
@@ -741,28 +763,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_trie.add(subscription.topic, subscription)
+        self._async_invalidate_matches(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -773,8 +792,27 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_trie.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
+        self._async_invalidate_matches(subscription)
+
+    @callback
+    def _async_invalidate_matches(self, subscription: Subscription) -> None:
+        """Remove the cached matches of the topics a subscription matches."""
+        match_cache = self._match_cache
+        if not match_cache:
+            return
+        if subscription.is_simple_match:
+            if subscription.topic in match_cache:
+                del match_cache[subscription.topic]
+            return
+        matcher: TopicTrie[Subscription] = TopicTrie()
+        matcher.add(subscription.topic, subscription)
+        # LRU is not iterable, keys() returns a copy of the keys
+        for topic in match_cache.keys():  # noqa: SIM118
+            if matcher.match(topic):
+                del match_cache[topic]
 
     @callback
     def _async_queue_subscriptions(
@@ -835,11 +873,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -851,7 +887,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1044,18 +1079,15 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        if (subscriptions := self._match_cache.get(topic)) is not None:
+            return subscriptions
+        subscriptions = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_trie.match(topic))
+        self._match_cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -1247,13 +1279,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
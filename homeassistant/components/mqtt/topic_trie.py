@@ -0,0 +1,97 @@
+"""Match MQTT topics against topic filters with wildcards."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+
+class _TopicNode[_T]:
+    """A level of the topic filters in the trie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode[_T]] = {}
+        self.values: set[_T] = set()
+
+
+class TopicTrie[_T]:
+    """Store values by topic filter and find the values matching a topic.
+
+    The topic filters are split in levels and stored level by level, so
+    matching a topic only walks the levels of the topic and the single
+    level wildcards on the way, instead of testing every topic filter.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicNode[_T] = _TopicNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return self._size
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        if value not in node.values:
+            node.values.add(value)
+            self._size += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path: list[tuple[_TopicNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        self._size -= 1
+        # Prune the levels which are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the topic filters matching a topic."""
+        matches: list[_T] = []
+        for node in _iter_match(
+            self._root, topic.split("/"), 0, not topic.startswith("$")
+        ):
+            matches.extend(node.values)
+        return matches
+
+
+def _iter_match[_T](
+    node: _TopicNode[_T], levels: list[str], index: int, normal: bool
+) -> Iterator[_TopicNode[_T]]:
+    """Yield the nodes of the topic filters matching the topic levels.
+
+    Wildcards do not match the first level of topics starting with $.
+    """
+    children = node.children
+    if index == len(levels):
+        if node.values:
+            yield node
+    else:
+        if (child := children.get(levels[index])) is not None:
+            yield from _iter_match(child, levels, index + 1, normal)
+        if (child := children.get("+")) is not None and (normal or index):
+            yield from _iter_match(child, levels, index + 1, normal)
+    # A multi level wildcard also matches its parent level
+    if (child := children.get("#")) is not None and (normal or index):
+        if child.values:
+            yield child
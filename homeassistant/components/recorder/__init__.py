@@ -61,6 +61,9 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_HISTORY_CACHE_SIZE = "history_cache_size"
+CONF_ACCUMULATE_STATISTICS_STATES = "accumulate_statistics_states"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -104,6 +107,11 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_HISTORY_CACHE_SIZE, default=0): cv.positive_int,
+                    vol.Optional(
+                        CONF_ACCUMULATE_STATISTICS_STATES, default=False
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -163,6 +171,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert=conf[CONF_BULK_INSERT],
+        history_cache_size=conf[CONF_HISTORY_CACHE_SIZE],
+        accumulate_statistics_states=conf[CONF_ACCUMULATE_STATISTICS_STATES],
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -0,0 +1,283 @@
+"""Bulk insert of states rows for the recorder."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any, cast
+
+from sqlalchemy import Table, insert, select, text, update
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from .const import SupportedDialect
+from .db_schema import StateAttributes, States, StatesMeta
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+_LOGGER = logging.getLogger(__name__)
+
+_STATES_TABLE = cast(Table, States.__table__)
+
+# Number of rows written with one multi-row INSERT on MySQL, stays well
+# below the limit of 65535 bind parameters per statement
+_MYSQL_ROWS_PER_INSERT = 1000
+
+
+@dataclass(slots=True)
+class PendingStatesRow:
+    """A states row waiting to be written with a bulk insert.
+
+    The attributes mirror the columns and relationships of the States
+    model that are used while processing a state_changed event so a
+    PendingStatesRow can be used in place of a States object.
+    """
+
+    state: str | None
+    entity_id: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    last_reported_ts: float | None
+    origin_idx: int
+    context_id_bin: bytes | None
+    context_user_id_bin: bytes | None
+    context_parent_id_bin: bytes | None
+    attributes: str | None = None
+    attributes_id: int | None = None
+    state_attributes: StateAttributes | None = None
+    metadata_id: int | None = None
+    states_meta_rel: StatesMeta | None = None
+    old_state_id: int | None = None
+    old_state: PendingStatesRow | None = None
+    state_id: int | None = None
+
+    @classmethod
+    def from_event(cls, event: Event[EventStateChangedData]) -> PendingStatesRow:
+        """Create a row from a state_changed event."""
+        state_value, last_updated_ts, last_changed_ts, last_reported_ts = (
+            States.state_and_timestamps_from_event(event)
+        )
+        context = event.context
+        return cls(
+            state_value,
+            event.data["entity_id"],
+            last_updated_ts,
+            last_changed_ts,
+            last_reported_ts,
+            event.origin.idx,
+            ulid_to_bytes_or_none(context.id),
+            uuid_hex_to_bytes_or_none(context.user_id),
+            ulid_to_bytes_or_none(context.parent_id),
+        )
+
+    def as_params(self) -> dict[str, Any]:
+        """Return the row as insert parameters.
+
+        The foreign keys of pending relationships must already be
+        assigned by flushing the session.
+        """
+        metadata_id = self.metadata_id
+        if (states_meta := self.states_meta_rel) is not None:
+            metadata_id = states_meta.metadata_id
+        attributes_id = self.attributes_id
+        if (state_attributes := self.state_attributes) is not None:
+            attributes_id = state_attributes.attributes_id
+        old_state_id = self.old_state_id
+        if (old_state := self.old_state) is not None:
+            old_state_id = old_state.state_id
+        return {
+            "entity_id": self.entity_id,
+            "state": self.state,
+            "attributes": self.attributes,
+            "last_updated_ts": self.last_updated_ts,
+            "last_changed_ts": self.last_changed_ts,
+            "last_reported_ts": self.last_reported_ts,
+            "old_state_id": old_state_id,
+            "attributes_id": attributes_id,
+            "origin_idx": self.origin_idx,
+            "context_id_bin": self.context_id_bin,
+            "context_user_id_bin": self.context_user_id_bin,
+            "context_parent_id_bin": self.context_parent_id_bin,
+            "metadata_id": metadata_id,
+        }
+
+
+class BulkStatesWriter:
+    """Write pending states rows in bulk.
+
+    Instead of adding a States object to the session for every
+    state_changed event, the rows are collected and written with one
+    executemany INSERT when the session is committed. Rows whose old
+    state was written in the same INSERT are linked to it afterwards
+    with one executemany UPDATE.
+
+    MySQL and MariaDB cannot return the ids of an executemany, the rows
+    are written with multi-row INSERTs instead and the ids are assigned
+    from the id of the first row of each INSERT after verifying them.
+    Other databases that cannot return the ids insert the rows one at a
+    time.
+    """
+
+    __slots__ = ("_auto_increment_increment", "_multi_row_insert", "_rows")
+
+    def __init__(self) -> None:
+        """Initialize the bulk states writer."""
+        self._rows: list[PendingStatesRow] = []
+        self._auto_increment_increment: int | None = None
+        # Cleared if the ids of a multi-row INSERT could not be verified
+        self._multi_row_insert = True
+
+    def add(self, row: PendingStatesRow) -> None:
+        """Add a row to be written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._rows.append(row)
+
+    def write(self, session: Session) -> None:
+        """Insert the pending rows in the session transaction.
+
+        The rows are kept until post_commit so the write can be
+        retried if the commit fails.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._rows:
+            return
+        rows = self._rows_with_old_states()
+        for row in rows:
+            # The row may have been assigned a state_id by an
+            # earlier attempt that was rolled back
+            row.state_id = None
+        # Assign ids to the pending StatesMeta and StateAttributes
+        session.flush()
+        params = [row.as_params() for row in rows]
+        dialect = session.get_bind().dialect
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            result = session.execute(
+                insert(_STATES_TABLE).returning(
+                    _STATES_TABLE.c.state_id, sort_by_parameter_order=True
+                ),
+                params,
+            )
+            for row, state_id in zip(rows, result.scalars(), strict=True):
+                row.state_id = state_id
+        elif dialect.name == SupportedDialect.MYSQL and self._multi_row_insert:
+            self._write_multi_row(session, rows, params)
+        else:
+            self._write_row_by_row(session, rows, params)
+        if old_state_links := [
+            {"state_id": row.state_id, "old_state_id": old_state.state_id}
+            for row in rows
+            if (old_state := row.old_state) is not None
+        ]:
+            with session.no_autoflush:
+                session.execute(update(States), old_state_links)
+
+    def _write_multi_row(
+        self,
+        session: Session,
+        rows: list[PendingStatesRow],
+        params: list[dict[str, Any]],
+    ) -> None:
+        """Insert the rows with multi-row INSERTs and assign their ids.
+
+        The ids of the rows of a multi-row INSERT are expected to be
+        consecutive, spaced by auto_increment_increment, starting at the
+        last inserted id, which is the id of the first row. The expected
+        ids are read back after each INSERT and if they do not match the
+        inserted rows, the INSERT is rolled back and the remaining rows
+        are inserted one at a time.
+        """
+        if (increment := self._auto_increment_increment) is None:
+            increment = self._auto_increment_increment = session.execute(
+                text("SELECT @@auto_increment_increment")
+            ).scalar_one()
+        for start in range(0, len(rows), _MYSQL_ROWS_PER_INSERT):
+            end = start + _MYSQL_ROWS_PER_INSERT
+            chunk_params = params[start:end]
+            savepoint = session.begin_nested()
+            result = session.execute(insert(_STATES_TABLE).values(chunk_params))
+            first_state_id = result.lastrowid
+            state_ids = [
+                first_state_id + offset * increment
+                for offset in range(len(chunk_params))
+            ]
+            if result.rowcount == len(chunk_params) and _inserted_rows_match(
+                session, state_ids, chunk_params
+            ):
+                savepoint.commit()
+                for row, state_id in zip(rows[start:end], state_ids, strict=True):
+                    row.state_id = state_id
+                continue
+            savepoint.rollback()
+            _LOGGER.warning(
+                "The ids assigned by a multi-row INSERT of states are not"
+                " consecutive, inserting states one at a time instead"
+            )
+            self._multi_row_insert = False
+            self._write_row_by_row(session, rows[start:], params[start:])
+            return
+
+    def _write_row_by_row(
+        self,
+        session: Session,
+        rows: list[PendingStatesRow],
+        params: list[dict[str, Any]],
+    ) -> None:
+        """Insert the rows one at a time and assign their ids."""
+        stmt = insert(_STATES_TABLE)
+        for row, row_params in zip(rows, params, strict=True):
+            row.state_id = session.execute(stmt, row_params).inserted_primary_key[0]
+
+    def _rows_with_old_states(self) -> list[PendingStatesRow]:
+        """Return the pending rows and any old states that were not added.
+
+        An old state is not added when it has no attributes, it is
+        written anyway as it would be cascaded by the ORM.
+        """
+        rows = self._rows
+        seen = {id(row) for row in rows}
+        missing: list[PendingStatesRow] = []
+        for row in rows:
+            old_state = row.old_state
+            while old_state is not None and id(old_state) not in seen:
+                seen.add(id(old_state))
+                missing.append(old_state)
+                old_state = old_state.old_state
+        return [*missing, *rows] if missing else rows
+
+    def post_commit(self) -> None:
+        """Call after commit to drop the written rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._rows.clear()
+
+    def reset(self) -> None:
+        """Reset after the session has been closed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._rows.clear()
+        self._auto_increment_increment = None
+        self._multi_row_insert = True
+
+
+def _inserted_rows_match(
+    session: Session, state_ids: list[int], params: list[dict[str, Any]]
+) -> bool:
+    """Return if the rows with the given ids are the rows of params, in order."""
+    inserted = session.execute(
+        select(States.state_id, States.metadata_id, States.last_updated_ts)
+        .where(States.state_id.between(state_ids[0], state_ids[-1]))
+        .order_by(States.state_id)
+    ).all()
+    return [tuple(row) for row in inserted] == [
+        (state_id, row_params["metadata_id"], row_params["last_updated_ts"])
+        for state_id, row_params in zip(state_ids, params, strict=True)
+    ]
@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BulkStatesWriter, PendingStatesRow
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -84,10 +85,13 @@ from .migration import (
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupMigration,
+    StatisticsRollupRebuildTask,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .recent_states import RecentState, RecentStatesCache
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -173,6 +177,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert: bool = False,
+        history_cache_size: int = 0,
+        accumulate_statistics_states: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -208,6 +215,19 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        # When enabled, states rows are written with a single executemany
+        # INSERT per commit instead of through the ORM unit of work.
+        self.bulk_insert = bulk_insert
+        # When enabled, the recently recorded states are kept in memory, up
+        # to history_cache_size MiB, to answer history queries.
+        self.recent_states_cache: RecentStatesCache | None = (
+            RecentStatesCache(history_cache_size * 1024 * 1024)
+            if history_cache_size
+            else None
+        )
+        # When enabled, platforms compiling statistics may keep the states of
+        # the current period in memory instead of querying them back.
+        self.accumulate_statistics_states = accumulate_statistics_states
 
         self.schema_version = 0
         self._commits_without_expire = 0
@@ -215,6 +235,7 @@ class Recorder(threading.Thread):
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self.bulk_states_writer = BulkStatesWriter()
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -227,6 +248,8 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        # Set once the statistics rollups have been compiled
+        self.use_statistics_rollups = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -278,6 +301,16 @@ class Recorder(threading.Thread):
         """Add a task to the recorder queue."""
         self._queue.put(task)
 
+    def queue_statistics_rollups_rebuild(self) -> None:
+        """Rebuild the statistics rollups.
+
+        The hourly statistics are reduced when fetching daily, weekly and
+        monthly statistics until the rollups have been compiled again.
+        """
+        if self.use_statistics_rollups:
+            self.use_statistics_rollups = False
+            self.queue_task(StatisticsRollupRebuildTask())
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -812,6 +845,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -1088,23 +1122,36 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate: States | PendingStatesRow
+        if self.bulk_insert:
+            dbstate = PendingStatesRow.from_event(event)
+        else:
+            dbstate = States.from_event(event)
         old_state = event.data["old_state"]
 
         assert self.event_session is not None
         session = self.event_session
 
         states_manager = self.states_manager
+        recent_states_cache = self.recent_states_cache
         if pending_state := states_manager.pop_pending(entity_id):
             dbstate.old_state = pending_state
             if old_state:
                 pending_state.last_reported_ts = old_state.last_reported_timestamp
+                if recent_states_cache is not None:
+                    recent_states_cache.update_last_reported(
+                        entity_id, old_state.last_reported_timestamp
+                    )
         elif old_state_id := states_manager.pop_committed(entity_id):
             dbstate.old_state_id = old_state_id
             if old_state:
                 states_manager.update_pending_last_reported(
                     old_state_id, old_state.last_reported_timestamp
                 )
+                if recent_states_cache is not None:
+                    recent_states_cache.update_last_reported(
+                        entity_id, old_state.last_reported_timestamp
+                    )
         if entity_removed:
             dbstate.state = None
         else:
@@ -1160,7 +1207,23 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if type(dbstate) is PendingStatesRow:
+            self._event_session_has_pending_writes = True
+            self.bulk_states_writer.add(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
+
+        if recent_states_cache is not None:
+            recent_states_cache.add(
+                entity_id,
+                RecentState(
+                    dbstate.state,
+                    dbstate.last_updated_ts,  # type: ignore[arg-type]
+                    dbstate.last_changed_ts,
+                    dbstate.last_reported_ts,
+                    shared_attrs,
+                ),
+            )
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1223,6 +1286,7 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        self.bulk_states_writer.write(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1231,6 +1295,7 @@ class Recorder(threading.Thread):
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        self.bulk_states_writer.post_commit()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1258,6 +1323,10 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        if self.recent_states_cache is not None:
+            # The states that were not committed are lost
+            self.recent_states_cache.clear()
+        self.bulk_states_writer.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 48
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -94,6 +94,7 @@ TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 TABLE_MIGRATION_CHANGES = "migration_changes"
+TABLE_STATISTICS_ROLLUP = "statistics_rollup"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -116,6 +117,7 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_ROLLUP,
 ]
 
 TABLES_TO_CHECK = [
@@ -497,26 +499,36 @@ class States(Base):
         return date_time.isoformat(sep=" ", timespec="seconds")
 
     @staticmethod
-    def from_event(event: Event[EventStateChangedData]) -> States:
-        """Create object from a state_changed event."""
+    def state_and_timestamps_from_event(
+        event: Event[EventStateChangedData],
+    ) -> tuple[str, float, float | None, float | None]:
+        """Return the state, last_updated, last_changed and last_reported.
+
+        The last_changed and last_reported timestamps are None when they
+        are the same as last_updated.
+        """
         state = event.data["new_state"]
         # None state means the state was removed from the state machine
         if state is None:
-            state_value = ""
-            last_updated_ts = event.time_fired_timestamp
-            last_changed_ts = None
-            last_reported_ts = None
-        else:
-            state_value = state.state
-            last_updated_ts = state.last_updated_timestamp
-            if state.last_updated == state.last_changed:
-                last_changed_ts = None
-            else:
-                last_changed_ts = state.last_changed_timestamp
-            if state.last_updated == state.last_reported:
-                last_reported_ts = None
-            else:
-                last_reported_ts = state.last_reported_timestamp
+            return ("", event.time_fired_timestamp, None, None)
+        last_updated = state.last_updated
+        return (
+            state.state,
+            state.last_updated_timestamp,
+            None
+            if last_updated == state.last_changed
+            else state.last_changed_timestamp,
+            None
+            if last_updated == state.last_reported
+            else state.last_reported_timestamp,
+        )
+
+    @staticmethod
+    def from_event(event: Event[EventStateChangedData]) -> States:
+        """Create object from a state_changed event."""
+        state_value, last_updated_ts, last_changed_ts, last_reported_ts = (
+            States.state_and_timestamps_from_event(event)
+        )
         context = event.context
         return States(
             state=state_value,
@@ -789,6 +801,46 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class StatisticsRollup(Base):
+    """Long term statistics reduced to days, weeks and months.
+
+    The rows are maintained from the hourly statistics, the period
+    boundaries are in the configured time zone.
+    """
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity and period
+        Index(
+            "ix_statistics_rollup_statistic_id_period_start_ts",
+            "metadata_id",
+            "period",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_ROLLUP
+
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    period: Mapped[int] = mapped_column(SmallInteger)
+    start_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    end_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    mean: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    # Number of hourly means and start of the last hourly statistic in the
+    # period, used to fold newly compiled hours into the rollup
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+    last_start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
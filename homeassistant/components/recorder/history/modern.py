@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby
 from operator import itemgetter
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from sqlalchemy import (
     CompoundSelect,
@@ -37,6 +37,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..recent_states import RecentState
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -52,6 +53,75 @@ _FIELD_MAP = {
 }
 
 
+class _RecentStateRow(NamedTuple):
+    """A cached state in the shape of a row of the history queries.
+
+    The columns which are not selected by a query are None.
+    """
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    last_reported_ts: float | None
+    attributes: str | None
+
+
+def _recent_states_to_rows(
+    recent_states: list[RecentState],
+    metadata_id: int,
+    start_time_ts: float,
+    end_time_ts: float | None,
+    include_start_time_state: bool,
+    state_changes_only: bool,
+    no_attributes: bool,
+    include_last_changed: bool,
+    include_last_reported: bool,
+) -> list[_RecentStateRow]:
+    """Convert cached states to the rows the history queries would return.
+
+    The cached states must cover start_time if include_start_time_state
+    is set, the state at start_time is then returned like the start time
+    state queries do.
+    """
+    start_state: RecentState | None = None
+    rows: list[_RecentStateRow] = []
+    for recent_state in recent_states:
+        last_updated_ts = recent_state.last_updated_ts
+        if last_updated_ts < start_time_ts:
+            start_state = recent_state
+            continue
+        if end_time_ts and last_updated_ts >= end_time_ts:
+            break
+        if last_updated_ts == start_time_ts or (
+            state_changes_only and not recent_state.state_changed
+        ):
+            continue
+        rows.append(
+            _RecentStateRow(
+                metadata_id,
+                recent_state.state,
+                last_updated_ts,
+                recent_state.last_changed_ts if include_last_changed else None,
+                recent_state.last_reported_ts if include_last_reported else None,
+                None if no_attributes else recent_state.attributes,
+            )
+        )
+    if include_start_time_state and start_state is not None:
+        rows.insert(
+            0,
+            _RecentStateRow(
+                metadata_id,
+                start_state.state,
+                0,
+                0 if include_last_changed else None,
+                0 if include_last_reported else None,
+                None if no_attributes else start_state.attributes,
+            ),
+        )
+    return rows
+
+
 def _stmt_and_join_attributes(
     no_attributes: bool,
     include_last_changed: bool,
@@ -239,13 +309,6 @@ def get_significant_states_with_session(
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
         return {}
     metadata_ids = possible_metadata_ids
-    if significant_changes_only:
-        metadata_ids_in_significant_domains = [
-            metadata_id
-            for entity_id, metadata_id in entity_id_to_metadata_id.items()
-            if metadata_id is not None
-            and split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
-        ]
     run_start_ts: float | None = None
     if include_start_time_state and not (
         run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
@@ -253,6 +316,51 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    recent_rows: list[_RecentStateRow] = []
+    if (recent_states_cache := instance.recent_states_cache) is not None:
+        # Use the cached states of the entities which are cached
+        # since before start_time and query the others
+        metadata_ids = []
+        for entity_id, metadata_id in entity_id_to_metadata_id.items():
+            if metadata_id is None:
+                continue
+            if (recent_states := recent_states_cache.get(entity_id)) and recent_states[
+                0
+            ].last_updated_ts < start_time_ts:
+                recent_rows.extend(
+                    _recent_states_to_rows(
+                        recent_states,
+                        metadata_id,
+                        start_time_ts,
+                        end_time_ts,
+                        include_start_time_state,
+                        significant_changes_only
+                        and split_entity_id(entity_id)[0] not in SIGNIFICANT_DOMAINS,
+                        no_attributes,
+                        not significant_changes_only,
+                        False,
+                    )
+                )
+            else:
+                metadata_ids.append(metadata_id)
+        if not metadata_ids:
+            return _sorted_states_to_dict(
+                cast(list[Row], recent_rows),
+                start_time_ts if include_start_time_state else None,
+                entity_ids,
+                entity_id_to_metadata_id,
+                minimal_response,
+                compressed_state_format,
+                no_attributes=no_attributes,
+            )
+    if significant_changes_only:
+        query_metadata_ids = set(metadata_ids)
+        metadata_ids_in_significant_domains = [
+            metadata_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id in query_metadata_ids
+            and split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+        ]
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -275,8 +383,13 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    states: Iterable[Row] = execute_stmt_lambda_element(
+        session, stmt, None, end_time, orm_rows=False
+    )
+    if recent_rows:
+        states = chain(states, cast(list[Row], recent_rows))
     return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        states,
         start_time_ts if include_start_time_state else None,
         entity_ids,
         entity_id_to_metadata_id,
@@ -418,6 +531,43 @@ def state_changes_during_period(
             include_start_time_state = False
         start_time_ts = dt_util.utc_to_timestamp(start_time)
         end_time_ts = datetime_to_timestamp_or_none(end_time)
+        recent_rows: list[_RecentStateRow] = []
+        if (
+            (recent_states_cache := instance.recent_states_cache) is not None
+            and (recent_states := recent_states_cache.get(entity_id))
+            and (
+                (covered_since_ts := recent_states[0].last_updated_ts) < start_time_ts
+                or (not limit and (not end_time_ts or covered_since_ts < end_time_ts))
+            )
+        ):
+            recent_rows = _recent_states_to_rows(
+                recent_states,
+                single_metadata_id,
+                start_time_ts,
+                end_time_ts,
+                include_start_time_state,
+                True,
+                no_attributes,
+                False,
+                has_last_reported,
+            )
+            if limit:
+                recent_rows = recent_rows[: limit + include_start_time_state]
+            if covered_since_ts < start_time_ts:
+                return cast(
+                    dict[str, list[State]],
+                    _sorted_states_to_dict(
+                        cast(list[Row], recent_rows),
+                        start_time_ts if include_start_time_state else None,
+                        entity_ids,
+                        entity_id_to_metadata_id,
+                        descending=descending,
+                        no_attributes=no_attributes,
+                    ),
+                )
+            # Only query the states from before the cached states
+            end_time_ts = covered_since_ts
+            end_time = dt_util.utc_from_timestamp(covered_since_ts)
         stmt = lambda_stmt(
             lambda: _state_changed_during_period_stmt(
                 start_time_ts,
@@ -437,12 +587,15 @@ def state_changes_during_period(
                 has_last_reported,
             ],
         )
+        states: Iterable[Row] = execute_stmt_lambda_element(
+            session, stmt, None, end_time, orm_rows=False
+        )
+        if recent_rows:
+            states = chain(states, cast(list[Row], recent_rows))
         return cast(
             dict[str, list[State]],
             _sorted_states_to_dict(
-                execute_stmt_lambda_element(
-                    session, stmt, None, end_time, orm_rows=False
-                ),
+                states,
                 start_time_ts if include_start_time_state else None,
                 entity_ids,
                 entity_id_to_metadata_id,
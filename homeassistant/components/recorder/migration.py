@@ -53,6 +53,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUP_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -76,6 +77,7 @@ from .db_schema import (
     StatesMeta,
     Statistics,
     StatisticsMeta,
+    StatisticsRollup,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -85,6 +87,8 @@ from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
     delete_duplicate_statistics_row,
+    delete_migration_changes,
+    delete_statistics_rollups,
     find_entity_ids_to_migrate,
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
@@ -95,11 +99,16 @@ from .queries import (
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
+    has_statistics,
     has_used_states_event_ids,
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    compile_statistics_rollups_month,
+    get_start_time,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -1758,6 +1767,14 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # We need to cast __table__ to Table, explanation in
+        # https://github.com/sqlalchemy/sqlalchemy/issues/9130
+        cast(Table, StatisticsRollup.__table__).create(self.engine, checkfirst=True)
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2645,6 +2662,60 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return DataMigrationStatus(needs_migrate=False, migration_done=True)
 
 
+class StatisticsRollupMigration(BaseRunTimeMigration):
+    """Migration to compile the statistics rollups from the hourly statistics."""
+
+    required_schema_version = STATISTICS_ROLLUP_SCHEMA_VERSION
+    migration_id = "statistics_rollup"
+
+    def __init__(self, schema_version: int, migration_changes: dict[str, int]) -> None:
+        """Initialize a new StatisticsRollupMigration."""
+        super().__init__(schema_version, migration_changes)
+        self._next_start_ts: float | None = None
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Compile the rollups of one month, return True if completed."""
+        _LOGGER.debug("Compiling statistics rollups from %s", self._next_start_ts)
+        with session_scope(session=instance.get_session()) as session:
+            self._next_start_ts = compile_statistics_rollups_month(
+                session, self._next_start_ts
+            )
+        is_done = self._next_start_ts is None
+        _LOGGER.debug("Compiling statistics rollups: done=%s", is_done)
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Will be called after migrate returns True or if migration is not needed."""
+        instance.use_statistics_rollups = True
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        needs_migrate = bool(execute_stmt_lambda_element(session, has_statistics()))
+        return DataMigrationStatus(
+            needs_migrate=needs_migrate, migration_done=not needs_migrate
+        )
+
+
+@dataclass(slots=True)
+class StatisticsRollupRebuildTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild the statistics rollups."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollup rebuild task."""
+        with session_scope(session=instance.get_session()) as session:
+            session.execute(delete_statistics_rollups())
+            session.execute(
+                delete_migration_changes(StatisticsRollupMigration.migration_id)
+            )
+        instance.queue_task(
+            StatisticsRollupMigration.task(
+                StatisticsRollupMigration(SCHEMA_VERSION, {})
+            )
+        )
+
+
 @dataclass(slots=True)
 class EntityIDPostMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to cleanup after entity_ids migration."""
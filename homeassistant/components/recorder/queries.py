@@ -19,6 +19,7 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsRollup,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -820,6 +821,25 @@ def get_migration_changes() -> StatementLambdaElement:
     )
 
 
+def delete_migration_changes(migration_id: str) -> StatementLambdaElement:
+    """Delete the migration changes of a migration."""
+    return lambda_stmt(
+        lambda: delete(MigrationChanges).where(
+            MigrationChanges.migration_id == migration_id
+        )
+    )
+
+
+def has_statistics() -> StatementLambdaElement:
+    """Check if there are hourly statistics."""
+    return lambda_stmt(lambda: select(Statistics.id).limit(1))
+
+
+def delete_statistics_rollups() -> StatementLambdaElement:
+    """Delete all statistics rollups."""
+    return lambda_stmt(lambda: delete(StatisticsRollup))
+
+
 def find_event_types_to_purge() -> StatementLambdaElement:
     """Find event_type_ids to purge."""
     return lambda_stmt(
@@ -0,0 +1,146 @@
+"""Cache of the states recently recorded for history queries."""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+import threading
+
+# Approximate memory used by a cached state in addition to its strings
+_STATE_OVERHEAD = 200
+
+
+@dataclass(slots=True)
+class RecentState:
+    """A state recorded for an entity.
+
+    The timestamps have the same meaning as the columns of the
+    States table.
+    """
+
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    last_reported_ts: float | None
+    attributes: str
+    size: int = field(default=0, compare=False)
+
+    @property
+    def state_changed(self) -> bool:
+        """Return if the state changed and not only the attributes."""
+        return (
+            self.last_changed_ts is None or self.last_changed_ts == self.last_updated_ts
+        )
+
+
+class RecentStatesCache:
+    """Keep the recently recorded states of entities in memory.
+
+    The states of every entity are kept in the order they were recorded,
+    the cached states of an entity are all the states recorded for it
+    since its oldest cached state. When the memory budget is exceeded,
+    the oldest states of the least recently queried entities are evicted.
+
+    States are added from the recorder thread and read from the
+    threads running history queries.
+    """
+
+    __slots__ = ("_entities", "_lock", "_max_size", "_size")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache with a memory budget in bytes."""
+        self._max_size = max_size
+        self._size = 0
+        self._entities: OrderedDict[str, deque[RecentState]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, entity_id: str, recent_state: RecentState) -> None:
+        """Add a recorded state of an entity.
+
+        This call must be called from the recorder thread.
+        """
+        size = _STATE_OVERHEAD + len(recent_state.state or "")
+        with self._lock:
+            if (states := self._entities.get(entity_id)) is None:
+                states = self._entities[entity_id] = deque()
+            elif states[-1].attributes == recent_state.attributes:
+                # Share the attributes with the previous state
+                recent_state.attributes = states[-1].attributes
+            if not states or states[-1].attributes is not recent_state.attributes:
+                size += len(recent_state.attributes)
+            recent_state.size = size
+            states.append(recent_state)
+            self._size += size
+            self._evict()
+
+    def update_last_reported(self, entity_id: str, last_reported_ts: float) -> None:
+        """Update the last reported timestamp of the latest state of an entity.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            if states := self._entities.get(entity_id):
+                states[-1].last_reported_ts = last_reported_ts
+
+    def get(self, entity_id: str) -> list[RecentState] | None:
+        """Return the cached states of an entity."""
+        with self._lock:
+            if not (states := self._entities.get(entity_id)):
+                return None
+            self._entities.move_to_end(entity_id)
+            return list(states)
+
+    def evict_before(self, timestamp: float) -> None:
+        """Evict the states last updated before timestamp.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            for entity_id, states in list(self._entities.items()):
+                while states and states[0].last_updated_ts < timestamp:
+                    self._size -= states.popleft().size
+                if not states:
+                    del self._entities[entity_id]
+
+    def evict_entities(self, entity_filter: Callable[[str], bool]) -> None:
+        """Evict the states of the entities matching entity_filter.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            self._evict_entity_ids(
+                [entity_id for entity_id in self._entities if entity_filter(entity_id)]
+            )
+
+    def evict_entity_ids(self, entity_ids: Iterable[str]) -> None:
+        """Evict the states of entities.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            self._evict_entity_ids(entity_ids)
+
+    def clear(self) -> None:
+        """Evict all states.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            self._entities.clear()
+            self._size = 0
+
+    def _evict_entity_ids(self, entity_ids: Iterable[str]) -> None:
+        """Evict the states of entities, the lock must be held."""
+        for entity_id in entity_ids:
+            if (states := self._entities.pop(entity_id, None)) is not None:
+                self._size -= sum(recent_state.size for recent_state in states)
+
+    def _evict(self) -> None:
+        """Evict states until the cache fits the budget, the lock must be held."""
+        entities = self._entities
+        while self._size > self._max_size and entities:
+            entity_id, states = next(iter(entities.items()))
+            self._size -= states.popleft().size
+            if not states:
+                del entities[entity_id]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
@@ -9,11 +10,22 @@ from datetime import datetime, timedelta
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -60,6 +72,7 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsRollup,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -126,6 +139,19 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
+QUERY_STATISTICS_ROLLUP_SUM = (
+    Statistics.metadata_id,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
 
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: ConductivityConverter for unit in ConductivityConverter.VALID_UNITS},
@@ -157,6 +183,9 @@ UNIT_CLASSES = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+# Periods stored in the statistics rollup table
+STATISTICS_ROLLUP_PERIODS: dict[str, int] = {"day": 1, "week": 2, "month": 3}
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -444,6 +473,9 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    # Fold the compiled hour into its day, week and month
+    _fold_statistics_rollups(session, summary, start_time_ts)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -1113,6 +1145,342 @@ def _reduce_statistics_per_month(
     )
 
 
+STATISTICS_ROLLUP_TS_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _compile_statistics_rollup_summary_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for a statistics rollup."""
+    stmt = lambda_stmt(
+        lambda: select(
+            Statistics.metadata_id,
+            func.avg(Statistics.mean),
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+            func.count(Statistics.mean),
+            func.max(Statistics.start_ts),
+        )
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(Statistics.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.group_by(Statistics.metadata_id)
+    return stmt
+
+
+def _compile_statistics_rollup_last_sum_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the last sum statement for a statistics rollup."""
+    if metadata_ids:
+        return lambda_stmt(
+            lambda: select(
+                subquery := (
+                    select(*QUERY_STATISTICS_ROLLUP_SUM)
+                    .filter(Statistics.start_ts >= start_time_ts)
+                    .filter(Statistics.start_ts < end_time_ts)
+                    .filter(Statistics.metadata_id.in_(metadata_ids))
+                    .subquery()
+                )
+            ).filter(subquery.c.rownum == 1)
+        )
+    return lambda_stmt(
+        lambda: select(
+            subquery := (
+                select(*QUERY_STATISTICS_ROLLUP_SUM)
+                .filter(Statistics.start_ts >= start_time_ts)
+                .filter(Statistics.start_ts < end_time_ts)
+                .subquery()
+            )
+        ).filter(subquery.c.rownum == 1)
+    )
+
+
+def _delete_statistics_rollup_stmt(
+    period: int,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None,
+) -> StatementLambdaElement:
+    """Generate the statement to delete the rollups starting in a period."""
+    stmt = lambda_stmt(
+        lambda: delete(StatisticsRollup)
+        .where(StatisticsRollup.period == period)
+        .where(StatisticsRollup.start_ts >= start_time_ts)
+        .where(StatisticsRollup.start_ts < end_time_ts)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.where(StatisticsRollup.metadata_id.in_(metadata_ids))
+    return stmt
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    period: str,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Compile the rollup of one day, week or month.
+
+    This will summarize the hourly statistics of the period:
+    - average, min max is computed by a database query
+    - sum is taken from the last hourly entry during the period
+    """
+    summary: dict[int, dict[str, Any]] = {}
+    stmt = _compile_statistics_rollup_summary_mean_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for (
+        metadata_id,
+        _mean,
+        _min,
+        _max,
+        mean_count,
+        last_start_ts,
+    ) in execute_stmt_lambda_element(session, stmt):
+        summary[metadata_id] = {
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+            "mean_count": mean_count,
+            "last_start_ts": last_start_ts,
+        }
+
+    stmt = _compile_statistics_rollup_last_sum_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for metadata_id, last_reset_ts, state, _sum, _ in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        summary.setdefault(metadata_id, {}).update(
+            {"last_reset_ts": last_reset_ts, "state": state, "sum": _sum}
+        )
+
+    period_id = STATISTICS_ROLLUP_PERIODS[period]
+    session.execute(
+        _delete_statistics_rollup_stmt(
+            period_id, start_time_ts, end_time_ts, metadata_ids
+        )
+    )
+    if summary:
+        session.execute(
+            insert(StatisticsRollup),
+            [
+                {
+                    "metadata_id": metadata_id,
+                    "period": period_id,
+                    "start_ts": start_time_ts,
+                    "end_ts": end_time_ts,
+                    **summary_item,
+                }
+                for metadata_id, summary_item in summary.items()
+            ],
+        )
+
+
+def _fold_statistics_rollups(
+    session: Session,
+    summary: dict[int, StatisticDataTimestamp],
+    start_time_ts: float,
+) -> None:
+    """Fold one compiled hour of statistics into the rollups of its periods.
+
+    Only the day, week and month containing the hour are touched, the
+    mean is weighted by the number of hourly means already in the rollup.
+    """
+    if not summary:
+        return
+    for period, ts_factory in STATISTICS_ROLLUP_TS_FACTORIES.items():
+        _, period_start_end = ts_factory()
+        period_start_ts, period_end_ts = period_start_end(start_time_ts)
+        period_id = STATISTICS_ROLLUP_PERIODS[period]
+        rollups: dict[int | None, StatisticsRollup] = {
+            rollup.metadata_id: rollup
+            for rollup in session.execute(
+                select(StatisticsRollup)
+                .where(StatisticsRollup.period == period_id)
+                .where(StatisticsRollup.start_ts == period_start_ts)
+            ).scalars()
+        }
+        for metadata_id, stat in summary.items():
+            if (rollup := rollups.get(metadata_id)) is None:
+                _mean = stat.get("mean")
+                session.add(
+                    StatisticsRollup(
+                        metadata_id=metadata_id,
+                        period=period_id,
+                        start_ts=period_start_ts,
+                        end_ts=period_end_ts,
+                        mean=_mean,
+                        min=stat.get("min"),
+                        max=stat.get("max"),
+                        mean_count=0 if _mean is None else 1,
+                        last_start_ts=start_time_ts,
+                        last_reset_ts=stat.get("last_reset_ts"),
+                        state=stat.get("state"),
+                        sum=stat.get("sum"),
+                    )
+                )
+                continue
+            if (_mean := stat.get("mean")) is not None:
+                mean_count = rollup.mean_count or 0
+                rollup.mean = (
+                    _mean
+                    if rollup.mean is None
+                    else (rollup.mean * mean_count + _mean) / (mean_count + 1)
+                )
+                rollup.mean_count = mean_count + 1
+            if (_min := stat.get("min")) is not None:
+                rollup.min = _min if rollup.min is None else min(rollup.min, _min)
+            if (_max := stat.get("max")) is not None:
+                rollup.max = _max if rollup.max is None else max(rollup.max, _max)
+            if rollup.last_start_ts is None or start_time_ts >= rollup.last_start_ts:
+                rollup.last_start_ts = start_time_ts
+                rollup.last_reset_ts = stat.get("last_reset_ts")
+                rollup.state = stat.get("state")
+                rollup.sum = stat.get("sum")
+
+
+def _update_statistics_rollups(
+    session: Session,
+    metadata_ids: list[int] | None,
+    start_time_ts: float,
+    end_time_ts: float,
+) -> None:
+    """Update the rollups of all periods overlapping start_time - end_time.
+
+    Must be called after the hourly statistics between start_time and
+    end_time have been changed. If metadata_ids is None, the rollups of
+    all statistics are updated.
+    """
+    # The hourly statistics may not have been written yet
+    session.flush()
+    for period, ts_factory in STATISTICS_ROLLUP_TS_FACTORIES.items():
+        _, period_start_end = ts_factory()
+        period_start_ts, period_end_ts = period_start_end(start_time_ts)
+        while period_start_ts < end_time_ts:
+            _compile_statistics_rollup(
+                session, period, period_start_ts, period_end_ts, metadata_ids
+            )
+            period_start_ts, period_end_ts = period_start_end(period_end_ts)
+
+
+def _statistics_start_ts_range_stmt(
+    metadata_ids: list[int] | None,
+) -> StatementLambdaElement:
+    """Generate the statement to find the first and last hourly statistics."""
+    stmt = lambda_stmt(
+        lambda: select(func.min(Statistics.start_ts), func.max(Statistics.start_ts))
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(Statistics.metadata_id.in_(metadata_ids))
+    return stmt
+
+
+def _update_statistics_rollups_after(
+    session: Session, metadata_ids: list[int], start_time_ts: float | None
+) -> None:
+    """Update the rollups of statistics from start_time to the last hourly statistic.
+
+    If start_time is None, all rollups of the statistics are updated.
+    """
+    session.flush()
+    first_ts, last_ts = session.execute(
+        _statistics_start_ts_range_stmt(metadata_ids)
+    ).one()
+    if last_ts is None:
+        return
+    _update_statistics_rollups(
+        session,
+        metadata_ids,
+        first_ts if start_time_ts is None else start_time_ts,
+        last_ts + Statistics.duration.total_seconds(),
+    )
+
+
+def compile_statistics_rollups_month(
+    session: Session, start_time_ts: float | None
+) -> float | None:
+    """Compile the rollups of one month of hourly statistics.
+
+    If start_time is None, start with the month of the oldest hourly
+    statistics. Returns the start of the next month to compile, or None
+    if all months have been compiled.
+    """
+    first_ts, last_ts = session.execute(_statistics_start_ts_range_stmt(None)).one()
+    if last_ts is None:
+        return None
+    _, month_start_end = reduce_month_ts_factory()
+    month_start_ts, month_end_ts = month_start_end(
+        first_ts if start_time_ts is None else start_time_ts
+    )
+    _update_statistics_rollups(session, None, month_start_ts, month_end_ts)
+    if month_end_ts > last_ts:
+        return None
+    return month_end_ts
+
+
+def _get_statistics_rollup_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period: str,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Sequence[Row] | None:
+    """Return the statistics rollups of a period.
+
+    Returns None if the rollups were compiled with different period
+    boundaries, for example before the time zone was changed, and the
+    hourly statistics must be reduced instead.
+    """
+    start_time_ts = start_time.timestamp()
+    period_id = STATISTICS_ROLLUP_PERIODS[period]
+    stmt = _generate_select_columns_for_types_stmt(StatisticsRollup, types)
+    stmt += lambda q: q.add_columns(StatisticsRollup.end_ts).filter(
+        StatisticsRollup.period == period_id
+    )
+    stmt += lambda q: q.filter(StatisticsRollup.start_ts >= start_time_ts)
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+        stmt += lambda q: q.filter(StatisticsRollup.start_ts < end_time_ts)
+    if metadata_ids:
+        stmt += lambda q: q.filter(StatisticsRollup.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(
+        StatisticsRollup.metadata_id, StatisticsRollup.start_ts
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    _, period_start_end = STATISTICS_ROLLUP_TS_FACTORIES[period]()
+    checked_start_ts: set[float] = set()
+    for row in stats:
+        if (row_start_ts := row.start_ts) in checked_start_ts:
+            continue
+        if period_start_end(row_start_ts) != (row_start_ts, row.end_ts):
+            _LOGGER.debug(
+                "Statistics rollups do not match the %s boundaries, rebuilding", period
+            )
+            get_instance(hass).queue_statistics_rollups_rebuild()
+            return None
+        checked_start_ts.add(row_start_ts)
+    return stats
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1609,12 +1977,12 @@ _type_column_mapping = {
 
 
 def _generate_select_columns_for_types_stmt(
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollup],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> StatementLambdaElement:
     columns = select(table.metadata_id, table.start_ts)
     track_on: list[str | None] = [
-        table.__tablename__,  # type: ignore[attr-defined]
+        table.__tablename__,  # type: ignore[union-attr]
     ]
     for key, column in _type_column_mapping.items():
         if key in types:
@@ -1698,6 +2066,43 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _align_start_end_time_with_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start_time = start_time.replace()
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    return start_time, end_time
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1735,68 +2140,70 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    start_time, end_time = _align_start_end_time_with_period(
+        start_time, end_time, period
+    )
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if (
+        period in STATISTICS_ROLLUP_PERIODS
+        and get_instance(hass).use_statistics_rollups
+        and (
+            stats := _get_statistics_rollup_rows(
+                hass, session, start_time, end_time, metadata_ids, period, types
+            )
+        )
+        is not None
+    ):
+        if not stats:
+            return {}
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
+        # The rollups have been checked to end at the period boundaries
+        period_ends = {row.start_ts: row.end_ts for row in stats}
+        for rows in result.values():
+            for row in rows:
+                row["end"] = period_ends[row["start"]]
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -1834,6 +2241,280 @@ def statistics_during_period(
         )
 
 
+@dataclasses.dataclass(slots=True)
+class StatisticsColumns:
+    """Statistic data points of a statistic stored as columns.
+
+    Each column is an array of doubles with one item per data point, missing
+    values are stored as NaN. The arrays support the buffer protocol and can
+    be wrapped by NumPy or Arrow without copying.
+    """
+
+    start: array[float]
+    end: array[float]
+    values: dict[str, array[float]]
+
+
+def _get_statistic_to_display_unit_column_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[array[float]], array[float]] | None:
+    """Prepare a converter of a column from the statistics unit to display unit."""
+    if (
+        _convert := _get_statistic_to_display_unit_converter(
+            statistic_unit, state_unit, requested_units, allow_none=False
+        )
+    ) is None:
+        return None
+    convert = cast(Callable[[float], float], _convert)
+    if not STATISTIC_UNIT_TO_UNIT_CONVERTER[statistic_unit].LINEAR:
+        # The conversion is not a constant ratio, missing values must
+        # not be passed to the converter.
+        return lambda column: array(
+            "d", [value if math.isnan(value) else convert(value) for value in column]
+        )
+    ratio = convert(1.0)
+    return lambda column: array("d", [value * ratio for value in column])
+
+
+def _sorted_statistics_to_columns(
+    hass: HomeAssistant,
+    stats: Sequence[Row[Any]],
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    table: type[StatisticsBase],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Convert SQL results into columns."""
+    assert stats, "stats must not be empty"  # Guard against implementation error
+    result: dict[str, StatisticsColumns] = {}
+    metadata = dict(_metadata.values())
+    field_map: dict[str, int] = {key: idx for idx, key in enumerate(stats[0]._fields)}
+    if "last_reset_ts" in field_map:
+        field_map["last_reset"] = field_map.pop("last_reset_ts")
+    start_ts_idx = field_map["start_ts"]
+    # Rollups have an end column as the periods differ in length
+    end_ts_idx = field_map.get("end_ts")
+    column_mapping = tuple((key, field_map[key]) for key in types if key in field_map)
+    table_duration_seconds = table.duration.total_seconds()
+    nan = math.nan
+    for meta_id, group in groupby(stats, itemgetter(field_map["metadata_id"])):
+        metadata_by_id = metadata[meta_id]
+        statistic_id = metadata_by_id["statistic_id"]
+        state_unit = unit = metadata_by_id["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        convert = _get_statistic_to_display_unit_column_converter(
+            unit, state_unit, units
+        )
+        # Transpose the rows to columns
+        db_columns = tuple(zip(*group, strict=True))
+        start = array("d", db_columns[start_ts_idx])
+        values: dict[str, array[float]] = {}
+        for key, idx in column_mapping:
+            column = array(
+                "d", [nan if value is None else value for value in db_columns[idx]]
+            )
+            if convert is not None and key != "last_reset":
+                column = convert(column)
+            values[key] = column
+        if end_ts_idx is None:
+            end = array("d", [start_ts + table_duration_seconds for start_ts in start])
+        else:
+            end = array("d", db_columns[end_ts_idx])
+        result[statistic_id] = StatisticsColumns(start, end, values)
+    return result
+
+
+def _reduce_statistics_columns(
+    stats: dict[str, StatisticsColumns],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> dict[str, StatisticsColumns]:
+    """Reduce hourly statistics columns to daily, weekly or monthly columns."""
+    result: dict[str, StatisticsColumns] = {}
+    nan = math.nan
+    for statistic_id, columns in stats.items():
+        starts = columns.start
+        values = columns.values
+        reduced_start: array[float] = array("d")
+        reduced_end: array[float] = array("d")
+        reduced_values: dict[str, array[float]] = {key: array("d") for key in values}
+        period_first = 0
+        length = len(starts)
+        for idx in range(1, length + 1):
+            if idx < length and same_period(starts[period_first], starts[idx]):
+                continue
+            start, end = period_start_end(starts[period_first])
+            reduced_start.append(start)
+            reduced_end.append(end)
+            for key, column in values.items():
+                if key in ("last_reset", "state", "sum"):
+                    # The last data point of the period
+                    reduced_values[key].append(column[idx - 1])
+                    continue
+                period_values = [
+                    value for value in column[period_first:idx] if not math.isnan(value)
+                ]
+                if not period_values:
+                    reduced_values[key].append(nan)
+                elif key == "mean":
+                    reduced_values[key].append(sum(period_values) / len(period_values))
+                elif key == "min":
+                    reduced_values[key].append(min(period_values))
+                else:
+                    reduced_values[key].append(max(period_values))
+            period_first = idx
+        result[statistic_id] = StatisticsColumns(
+            reduced_start, reduced_end, reduced_values
+        )
+    return result
+
+
+def _augment_columns_with_change(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+    table: type[Statistics | StatisticsShortTerm],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    result: dict[str, StatisticsColumns],
+) -> None:
+    """Add a change column to the result."""
+    drop_sum = "sum" not in _types
+    prev_sums: dict[str, float | None] = {}
+    if tmp := _statistics_at_time(
+        session,
+        {metadata[statistic_id][0] for statistic_id in result},
+        table,
+        start_time,
+        {"sum"},
+    ):
+        _metadata = dict(metadata.values())
+        for row in tmp:
+            if row.sum is None:
+                continue
+            metadata_by_id = _metadata[row.metadata_id]
+            statistic_id = metadata_by_id["statistic_id"]
+            state_unit = unit = metadata_by_id["unit_of_measurement"]
+            if state := hass.states.get(statistic_id):
+                state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
+            prev_sums[statistic_id] = row.sum if convert is None else convert(row.sum)
+
+    for statistic_id, columns in result.items():
+        values = columns.values
+        if "sum" not in values:
+            continue
+        sums = values.pop("sum") if drop_sum else values["sum"]
+        prev_sum = prev_sums.get(statistic_id) or 0
+        change: array[float] = array("d")
+        for _sum in sums:
+            # NaN propagates to the change of a missing sum
+            change.append(_sum - prev_sum)
+            if not math.isnan(_sum):
+                prev_sum = _sum
+        values["change"] = change
+
+
+def _statistics_during_period_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Return statistic data points during UTC period start_time - end_time."""
+    metadata = get_instance(hass).statistics_meta_manager.get_many(
+        session, statistic_ids=statistic_ids
+    )
+    if not metadata:
+        return {}
+
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+        "sum" if stat_type == "change" else stat_type for stat_type in _types
+    }
+    metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
+    start_time, end_time = _align_start_end_time_with_period(
+        start_time, end_time, period
+    )
+    table: type[Statistics | StatisticsShortTerm] = (
+        Statistics if period != "5minute" else StatisticsShortTerm
+    )
+    if (
+        period in STATISTICS_ROLLUP_PERIODS
+        and get_instance(hass).use_statistics_rollups
+        and (
+            stats := _get_statistics_rollup_rows(
+                hass, session, start_time, end_time, metadata_ids, period, types
+            )
+        )
+        is not None
+    ):
+        if not stats:
+            return {}
+        result = _sorted_statistics_to_columns(
+            hass, stats, metadata, table, units, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+        if not stats:
+            return {}
+
+        result = _sorted_statistics_to_columns(
+            hass, stats, metadata, table, units, types
+        )
+        if ts_factory := STATISTICS_ROLLUP_TS_FACTORIES.get(period):
+            result = _reduce_statistics_columns(result, *ts_factory())
+
+    if "change" in _types:
+        _augment_columns_with_change(
+            hass, session, start_time, units, _types, table, metadata, result
+        )
+
+    return result
+
+
+def statistics_during_period_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Return statistic data points during UTC period start_time - end_time as columns.
+
+    This returns the same data as statistics_during_period, but stored in
+    columns instead of a dict per data point which avoids most of the
+    allocations when fetching long periods.
+
+    If end_time is omitted, returns statistics newer than or equal to start_time.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        return _statistics_during_period_columns_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            period,
+            units,
+            types,
+        )
+
+
 def _get_last_statistics_stmt(
     metadata_id: int,
     number_of_stats: int,
@@ -2432,10 +3113,28 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    if table == Statistics and (
+        start_times_ts := [stat["start"].timestamp() for stat in statistics]
+    ):
+        # The rollups are updated in a separate session, the imported
+        # statistics are only flushed when the import session is committed
+        with session_scope(session=instance.get_session()) as session:
+            if old_metadata := instance.statistics_meta_manager.get(
+                session, metadata["statistic_id"]
+            ):
+                _update_statistics_rollups(
+                    session,
+                    [old_metadata[0]],
+                    min(start_times_ts),
+                    max(start_times_ts) + table.duration.total_seconds(),
+                )
+
+    return imported
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2475,6 +3174,11 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        _update_statistics_rollups_after(
+            session,
+            [metadata[statistic_id][0]],
+            start_time.replace(minute=0).timestamp(),
+        )
 
     return True
 
@@ -2539,6 +3243,7 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        _update_statistics_rollups_after(session, [metadata_id], None)
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
@@ -100,6 +100,8 @@ class UpdateStatesMetadataTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
+        if (recent_states_cache := instance.recent_states_cache) is not None:
+            recent_states_cache.evict_entity_ids((self.entity_id, self.new_entity_id))
         entity_registry.update_states_metadata(
             instance,
             self.entity_id,
@@ -117,6 +119,8 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        if (recent_states_cache := instance.recent_states_cache) is not None:
+            recent_states_cache.evict_before(self.purge_before.timestamp())
         if purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
         ):
@@ -142,6 +146,8 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        if (recent_states_cache := instance.recent_states_cache) is not None:
+            recent_states_cache.evict_entities(self.entity_filter)
         if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
             return
         # Schedule a new purge task if this one didn't finish
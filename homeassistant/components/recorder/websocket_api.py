@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from array import array
 import asyncio
+from base64 import b64encode
 from datetime import datetime as dt
+import sys
 from typing import Any, Literal, cast
 
 import voluptuous as vol
@@ -44,6 +47,7 @@ from .statistics import (
     list_statistic_ids,
     statistic_during_period,
     statistics_during_period,
+    statistics_during_period_columns,
     update_statistics_issues,
     validate_statistics,
 )
@@ -82,6 +86,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_clear_statistics)
     websocket_api.async_register_command(hass, ws_get_statistic_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
+    websocket_api.async_register_command(hass, ws_get_statistics_during_period_columns)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
@@ -238,6 +243,107 @@ async def ws_get_statistics_during_period(
     await ws_handle_get_statistics_during_period(hass, connection, msg)
 
 
+def _column_to_base64(column: array[float]) -> str:
+    """Encode a column as base64 of little endian doubles."""
+    if sys.byteorder == "big":
+        column = array("d", column)
+        column.byteswap()
+    return b64encode(column).decode()
+
+
+def _ws_get_statistics_during_period_columns(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str],
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> bytes:
+    """Fetch statistics columns and encode them in the executor."""
+    result = statistics_during_period_columns(
+        hass,
+        start_time,
+        end_time,
+        statistic_ids,
+        period,
+        units,
+        types,
+    )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                statistic_id: {
+                    "start": _column_to_base64(columns.start),
+                    "end": _column_to_base64(columns.end),
+                    **{
+                        key: _column_to_base64(column)
+                        for key, column in columns.values.items()
+                    },
+                }
+                for statistic_id, columns in result.items()
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/statistics_during_period_columns",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("statistic_ids"): vol.All([str], vol.Length(min=1)),
+        vol.Required("period"): vol.Any("5minute", "hour", "day", "week", "month"),
+        vol.Optional("units"): UNIT_SCHEMA,
+        vol.Optional("types"): vol.All(
+            [vol.Any("change", "last_reset", "max", "mean", "min", "state", "sum")],
+            vol.Coerce(set),
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_get_statistics_during_period_columns(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle statistics columns websocket command.
+
+    Each column of a statistic is sent as base64 encoded little endian
+    doubles, timestamps are in seconds and missing values are NaN.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str := msg.get("end_time"):
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    if (types := msg.get("types")) is None:
+        types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
+    connection.send_message(
+        await get_instance(hass).async_add_executor_job(
+            _ws_get_statistics_during_period_columns,
+            hass,
+            msg["id"],
+            start_time,
+            end_time,
+            set(msg["statistic_ids"]),
+            msg["period"],
+            msg.get("units"),
+            types,
+        )
+    )
+
+
 def _ws_get_list_statistic_ids(
     hass: HomeAssistant,
     msg_id: int,
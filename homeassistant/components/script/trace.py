@@ -7,6 +7,7 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
     ActionTrace,
     async_store_trace,
@@ -33,7 +34,12 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    async_store_trace(
+        hass,
+        trace,
+        trace_config[CONF_STORED_TRACES],
+        trace_config[CONF_SAMPLE_INTERVAL],
+    )
 
     try:
         yield trace
@@ -10,6 +10,7 @@ from functools import partial
 import itertools
 import logging
 import math
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -27,12 +28,22 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -79,6 +90,214 @@ WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+STATISTICS_STATE_ACCUMULATOR: HassKey[StatisticsStateAccumulator] = HassKey(
+    f"{DOMAIN}_statistics_state_accumulator"
+)
+# Maximum number of states kept in memory by the accumulator, if there are
+# more states the accumulator is reset and history is fetched from the database
+MAX_ACCUMULATED_STATES = 250000
+
+
+class StatisticsStateAccumulator:
+    """Accumulate the states of sensors with a state class in memory.
+
+    States are collected from state_changed events in the event loop and
+    handed to compile_statistics in the recorder thread, so the history of
+    the compiled period does not have to be queried from the database.
+
+    The event loop only appends the state changes to a pending buffer, which
+    the recorder thread swaps out and adds to the accumulated states when
+    compiling.
+
+    The database is used as fallback for periods the accumulator has not
+    observed completely, for example periods compiled after a restart.
+
+    The accumulator is only used if the recorder option
+    accumulate_statistics_states is enabled.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        # Protects the pending state changes and reset timestamp
+        self._lock = threading.Lock()
+        self._pending: list[EventStateChangedData] = []
+        self._pending_reset_ts: float | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+        # Only accessed from the recorder thread
+        self._states: dict[str, list[State]] = {}
+        self._num_states = 0
+        # All states in effect since this timestamp are known
+        self._valid_from = math.inf
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> None:
+        """Start accumulating states until the recorder stops."""
+        with self._lock:
+            self._pending_reset_ts = dt_util.utcnow().timestamp()
+        self._unsub = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_sensor_state_changed_filter,
+        )
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_stop)
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """Stop accumulating states when the recorder stops."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        with self._lock:
+            self._pending.clear()
+            # No period is covered by the accumulator anymore
+            self._pending_reset_ts = math.inf
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the pending state changes."""
+        with self._lock:
+            if len(self._pending) < MAX_ACCUMULATED_STATES:
+                self._pending.append(event.data)
+                return
+            _LOGGER.debug("Too many states pending, resetting accumulator")
+            self._pending.clear()
+            self._pending_reset_ts = event.time_fired_timestamp
+
+    def _add_pending_states(self) -> None:
+        """Add the pending state changes to the accumulated states."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            reset_ts, self._pending_reset_ts = self._pending_reset_ts, None
+        if reset_ts is not None:
+            self._reset(reset_ts)
+        for event_data in pending:
+            entity_id = event_data["entity_id"]
+            if (new_state := event_data["new_state"]) is None or (
+                not new_state.attributes.get(ATTR_STATE_CLASS)
+            ):
+                # Removed sensors are not compiled, and states without a state
+                # class are not accumulated. Forget the entity to not create
+                # a gap if it gets a state class again
+                if (states := self._states.pop(entity_id, None)) is not None:
+                    self._num_states -= len(states)
+                continue
+            if (states := self._states.get(entity_id)) is None:
+                # Seed with the previous state which is in effect until now
+                old_state = event_data["old_state"]
+                states = self._states[entity_id] = (
+                    [old_state] if old_state is not None else []
+                )
+                self._num_states += len(states)
+            states.append(new_state)
+            self._num_states += 1
+            if self._num_states > MAX_ACCUMULATED_STATES:
+                _LOGGER.debug("Too many states accumulated, resetting accumulator")
+                self._reset(new_state.last_updated_timestamp)
+
+    def _reset(self, valid_from: float) -> None:
+        """Forget all accumulated states."""
+        self._states.clear()
+        self._num_states = 0
+        self._valid_from = valid_from
+
+    def history_during_period(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        sensor_states: list[State],
+        entities_full_history: set[str],
+    ) -> dict[str, list[State]] | None:
+        """Return the history of sensors during a period.
+
+        The history matches what get_full_significant_states_with_session
+        returns for the period. Sensors which have not changed since the
+        accumulator started are not included. Returns None if the period
+        is not covered by the accumulator.
+
+        States before the period are dropped, periods are expected to
+        be compiled in order.
+
+        This method is called from the recorder thread.
+        """
+        self._add_pending_states()
+        start_ts = (start - datetime.timedelta.resolution).timestamp()
+        end_ts = end.timestamp()
+        if start_ts < self._valid_from:
+            return None
+        history_list: dict[str, list[State]] = {}
+        for sensor_state in sensor_states:
+            entity_id = sensor_state.entity_id
+            if (states := self._states.get(entity_id)) is None:
+                if sensor_state.last_updated_timestamp >= self._valid_from:
+                    # The state was not observed by the accumulator
+                    return None
+                continue
+            history_list[entity_id] = _states_during_period(
+                states, start_ts, end_ts, entity_id not in entities_full_history
+            )
+        self._drop_states_before(end_ts - datetime.timedelta.resolution.total_seconds())
+        return history_list
+
+    def _drop_states_before(self, timestamp: float) -> None:
+        """Drop states replaced before timestamp."""
+        for states in self._states.values():
+            # Keep the state in effect at the timestamp
+            drop = 0
+            for state in itertools.islice(states, 1, None):
+                if state.last_updated_timestamp >= timestamp:
+                    break
+                drop += 1
+            if drop:
+                del states[:drop]
+                self._num_states -= drop
+        self._valid_from = max(self._valid_from, timestamp)
+
+
+@callback
+def _async_sensor_state_changed_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changed events of sensors."""
+    return event_data["entity_id"].startswith("sensor.")
+
+
+def _states_during_period(
+    states: list[State],
+    start_ts: float,
+    end_ts: float,
+    significant_changes_only: bool,
+) -> list[State]:
+    """Return the state in effect at start_ts followed by the states until end_ts."""
+    start_state: State | None = None
+    period_states: list[State] = []
+    for state in states:
+        last_updated_ts = state.last_updated_timestamp
+        if last_updated_ts < start_ts:
+            start_state = state
+        elif last_updated_ts >= end_ts:
+            break
+        elif last_updated_ts > start_ts and (
+            not significant_changes_only
+            or state.last_changed_timestamp == last_updated_ts
+        ):
+            period_states.append(state)
+    if start_state is not None:
+        period_states.insert(0, start_state)
+    return period_states
+
+
+def _get_statistics_state_accumulator(
+    hass: HomeAssistant,
+) -> StatisticsStateAccumulator:
+    """Get the statistics state accumulator, start it if needed.
+
+    This method is called from the recorder thread.
+    """
+    if (accumulator := hass.data.get(STATISTICS_STATE_ACCUMULATOR)) is None:
+        accumulator = hass.data[STATISTICS_STATE_ACCUMULATOR] = (
+            StatisticsStateAccumulator()
+        )
+        hass.loop.call_soon_threadsafe(accumulator.async_start, hass)
+    return accumulator
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -417,8 +636,15 @@ def compile_statistics(  # noqa: C901
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
+    accumulated_history: dict[str, list[State]] | None = None
+    if get_instance(hass).accumulate_statistics_states:
+        accumulated_history = _get_statistics_state_accumulator(
+            hass
+        ).history_during_period(start, end, sensor_states, set(entities_full_history))
     history_list: dict[str, list[State]] = {}
-    if entities_full_history:
+    if accumulated_history is not None:
+        history_list = accumulated_history
+    elif entities_full_history:
         history_list = history.get_full_significant_states_with_session(
             hass,
             session,
@@ -432,7 +658,7 @@ def compile_statistics(  # noqa: C901
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
-    if entities_significant_history:
+    if accumulated_history is None and entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
             hass,
             session,
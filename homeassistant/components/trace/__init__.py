@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
 import logging
 from typing import Any
@@ -19,11 +20,16 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_LRU,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_STORED_TRACES,
+    MAX_STORED_TRACES,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -35,7 +41,10 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -46,6 +55,8 @@ type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_LRU] = OrderedDict()
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -78,7 +89,11 @@ async def async_get_trace(
     # Restore saved traces if not done
     await async_restore_traces(hass)
 
-    return hass.data[DATA_TRACE][key][run_id].as_extended_dict()
+    trace = hass.data[DATA_TRACE][key][run_id]
+    # Keep the viewed traces when the oldest traces are evicted
+    if trace in (lru := hass.data[DATA_TRACE_LRU]):
+        lru.move_to_end(trace)
+    return trace.as_extended_dict()
 
 
 async def async_list_contexts(
@@ -134,16 +149,48 @@ async def async_list_traces(
 
 
 def async_store_trace(
-    hass: HomeAssistant, trace: ActionTrace, stored_traces: int
+    hass: HomeAssistant,
+    trace: ActionTrace,
+    stored_traces: int,
+    sample_interval: int = DEFAULT_SAMPLE_INTERVAL,
 ) -> None:
-    """Store a trace if its key is valid."""
-    if key := trace.key:
-        traces = hass.data[DATA_TRACE]
-        if key not in traces:
-            traces[key] = LimitedSizeDict(size_limit=stored_traces)
-        else:
-            traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+    """Store a trace if its key is valid.
+
+    Only the trace of one in every sample_interval runs is stored. When
+    the traces of all scripts and automations exceed MAX_STORED_TRACES,
+    the least recently stored or viewed traces are evicted.
+    """
+    if not (key := trace.key):
+        return
+    if sample_interval > 1:
+        runs = hass.data[DATA_TRACE_RUNS]
+        run = runs[key] = runs.get(key, -1) + 1
+        if run % sample_interval:
+            return
+
+    traces = hass.data[DATA_TRACE]
+    lru = hass.data[DATA_TRACE_LRU]
+    if (key_traces := traces.get(key)) is None:
+        key_traces = traces[key] = LimitedSizeDict(size_limit=stored_traces)
+    else:
+        key_traces.size_limit = stored_traces
+    # Evict the oldest traces of the key to make room for the trace
+    while key_traces and len(key_traces) >= stored_traces:
+        lru.pop(key_traces.popitem(last=False)[1], None)
+    key_traces[trace.run_id] = trace
+    if trace.run_id not in key_traces:
+        return
+
+    lru[trace] = None
+    while len(lru) > MAX_STORED_TRACES:
+        _async_remove_trace(hass, lru.popitem(last=False)[0])
+
+
+def _async_remove_trace(hass: HomeAssistant, trace: BaseTrace) -> None:
+    """Remove an evicted trace."""
+    key_traces = hass.data[DATA_TRACE][trace.key]
+    if key_traces.get(trace.run_id) is trace:
+        del key_traces[trace.run_id]
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -154,6 +201,10 @@ def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> No
         traces[key] = LimitedSizeDict()
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
+    # Restored traces are older than the stored traces
+    lru = hass.data[DATA_TRACE_LRU]
+    lru[trace] = None
+    lru.move_to_end(trace, last=False)
 
 
 async def async_restore_traces(hass: HomeAssistant) -> None:
@@ -170,9 +221,12 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
         _LOGGER.exception("Error loading traces")
         restored_traces = {}
 
+    lru = hass.data[DATA_TRACE_LRU]
     for key, traces in restored_traces.items():
         # Add stored traces in reversed order to prioritize the newest traces
         for json_trace in reversed(traces):
+            if len(lru) >= MAX_STORED_TRACES:
+                return
             if (
                 (stored_traces := hass.data[DATA_TRACE].get(key))
                 and stored_traces.size_limit is not None
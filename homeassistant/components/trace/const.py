@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from homeassistant.util.hass_dict import HassKey
@@ -10,10 +11,18 @@ if TYPE_CHECKING:
     from homeassistant.helpers.storage import Store
 
     from . import TraceData
+    from .models import BaseTrace
 
 
+CONF_SAMPLE_INTERVAL = "sample_interval"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
+# Stored traces of all scripts and automations, least recently used first
+DATA_TRACE_LRU: HassKey[OrderedDict[BaseTrace, None]] = HassKey("trace_lru")
+# Number of runs of each script or automation
+DATA_TRACE_RUNS: HassKey[dict[str, int]] = HassKey("trace_runs")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
+DEFAULT_SAMPLE_INTERVAL = 1  # Store the trace of 1 in every n runs
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+MAX_STORED_TRACES = 1000  # Stored traces of all scripts and automations
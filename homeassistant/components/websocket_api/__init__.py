@@ -23,6 +23,7 @@ from .const import (  # noqa: F401
     ERR_UNAUTHORIZED,
     ERR_UNKNOWN_COMMAND,
     ERR_UNKNOWN_ERROR,
+    FEATURE_COMPACT_STATES,
     TYPE_RESULT,
     AsyncWebSocketCommandHandler,
     WebSocketCommandHandler,
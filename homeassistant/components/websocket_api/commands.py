@@ -64,7 +64,12 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
-from .messages import construct_result_message
+from .messages import (
+    InternTable,
+    compact_entities_init_message,
+    construct_result_message,
+)
+from .subscription_hub import EntitySubscription, async_get_entity_subscription_hub
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -367,33 +372,6 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
@@ -415,41 +393,47 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    entity_id_refs = (
+        InternTable()
+        if const.FEATURE_COMPACT_STATES in connection.supported_features
+        else None
+    )
+    connection.subscriptions[msg_id] = async_get_entity_subscription_hub(
+        hass
+    ).async_subscribe(
+        EntitySubscription(
             connection.send_message,
-            entity_ids,
-            entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
+            entity_ids,
+            entity_filter,
+            entity_id_refs,
+        )
     )
     connection.send_result(msg_id)
 
+    if entity_ids or entity_filter:
+        states = [
+            state
+            for state in states
+            if (not entity_ids or state.entity_id in entity_ids)
+            and (not entity_filter or entity_filter(state.entity_id))
+        ]
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
     try:
-        if entity_ids or entity_filter:
-            serialized_states = [
-                state.as_compressed_state_json
-                for state in states
-                if (not entity_ids or state.entity_id in entity_ids)
-                and (not entity_filter or entity_filter(state.entity_id))
-            ]
-        else:
-            # Fast path when not filtering
-            serialized_states = [state.as_compressed_state_json for state in states]
+        serialized_states = [state.as_compressed_state_json for state in states]
     except (ValueError, TypeError):
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection, message_id_as_bytes, states, serialized_states, entity_id_refs
         )
         return
 
+    serializable_states: list[State] = []
     serialized_states = []
     for state in states:
         try:
@@ -461,18 +445,31 @@ def handle_subscribe_entities(
                     find_paths_unserializable_data(state, dump=JSON_DUMP)
                 ),
             )
+        else:
+            serializable_states.append(state)
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection,
+        message_id_as_bytes,
+        serializable_states,
+        serialized_states,
+        entity_id_refs,
     )
 
 
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
+    states: list[State],
     serialized_states: list[bytes],
+    entity_id_refs: InternTable | None,
 ) -> None:
     """Send handle entities init response."""
+    if entity_id_refs is not None:
+        connection.send_message(
+            compact_entities_init_message(message_id_as_bytes, states, entity_id_refs)
+        )
+        return
     connection.send_message(
         b"".join(
             (
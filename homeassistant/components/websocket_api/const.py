@@ -34,6 +34,16 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Time in seconds the writer holds back event messages after the previous
+# write when the client accepts coalesced messages, so the events of a burst
+# are sent in batches instead of one write per event loop iteration.
+MESSAGE_BATCH_WINDOW: Final = 0.02
+
+# Minimum size in bytes of the messages compressed when the client
+# negotiated permessage-deflate, compressing smaller messages costs more
+# than it saves.
+COMPRESS_MIN_SIZE: Final = 1024
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +68,5 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Entity ids and attribute keys of states are replaced by references
+FEATURE_COMPACT_STATES = "compact_states"
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 import datetime as dt
 from functools import partial
 import logging
@@ -23,8 +24,10 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    MESSAGE_BATCH_WINDOW,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -33,7 +36,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import is_event_message, message_to_json_bytes
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -64,6 +67,16 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+@dataclass(slots=True)
+class WebSocketStats:
+    """Counters of the messages written to a websocket client."""
+
+    writes: int = 0
+    bytes_sent: int = 0
+    compressed_writes: int = 0
+    peak_queue_size: int = 0
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -82,6 +95,10 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drained_future",
+        "_batch_until",
+        "_batch_timer",
+        "_stats",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -105,6 +122,10 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drained_future: asyncio.Future[None] | None = None
+        self._batch_until: float = 0
+        self._batch_timer: asyncio.TimerHandle | None = None
+        self._stats = WebSocketStats()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -124,6 +145,11 @@ class WebSocketHandler:
             return describe_request(request)
         return "finished connection"
 
+    @property
+    def stats(self) -> WebSocketStats:
+        """Return the counters of the messages written to the client."""
+        return self._stats
+
     async def _writer(
         self,
         connection: ActiveConnection,
@@ -139,6 +165,7 @@ class WebSocketHandler:
         debug = logger.debug
         can_coalesce = connection.can_coalesce
         ready_message_count = len(message_queue)
+        stats = self._stats
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
@@ -158,22 +185,75 @@ class WebSocketHandler:
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
-                    continue
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")
+                    )
+                    message_queue.clear()
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, coalesced_messages)
+                    await send_bytes_text(coalesced_messages)
+
+                stats.writes += 1
+                if can_coalesce:
+                    # Event messages queued right after a write are batched
+                    # until the window has passed
+                    self._batch_until = loop.time() + MESSAGE_BATCH_WINDOW
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
-                if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if not message_queue and self._drained_future:
+                    self._release_drained_future()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
         except (RuntimeError, ConnectionResetError) as ex:
             debug("%s: Unexpected error in writer: %s", self.description, ex)
         finally:
-            debug("%s: Writer done", self.description)
+            debug("%s: Writer done: %s", self.description, stats)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            # Nothing more will be written, do not keep anyone waiting
+            self._release_drained_future()
+
+    @callback
+    def _release_drained_future(self) -> None:
+        """Release the commands waiting for the message queue to drain."""
+        if drained_future := self._drained_future:
+            self._drained_future = None
+            if not drained_future.done():
+                drained_future.set_result(None)
+
+    async def _async_drain(self) -> None:
+        """Wait until the queued messages have been written to the client."""
+        if self._closing or not self._message_queue:
+            return
+        if (drained_future := self._drained_future) is None:
+            drained_future = self._drained_future = self._loop.create_future()
+        await drained_future
+
+    async def _async_send_bytes_text(
+        self, writer: WebSocketWriter, compress: int, message: bytes
+    ) -> None:
+        """Send a text message, compress it if it is large enough.
+
+        compress is the window size negotiated for permessage-deflate,
+        or zero if the client does not support compression.
+        """
+        stats = self._stats
+        stats.bytes_sent += (size := len(message))
+        if not compress or size < COMPRESS_MIN_SIZE:
+            writer.compress = 0
+            await writer.send(message, binary=False)
+            return
+        writer.compress = compress
+        stats.compressed_writes += 1
+        await writer.send(message, binary=False)
+
+    @callback
+    def _cancel_batch_timer(self) -> None:
+        """Cancel the timer releasing a batch of messages."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -203,7 +283,10 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        queue_size_after_add = len(message_queue)
+        stats = self._stats
+        stats.peak_queue_size = max(stats.peak_queue_size, queue_size_after_add)
+        if queue_size_after_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -220,6 +303,20 @@ class WebSocketHandler:
         if self._release_ready_queue_size == 0:
             # Try to coalesce more messages to reduce the number of writes
             self._release_ready_queue_size = queue_size_after_add
+            if self._batch_until > self._loop.time() and is_event_message(message):
+                self._batch_timer = self._loop.call_at(
+                    self._batch_until, self._release_ready_future_or_reschedule
+                )
+            else:
+                self._loop.call_soon(self._release_ready_future_or_reschedule)
+        elif self._batch_timer is not None and (
+            queue_size_after_add >= PENDING_MSG_MAX_FORCE_READY
+            or not is_event_message(message)
+        ):
+            # Do not wait for the end of the batch window to avoid the
+            # coalesced messages from growing too large, or delaying
+            # results and other replies which are not events
+            self._cancel_batch_timer()
             self._loop.call_soon(self._release_ready_future_or_reschedule)
 
         peak_checker_active = self._peak_checker_unsub is not None
@@ -244,6 +341,7 @@ class WebSocketHandler:
         If we reach PENDING_MSG_MAX_FORCE_READY, we will release the ready future
         immediately so avoid the coalesced messages from growing too large.
         """
+        self._batch_timer = None
         if not (ready_future := self._ready_future) or not (
             queue_size := len(self._message_queue)
         ):
@@ -286,6 +384,7 @@ class WebSocketHandler:
         """Cancel the connection."""
         self._closing = True
         self._cancel_peak_checker()
+        self._cancel_batch_timer()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -328,9 +427,17 @@ class WebSocketHandler:
         if TYPE_CHECKING:
             assert writer is not None
 
-        send_bytes_text = partial(writer.send, binary=False)
+        # The writer compresses all messages when the client negotiated
+        # permessage-deflate, we only compress the larger messages
+        send_bytes_text = partial(self._async_send_bytes_text, writer, writer.compress)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_drain,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
@@ -355,6 +462,7 @@ class WebSocketHandler:
             unsub_stop()
 
             self._cancel_peak_checker()
+            self._cancel_batch_timer()
 
             if connection is not None:
                 connection.async_handle_close()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 import logging
-from typing import Any, Final
+from typing import Any, Final, cast
 
 import voluptuous as vol
 
@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -43,6 +43,10 @@ STATE_DIFF_REMOVALS = "-"
 ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
+# Entity ids which are referenced for the first time, with compact states
+ENTITY_EVENT_ENTITY_IDS = "e"
+# Attribute keys referenced in a message, with compact states
+ATTRIBUTE_KEYS = "k"
 
 BASE_ERROR_MESSAGE = {
     "type": const.TYPE_RESULT,
@@ -109,6 +113,19 @@ def event_message(iden: int, event: Any) -> dict[str, Any]:
     return {"id": iden, "type": "event", "event": event}
 
 
+def is_event_message(message: bytes) -> bool:
+    """Return if a serialized message is an event message.
+
+    Event messages are serialized with the type first or right after
+    the id, the other messages are never detected as event messages.
+    """
+    if message.startswith(b'{"type":"event"'):
+        return True
+    return message.startswith(b'{"id":') and message.startswith(
+        b',"type":"event"', message.find(b",", 6)
+    )
+
+
 def cached_event_message(message_id_as_bytes: bytes, event: Event) -> bytes:
     """Return an event message.
 
@@ -152,16 +169,25 @@ def cached_state_diff_message(
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
+    return state_diff_message_with_id(
+        cached_state_diff_message_prefix(event), message_id_as_bytes
     )
 
 
+def cached_state_diff_message_prefix(event: Event[EventStateChangedData]) -> bytes:
+    """Return a state diff message without the id and closing brace.
+
+    The prefix can be shared between all connections that receive
+    the event and completed with state_diff_message_with_id.
+    """
+    return _partial_cached_state_diff_message(event)[:-1]
+
+
+def state_diff_message_with_id(prefix: bytes, message_id_as_bytes: bytes) -> bytes:
+    """Complete a state diff message prefix with the message id."""
+    return b"".join((prefix, b',"id":', message_id_as_bytes, b"}"))
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -238,6 +264,140 @@ def _state_diff_event(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
+class InternTable:
+    """Replace strings sent to a client with references.
+
+    A string is sent the first time it is referenced, the client assigns it
+    the next reference in order. Later messages only contain the reference.
+    """
+
+    __slots__ = ("_refs",)
+
+    def __init__(self) -> None:
+        """Initialize the intern table."""
+        self._refs: dict[str, str] = {}
+
+    def ref(self, value: str, new_values: list[str]) -> str:
+        """Return the reference of a string.
+
+        If the string has no reference yet, it is appended to new_values.
+        """
+        if (ref := self._refs.get(value)) is None:
+            ref = self._refs[value] = str(len(self._refs))
+            new_values.append(value)
+        return ref
+
+
+def compact_state_diff_message(
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    entity_ids: InternTable,
+) -> bytes:
+    """Return an event message with the entity id replaced by a reference.
+
+    The state or diff is serialized once per event and shared between
+    all connections that receive the event.
+    """
+    kind, payload = _partial_cached_compact_state_diff(event)
+    new_entity_ids: list[str] = []
+    ref = entity_ids.ref(event.data["entity_id"], new_entity_ids).encode()
+    parts = [b'{"type":"event","event":{']
+    if new_entity_ids:
+        parts.extend(
+            (b'"', ENTITY_EVENT_ENTITY_IDS.encode(), b'":', json_bytes(new_entity_ids))
+        )
+        parts.append(b",")
+    if kind == ENTITY_EVENT_REMOVE:
+        parts.extend((b'"', kind.encode(), b'":[', ref, b"]"))
+    else:
+        parts.extend((b'"', kind.encode(), b'":{"', ref, b'":', payload, b"}"))
+    parts.extend((b'},"id":', message_id_as_bytes, b"}"))
+    return b"".join(parts)
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_compact_state_diff(
+    event: Event[EventStateChangedData],
+) -> tuple[str, bytes]:
+    """Cache and serialize the state or diff of a state changed event.
+
+    Returns the kind of change and the serialized state or diff of the entity,
+    which is empty when the entity is removed.
+    """
+    ((kind, changes),) = _state_diff_event(event).items()
+    if kind == ENTITY_EVENT_REMOVE:
+        return kind, b""
+    (state_or_diff,) = cast(dict[str, Any], changes).values()
+    try:
+        return kind, json_bytes(state_or_diff)
+    except (ValueError, TypeError):
+        _LOGGER.error(
+            "Unable to serialize to JSON. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(state_or_diff, dump=JSON_DUMP)
+            ),
+        )
+    return kind, b"{}"
+
+
+def compact_entities_init_message(
+    message_id_as_bytes: bytes, states: list[State], entity_ids: InternTable
+) -> bytes:
+    """Return the subscribe_entities init message with entity references.
+
+    The compressed states must be JSON serializable.
+    """
+    new_entity_ids: list[str] = []
+    serialized_states = [
+        b"".join(
+            (
+                b'"',
+                entity_ids.ref(state.entity_id, new_entity_ids).encode(),
+                # Strip the entity id key from the compressed state pair
+                state.as_compressed_state_json[len(state.entity_id) + 1 :],
+            )
+        )
+        for state in states
+    ]
+    return b"".join(
+        (
+            b'{"id":',
+            message_id_as_bytes,
+            b',"type":"event","event":{"e":',
+            json_bytes(new_entity_ids),
+            b',"a":{',
+            b",".join(serialized_states),
+            b"}}}",
+        )
+    )
+
+
+def intern_attribute_keys(
+    compressed_states: dict[str, list[dict[str, Any]]],
+) -> list[str]:
+    """Replace the attribute keys of compressed states with references.
+
+    The references are local to a message, the returned keys must be sent
+    with the states.
+    """
+    keys = InternTable()
+    new_keys: list[str] = []
+    ref = keys.ref
+    for entity_id, states in compressed_states.items():
+        compressed_states[entity_id] = [
+            {
+                **state,
+                COMPRESSED_STATE_ATTRIBUTES: {
+                    ref(key, new_keys): value for key, value in attributes.items()
+                },
+            }
+            if (attributes := state.get(COMPRESSED_STATE_ATTRIBUTES))
+            else state
+            for state in states
+        ]
+    return new_keys
+
+
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
     """Serialize a websocket message to json or return None."""
     try:
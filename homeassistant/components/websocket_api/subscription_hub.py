@@ -0,0 +1,175 @@
+"""Shared fan-out of state changes to subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from homeassistant.auth import EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+from .const import DOMAIN
+
+DATA_ENTITY_SUBSCRIPTION_HUB: HassKey[EntitySubscriptionHub] = HassKey(
+    f"{DOMAIN}.entity_subscription_hub"
+)
+
+# Events that may change which subscriptions are allowed to see an entity
+_INVALIDATE_EVENTS = (
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    EVENT_USER_REMOVED,
+    EVENT_USER_UPDATED,
+)
+
+
+@dataclass(slots=True)
+class EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[bytes | str | dict[str, Any]], None]
+    user: User
+    message_id_as_bytes: bytes
+    entity_ids: set[str] | None
+    entity_filter: Callable[[str], bool] | None
+    # References of the entity ids sent, if the connection supports compact states
+    entity_id_refs: messages.InternTable | None = None
+    # Permissions of the user when the entity index was built
+    permissions: AbstractPermissions | None = None
+
+    def wants_entity(self, entity_id: str) -> bool:
+        """Return if the subscription wants and may see an entity."""
+        if (self.entity_ids and entity_id not in self.entity_ids) or (
+            self.entity_filter and not self.entity_filter(entity_id)
+        ):
+            return False
+        if (permissions := self.permissions) is None:
+            permissions = self.permissions = self.user.permissions
+        return (
+            self.user.is_admin
+            or permissions.access_all_entities(POLICY_READ)
+            or permissions.check_entity(entity_id, POLICY_READ)
+        )
+
+
+class EntitySubscriptionHub:
+    """Fan out state changed events to all subscribe_entities subscriptions.
+
+    A single state_changed listener is shared by all subscriptions. The
+    subscriptions that receive an entity are resolved the first time the
+    entity changes and are kept in an index until a subscription, a user
+    or the entity or device registry changes.
+    """
+
+    __slots__ = ("_hass", "_index", "_subscriptions", "_unsubs")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._subscriptions: list[EntitySubscription] = []
+        self._index: dict[str, list[EntitySubscription]] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_subscribe(self, subscription: EntitySubscription) -> CALLBACK_TYPE:
+        """Subscribe to state changes, returns a callback to unsubscribe."""
+        if not self._subscriptions:
+            bus = self._hass.bus
+            self._unsubs = [
+                bus.async_listen(EVENT_STATE_CHANGED, self._async_forward),
+                *(
+                    bus.async_listen(event_type, self._async_invalidate)
+                    for event_type in _INVALIDATE_EVENTS
+                ),
+            ]
+        self._subscriptions.append(subscription)
+        self._async_invalidate()
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: EntitySubscription) -> None:
+        """Remove a subscription."""
+        self._subscriptions.remove(subscription)
+        self._async_invalidate()
+        if not self._subscriptions:
+            for unsub in self._unsubs:
+                unsub()
+            self._unsubs = []
+
+    @callback
+    def _async_invalidate(self, event: Event | None = None) -> None:
+        """Invalidate the entity index."""
+        self._index.clear()
+        for subscription in self._subscriptions:
+            subscription.permissions = subscription.user.permissions
+
+    @callback
+    def _async_subscriptions_for_entity(
+        self, entity_id: str
+    ) -> list[EntitySubscription]:
+        """Return the subscriptions that receive an entity."""
+        # A user may have been changed without firing an event, the
+        # permissions object is replaced when that happens. All subscriptions
+        # are checked as the index also holds the entities they were denied.
+        for subscription in self._subscriptions:
+            if subscription.user.permissions is not subscription.permissions:
+                self._async_invalidate()
+                break
+        else:
+            if (subscriptions := self._index.get(entity_id)) is not None:
+                return subscriptions
+        subscriptions = self._index[entity_id] = [
+            subscription
+            for subscription in self._subscriptions
+            if subscription.wants_entity(entity_id)
+        ]
+        return subscriptions
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state changed event to the matching subscriptions."""
+        if not (
+            subscriptions := self._async_subscriptions_for_entity(
+                event.data["entity_id"]
+            )
+        ):
+            return
+        prefix: bytes | None = None
+        for subscription in subscriptions:
+            if (entity_id_refs := subscription.entity_id_refs) is not None:
+                subscription.send_message(
+                    messages.compact_state_diff_message(
+                        subscription.message_id_as_bytes, event, entity_id_refs
+                    )
+                )
+                continue
+            if prefix is None:
+                prefix = messages.cached_state_diff_message_prefix(event)
+            subscription.send_message(
+                messages.state_diff_message_with_id(
+                    prefix, subscription.message_id_as_bytes
+                )
+            )
+
+
+@singleton(DATA_ENTITY_SUBSCRIPTION_HUB)
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the entity subscription hub."""
+    return EntitySubscriptionHub(hass)
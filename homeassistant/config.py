@@ -73,7 +73,13 @@ from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import (
+    SECRET_YAML,
+    Secrets,
+    YamlFileCache,
+    YamlTypeError,
+    load_yaml_dict,
+)
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,6 +90,7 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
+DATA_YAML_FILE_CACHE: HassKey[YamlFileCache] = HassKey("yaml_file_cache")
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -448,6 +455,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    # Only the files changed since the previous load are parsed again
+    if (file_cache := hass.data.get(DATA_YAML_FILE_CACHE)) is None:
+        file_cache = hass.data[DATA_YAML_FILE_CACHE] = YamlFileCache()
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -456,6 +466,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             load_yaml_config_file,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            file_cache,
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -499,7 +510,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    file_cache: YamlFileCache | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -508,7 +521,7 @@ def load_yaml_config_file(
     This method needs to run in an executor.
     """
     try:
-        conf_dict = load_yaml_dict(config_path, secrets)
+        conf_dict = load_yaml_dict(config_path, secrets, file_cache)
     except YamlTypeError as exc:
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
@@ -1444,13 +1444,22 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_entity_listeners",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._entity_listeners: dict[
+            EventType[Any] | str, dict[str, list[_FilterableJobType[Any]]]
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1468,7 +1477,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, entity_listeners in self._entity_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(listeners) for listeners in entity_listeners.values()
+            )
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1534,6 +1548,14 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            entity_listeners := self._entity_listeners.get(event_type)
+        ):
+            entity_id = event_data.get("entity_id")
+            if type(entity_id) is str and (
+                matched_listeners := entity_listeners.get(entity_id)
+            ):
+                listeners = listeners + matched_listeners
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1638,6 +1660,70 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_entity(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_ids: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        job_type: HassJobType | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for specific entity ids.
+
+        The listener is indexed by the ``entity_id`` key of the event data
+        so firing an event only has to look at the listeners of the matching
+        entity id instead of running an event_filter for every listener.
+        Entity ids are matched as is, they are not lowercased.
+
+        This method must be run in the event loop.
+        """
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids,)
+        else:
+            entity_ids = tuple(entity_ids)
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {entity_ids}", job_type=job_type),
+            None,
+        )
+        if (entity_listeners := self._entity_listeners.get(event_type)) is None:
+            entity_listeners = self._entity_listeners[event_type] = {}
+        for entity_id in entity_ids:
+            if (listeners := entity_listeners.get(entity_id)) is None:
+                entity_listeners[entity_id] = [filterable_job]
+            else:
+                listeners.append(filterable_job)
+        return functools.partial(
+            self._async_remove_entity_listener, event_type, entity_ids, filterable_job
+        )
+
+    @callback
+    def _async_remove_entity_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_ids: tuple[str, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a listener of a specific event_type for specific entity ids.
+
+        This method must be run in the event loop.
+        """
+        try:
+            entity_listeners = self._entity_listeners[event_type]
+            for entity_id in entity_ids:
+                listeners = entity_listeners[entity_id]
+                listeners.remove(filterable_job)
+                # delete entity_id list if empty
+                if not listeners:
+                    del entity_listeners[entity_id]
+            if not entity_listeners:
+                del self._entity_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError is key event_type or entity_id listener did not exist
+            # ValueError if listener did not exist within entity_id
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -2285,7 +2371,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Entities with cached attributes pass the same mapping again
+            # when the attributes have not changed, skip comparing them
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -553,6 +553,39 @@ def state(
 
     Async friendly.
     """
+    if not isinstance(req_state, list):
+        req_state = [req_state]
+
+    return _state(
+        hass,
+        entity,
+        req_state,
+        _state_entity_ids(req_state),
+        for_period,
+        attribute,
+        variables,
+    )
+
+
+def _state_entity_ids(req_states: list[Any]) -> set[str]:
+    """Return the required states which are the state of another entity."""
+    return {
+        req_state
+        for req_state in req_states
+        if isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is not None
+    }
+
+
+def _state(
+    hass: HomeAssistant,
+    entity: str | State | None,
+    req_states: list[Any],
+    state_entity_ids: set[str],
+    for_period: timedelta | None,
+    attribute: str | None,
+    variables: TemplateVarsType,
+) -> bool:
+    """Test if state matches requirements resolved from the configuration."""
     if entity is None:
         raise ConditionErrorMessage("state", "no entity specified")
 
@@ -578,24 +611,23 @@ def state(
     else:
         value = entity.attributes.get(attribute)
 
-    if not isinstance(req_state, list):
-        req_state = [req_state]
-
-    is_state = False
-    for req_state_value in req_state:
-        state_value = req_state_value
-        if (
-            isinstance(req_state_value, str)
-            and INPUT_ENTITY_ID.match(req_state_value) is not None
-        ):
-            if not (state_entity := hass.states.get(req_state_value)):
-                raise ConditionErrorMessage(
-                    "state", f"the 'state' entity {req_state_value} is unavailable"
-                )
-            state_value = state_entity.state
-        is_state = value == state_value
-        if is_state:
-            break
+    if not state_entity_ids:
+        # The trace has the matching state or the last required state
+        is_state = value in req_states
+        state_value = value if is_state else req_states[-1]
+    else:
+        is_state = False
+        for req_state_value in req_states:
+            state_value = req_state_value
+            if req_state_value in state_entity_ids:
+                if not (state_entity := hass.states.get(req_state_value)):
+                    raise ConditionErrorMessage(
+                        "state", f"the 'state' entity {req_state_value} is unavailable"
+                    )
+                state_value = state_entity.state
+            is_state = value == state_value
+            if is_state:
+                break
 
     if for_period is None or not is_state:
         condition_trace_set_result(is_state, state=value, wanted_state=state_value)
@@ -624,6 +656,7 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
     if not isinstance(req_states, list):
         req_states = [req_states]
+    state_entity_ids = _state_entity_ids(req_states)
 
     @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
@@ -633,8 +666,14 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
         for index, entity_id in enumerate(entity_ids):
             try:
                 with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if state(
-                        hass, entity_id, req_states, for_period, attribute, variables
+                    if _state(
+                        hass,
+                        entity_id,
+                        req_states,
+                        state_entity_ids,
+                        for_period,
+                        attribute,
+                        variables,
                     ):
                         result = True
                     elif match == ENTITY_MATCH_ALL:
@@ -10,9 +10,10 @@ import dataclasses
 from enum import Enum, IntFlag, auto
 import functools as ft
 from functools import cached_property
+import inspect
 import logging
 import math
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 import sys
 import threading
 import time
@@ -57,8 +58,14 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
-from . import device_registry as dr, entity_registry as er, singleton
+from . import (
+    device_registry as dr,
+    entity_registry as er,
+    significant_change,
+    singleton,
+)
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
 from .event import (
     async_track_device_registry_updated_event,
@@ -85,6 +92,11 @@ CAPABILITIES_UPDATE_LIMIT = 100
 
 CONTEXT_RECENT_TIME_SECONDS = 5  # Time that a context is considered recent
 
+# Attributes with the lowest and highest numeric state since the previous state
+# write, added to the state of entities coalescing their writes if requested
+ATTR_COALESCED_MIN = "coalesced_min"
+ATTR_COALESCED_MAX = "coalesced_max"
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -265,6 +277,57 @@ class CalculatedState:
     capability_attributes: Mapping[str, Any] | None
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class WriteRatePolicy:
+    """Policy to coalesce frequent state writes of an entity.
+
+    A state write less than interval seconds after the previous write is delayed
+    until the interval has passed and only the latest state is written, unless
+    it is a significant change according to the significant_change platform of
+    the entity domain. Domains without a significant_change platform consider
+    all changes of the state, but not of the attributes, to be significant.
+    """
+
+    # The minimum time between two state writes, in seconds
+    interval: float
+    # Add the lowest and highest numeric state since the previous write to the
+    # attributes
+    track_min_max: bool = False
+
+
+class _WriteCoalescer:
+    """Track the coalesced state writes of an entity."""
+
+    __slots__ = ("last_write", "policy", "timer", "min", "max")
+
+    def __init__(self, policy: WriteRatePolicy) -> None:
+        """Initialize the write coalescer."""
+        self.policy = policy
+        self.last_write = -math.inf
+        self.timer: asyncio.TimerHandle | None = None
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def track_value(self, state: str) -> None:
+        """Track the lowest and highest numeric state."""
+        try:
+            value = float(state)
+        except ValueError:
+            return
+        if not math.isfinite(value):
+            return
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def cancel(self) -> None:
+        """Cancel the delayed write."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+
 class CachedProperties(type):
     """Metaclass which invalidates cached entity properties on write to _attr_.
 
@@ -425,6 +488,23 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "unit_of_measurement",
 }
 
+# Cached properties which the static state attributes are calculated from,
+# the static state attributes do not depend on the state of the entity
+_STATIC_ATTRIBUTE_PROPERTIES = frozenset(
+    {
+        "assumed_state",
+        "attribution",
+        "device_class",
+        "entity_picture",
+        "has_entity_name",
+        "icon",
+        "name",
+        "supported_features",
+        "unit_of_measurement",
+        "use_device_name",
+    }
+)
+
 
 class Entity(
     metaclass=ABCCachedProperties, cached_properties=CACHED_PROPERTIES_WITH_ATTR_
@@ -449,6 +529,10 @@ class Entity(
     # Entity description instance for this Entity
     entity_description: EntityDescription
 
+    # Policy to coalesce frequent state writes. If None, it is set by
+    # EntityPlatform from the WRITE_RATE_POLICY of the platform module
+    write_rate_policy: WriteRatePolicy | None = None
+
     # If we reported if this entity was slow
     _slow_reported = False
 
@@ -520,6 +604,30 @@ class Entity(
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
+    __write_coalescer: _WriteCoalescer | None = None
+
+    # If the static state attributes can be cached, set automatically by
+    # __init_subclass__
+    __static_attributes_cacheable: bool = False
+    # Getter of the static attribute properties which are plain properties
+    # instead of cached properties, set automatically by __init_subclass__
+    __static_attributes_properties_getter: Callable[[Entity], Any] | None = None
+    # The cached static state attributes, see __async_static_attributes
+    __static_attributes: (
+        tuple[
+            er.RegistryEntry | None,
+            dr.DeviceEntry | None,
+            Callable[[dict[str, Any]], tuple[Any, ...]],
+            tuple[Any, ...],
+            Any,
+            ReadOnlyDict[str, Any],
+            str | None,
+            int | None,
+        ]
+        | None
+    ) = None
+    # The last written state attributes, reused when they are not changed
+    __last_attributes: ReadOnlyDict[str, Any] | None = None
 
     # Entity Properties
     _attr_assumed_state: bool = False
@@ -551,6 +659,21 @@ class Entity(
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        # The static state attributes can only be cached if the friendly name
+        # is calculated by Entity. Cached properties are invalidated when they
+        # are changed, the values of properties overridden by plain properties,
+        # like the unit of measurement of sensors, are compared on every write.
+        cls.__static_attributes_cacheable = (
+            cls._friendly_name_internal is Entity._friendly_name_internal
+        )
+        property_names = sorted(
+            name
+            for name in _STATIC_ATTRIBUTE_PROPERTIES
+            if not isinstance(inspect.getattr_static(cls, name, None), cached_property)
+        )
+        cls.__static_attributes_properties_getter = (
+            attrgetter(*property_names) if property_names else None
+        )
 
     def get_hassjob_type(self, function_name: str) -> HassJobType:
         """Get the job type function for the given name.
@@ -1041,7 +1164,7 @@ class Entity(
     def _async_calculate_state(self) -> CalculatedState:
         """Calculate state string and attribute mapping."""
         state, attr, capabilities, _, _ = self.__async_calculate_state()
-        return CalculatedState(state, attr, capabilities)
+        return CalculatedState(state, dict(attr), capabilities)
 
     def __async_calculate_state(
         self,
@@ -1071,6 +1194,64 @@ class Entity(
             if extra_state_attributes := self.extra_state_attributes:
                 attr.update(extra_state_attributes)
 
+        static_attr, original_device_class, supported_features = (
+            self.__async_static_attributes(entry)
+        )
+        if not attr:
+            # Reuse the static attributes, if they are cached the state machine
+            # does not need to compare them with the attributes of the old state
+            attr = static_attr
+        elif type(static_attr) is ReadOnlyDict:
+            attr.update(static_attr)
+            # Capability, state or extra attributes are set, reuse the last
+            # written attributes if they are not changed
+            if (last_attr := self.__last_attributes) is not None and last_attr == attr:
+                attr = last_attr
+            else:
+                attr = self.__last_attributes = ReadOnlyDict(attr)
+        else:
+            attr.update(static_attr)
+
+        return (state, attr, capability_attr, original_device_class, supported_features)
+
+    def __async_static_attributes(
+        self, entry: er.RegistryEntry | None
+    ) -> tuple[dict[str, Any], str | None, int | None]:
+        """Return the static state attributes.
+
+        The static state attributes are calculated from the registry entry, the
+        device entry and cached properties. If the entity class allows it, they
+        are cached until the registry entry or the device entry is replaced, a
+        cached property they were calculated from is invalidated or a plain
+        property they were calculated from returns another value.
+
+        Returns a tuple:
+        attr - the static attributes
+        original_device_class - the device class which may be overridden
+        supported_features - the supported features
+        """
+        device_entry = self.device_entry
+        properties_getter = self.__static_attributes_properties_getter
+        if (
+            (static := self.__static_attributes) is not None
+            and static[0] is entry
+            and static[1] is device_entry
+        ):
+            # The cached properties may have been invalidated and calculated
+            # again, compare their values with the values the cached static
+            # attributes were calculated from
+            try:
+                cached_values = static[2](self.__dict__)
+            except KeyError:
+                pass
+            else:
+                if cached_values == static[3] and (
+                    properties_getter is None or properties_getter(self) == static[4]
+                ):
+                    return static[5], static[6], static[7]
+
+        attr: dict[str, Any] = {}
+
         if (unit_of_measurement := self.unit_of_measurement) is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
@@ -1100,7 +1281,27 @@ class Entity(
         if (supported_features := self.supported_features) is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr, capability_attr, original_device_class, supported_features)
+        # Only the cached properties which were used are checked, the others
+        # can only be used after one of them has changed. Some of the properties
+        # are always used unless they are overridden by plain properties.
+        if not self.__static_attributes_cacheable or not (
+            cached_names := _STATIC_ATTRIBUTE_PROPERTIES.intersection(self.__dict__)
+        ):
+            return attr, original_device_class, supported_features
+
+        read_only_attr = ReadOnlyDict(attr)
+        get_cached_values = itemgetter(*cached_names)
+        self.__static_attributes = (
+            entry,
+            device_entry,
+            get_cached_values,
+            get_cached_values(self.__dict__),
+            properties_getter(self) if properties_getter is not None else None,
+            read_only_attr,
+            original_device_class,
+            supported_features,
+        )
+        return read_only_attr, original_device_class, supported_features
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -1196,7 +1397,16 @@ class Entity(
         else:
             # Overwrite properties that have been set in the config file.
             if custom := customize.get(entity_id):
-                attr.update(custom)
+                attr = {**attr, **custom}
+
+        if (coalescer := self.__write_coalescer) is not None:
+            if (
+                coalesced_attr := self.__async_coalesce_write(
+                    coalescer, state, attr, time_now
+                )
+            ) is None:
+                return
+            attr = coalesced_attr
 
         if (
             self._context_set is not None
@@ -1223,6 +1433,62 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+    def __async_coalesce_write(
+        self,
+        coalescer: _WriteCoalescer,
+        state: str,
+        attr: dict[str, Any],
+        time_now: float,
+    ) -> dict[str, Any] | None:
+        """Coalesce a state write according to the write rate policy.
+
+        Returns None if the write is delayed, otherwise the attributes to write.
+        """
+        policy = coalescer.policy
+        if policy.track_min_max:
+            coalescer.track_value(state)
+
+        if (
+            elapsed := time_now - coalescer.last_write
+        ) < policy.interval and not self.__async_is_significant_write(state, attr):
+            if coalescer.timer is None:
+                coalescer.timer = self.hass.loop.call_later(
+                    policy.interval - elapsed, self.__async_write_coalesced
+                )
+            return None
+
+        coalescer.cancel()
+        coalescer.last_write = time_now
+        if policy.track_min_max and coalescer.min is not None:
+            attr = {
+                **attr,
+                ATTR_COALESCED_MIN: coalescer.min,
+                ATTR_COALESCED_MAX: coalescer.max,
+            }
+            coalescer.min = coalescer.max = None
+        return attr
+
+    def __async_is_significant_write(self, state: str, attr: dict[str, Any]) -> bool:
+        """Return if a state write is a significant change of the current state."""
+        if (old_state := self.hass.states.get(self.entity_id)) is None:
+            return True
+        if (
+            significant := significant_change.async_check_significant_change(
+                self.hass, old_state, state, attr
+            )
+        ) is None:
+            return state != old_state.state
+        return significant
+
+    @callback
+    def __async_write_coalesced(self) -> None:
+        """Write the latest state after writes have been delayed."""
+        if TYPE_CHECKING:
+            assert self.__write_coalescer is not None
+        self.__write_coalescer.timer = None
+        self.__write_coalescer.last_write = -math.inf
+        self._async_write_ha_state()
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -1460,6 +1726,11 @@ class Entity(
             "unrecorded_attributes": self.__combined_unrecorded_attributes
         }
 
+        if (write_rate_policy := self.write_rate_policy) is not None:
+            await significant_change.async_initialize(self.hass)
+            self.__write_coalescer = _WriteCoalescer(write_rate_policy)
+            self.async_on_remove(self.__write_coalescer.cancel)
+
         if self.registry_entry is not None:
             # This is an assert as it should never happen, but helps in tests
             assert (
@@ -50,7 +50,7 @@ from .issue_registry import IssueSeverity, async_create_issue
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
-    from .entity import Entity
+    from .entity import Entity, WriteRatePolicy
 
 
 SLOW_SETUP_WARNING = 10
@@ -153,6 +153,12 @@ class EntityPlatform:
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
 
+        # Policy to coalesce frequent state writes of the entities which do
+        # not have their own policy
+        self.write_rate_policy: WriteRatePolicy | None = getattr(
+            platform, "WRITE_RATE_POLICY", None
+        )
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -711,6 +717,9 @@ class EntityPlatform:
         if entity is None:
             raise ValueError("Entity cannot be None")
 
+        if entity.write_rate_policy is None:
+            entity.write_rate_policy = self.write_rate_policy
+
         entity.add_to_platform_start(
             self.hass,
             self,
@@ -11,10 +11,12 @@ timer.
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Container, Hashable, KeysView, Mapping
+from collections.abc import Callable, Container, Generator, Hashable, KeysView, Mapping
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from enum import StrEnum
 from functools import cached_property
+import gc
 import logging
 import time
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
@@ -153,15 +155,36 @@ DISPLAY_DICT_OPTIONAL = (
 )
 
 
+# Most entities have no options, they share the same read only options
+_EMPTY_OPTIONS: ReadOnlyEntityOptionsType = ReadOnlyDict({})
+
+
 def _protect_entity_options(
     data: EntityOptionsType | None,
 ) -> ReadOnlyEntityOptionsType:
     """Protect entity options from being modified."""
-    if data is None:
-        return ReadOnlyDict({})
+    if not data:
+        return _EMPTY_OPTIONS
     return ReadOnlyDict({key: ReadOnlyDict(val) for key, val in data.items()})
 
 
+@contextmanager
+def _pause_gc() -> Generator[None]:
+    """Pause the cyclic garbage collector.
+
+    Creating many registry entries triggers collections which walk all the
+    entries created so far, while none of them is garbage.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
 @attr.s(frozen=True)
 class RegistryEntry:
     """Entity Registry Entry."""
@@ -707,6 +730,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_key="id",
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1257,95 +1281,112 @@ class EntityRegistry(BaseRegistry):
         deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
 
         if data is not None:
-            for entity in data["entities"]:
-                try:
-                    domain = split_entity_id(entity["entity_id"])[0]
-                    _validate_item(
-                        self.hass,
-                        domain,
-                        entity["platform"],
-                        report_non_string_unique_id=False,
+            # Many entries have the same ids, units and timestamps, the
+            # entries share a single copy of them
+            strings: dict[str, str] = {}
+            timestamps: dict[str, datetime] = {}
+
+            def shared[_StrT: str | None](value: _StrT) -> _StrT:
+                if value is None:
+                    return value
+                return strings.setdefault(value, value)  # type: ignore[return-value]
+
+            def to_datetime(timestamp: str) -> datetime:
+                if (value := timestamps.get(timestamp)) is None:
+                    value = timestamps[timestamp] = datetime.fromisoformat(timestamp)
+                return value
+
+            # The entries are created without yielding to the event loop
+            with _pause_gc():
+                for entity in data["entities"]:
+                    try:
+                        domain = split_entity_id(entity["entity_id"])[0]
+                        _validate_item(
+                            self.hass,
+                            domain,
+                            entity["platform"],
+                            report_non_string_unique_id=False,
+                            unique_id=entity["unique_id"],
+                        )
+                    except (TypeError, ValueError) as err:
+                        report_issue = async_suggest_report_issue(
+                            self.hass, integration_domain=entity["platform"]
+                        )
+                        _LOGGER.error(
+                            (
+                                "Entity registry entry '%s' from integration %s could not "
+                                "be loaded: '%s', please %s"
+                            ),
+                            entity["entity_id"],
+                            entity["platform"],
+                            str(err),
+                            report_issue,
+                        )
+                        continue
+
+                    entities[entity["entity_id"]] = RegistryEntry(
+                        aliases=set(entity["aliases"]),
+                        area_id=shared(entity["area_id"]),
+                        categories=entity["categories"],
+                        capabilities=entity["capabilities"],
+                        config_entry_id=shared(entity["config_entry_id"]),
+                        created_at=to_datetime(entity["created_at"]),
+                        device_class=shared(entity["device_class"]),
+                        device_id=shared(entity["device_id"]),
+                        disabled_by=RegistryEntryDisabler(entity["disabled_by"])
+                        if entity["disabled_by"]
+                        else None,
+                        entity_category=EntityCategory(entity["entity_category"])
+                        if entity["entity_category"]
+                        else None,
+                        entity_id=entity["entity_id"],
+                        hidden_by=RegistryEntryHider(entity["hidden_by"])
+                        if entity["hidden_by"]
+                        else None,
+                        icon=entity["icon"],
+                        id=entity["id"],
+                        has_entity_name=entity["has_entity_name"],
+                        labels=set(entity["labels"]),
+                        modified_at=to_datetime(entity["modified_at"]),
+                        name=entity["name"],
+                        options=entity["options"],
+                        original_device_class=shared(entity["original_device_class"]),
+                        original_icon=entity["original_icon"],
+                        original_name=entity["original_name"],
+                        platform=shared(entity["platform"]),
+                        supported_features=entity["supported_features"],
+                        translation_key=shared(entity["translation_key"]),
                         unique_id=entity["unique_id"],
+                        previous_unique_id=entity["previous_unique_id"],
+                        unit_of_measurement=shared(entity["unit_of_measurement"]),
                     )
-                except (TypeError, ValueError) as err:
-                    report_issue = async_suggest_report_issue(
-                        self.hass, integration_domain=entity["platform"]
-                    )
-                    _LOGGER.error(
-                        (
-                            "Entity registry entry '%s' from integration %s could not "
-                            "be loaded: '%s', please %s"
-                        ),
-                        entity["entity_id"],
+                for entity in data["deleted_entities"]:
+                    try:
+                        domain = split_entity_id(entity["entity_id"])[0]
+                        _validate_item(
+                            self.hass,
+                            domain,
+                            entity["platform"],
+                            report_non_string_unique_id=False,
+                            unique_id=entity["unique_id"],
+                        )
+                    except (TypeError, ValueError):
+                        continue
+                    key = (
+                        split_entity_id(entity["entity_id"])[0],
                         entity["platform"],
-                        str(err),
-                        report_issue,
+                        entity["unique_id"],
                     )
-                    continue
-
-                entities[entity["entity_id"]] = RegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    categories=entity["categories"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
-                    disabled_by=RegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
-                    else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
-                    else None,
-                    entity_id=entity["entity_id"],
-                    hidden_by=RegistryEntryHider(entity["hidden_by"])
-                    if entity["hidden_by"]
-                    else None,
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    has_entity_name=entity["has_entity_name"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
-                    supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
-                    unique_id=entity["unique_id"],
-                    previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
-                )
-            for entity in data["deleted_entities"]:
-                try:
-                    domain = split_entity_id(entity["entity_id"])[0]
-                    _validate_item(
-                        self.hass,
-                        domain,
-                        entity["platform"],
-                        report_non_string_unique_id=False,
+                    deleted_entities[key] = DeletedRegistryEntry(
+                        config_entry_id=shared(entity["config_entry_id"]),
+                        created_at=to_datetime(entity["created_at"]),
+                        entity_id=entity["entity_id"],
+                        id=entity["id"],
+                        modified_at=to_datetime(entity["modified_at"]),
+                        orphaned_timestamp=entity["orphaned_timestamp"],
+                        platform=shared(entity["platform"]),
                         unique_id=entity["unique_id"],
                     )
-                except (TypeError, ValueError):
-                    continue
-                key = (
-                    split_entity_id(entity["entity_id"])[0],
-                    entity["platform"],
-                    entity["unique_id"],
-                )
-                deleted_entities[key] = DeletedRegistryEntry(
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    entity_id=entity["entity_id"],
-                    id=entity["id"],
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    orphaned_timestamp=entity["orphaned_timestamp"],
-                    platform=entity["platform"],
-                    unique_id=entity["unique_id"],
-                )
 
         self.deleted_entities = deleted_entities
         self.entities = entities
@@ -57,12 +57,9 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
+_TRACK_STATE_CHANGE_DATA: HassKey[_EntityKeyedEventData] = HassKey(
     "track_state_change_data"
 )
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
 _TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
     HassKey("track_state_added_domain_data")
 )
@@ -125,6 +122,14 @@ class _KeyedEventData(Generic[_TypedDictT]):
     callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
 
 
+@dataclass(slots=True, frozen=True)
+class _EntityKeyedEventData:
+    """Class to track data for state change events indexed by the bus."""
+
+    listeners: dict[str, CALLBACK_TYPE]
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]]
+
+
 @dataclass(slots=True)
 class TrackStates:
     """Class for keeping track of states being tracked.
@@ -359,21 +364,22 @@ def _async_dispatch_entity_id_event(
 
 
 @callback
-def _async_state_filter(
+def _remove_state_change_listener(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
+    entity_ids: Iterable[str],
+    job: HassJob[[Event[EventStateChangedData]], Any],
+    track_data: _EntityKeyedEventData,
+) -> None:
+    """Remove a state change listener."""
+    callbacks = track_data.callbacks
+    for entity_id in entity_ids:
+        callbacks[entity_id].remove(job)
+        if not callbacks[entity_id]:
+            del callbacks[entity_id]
+            track_data.listeners.pop(entity_id)()
 
-_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
-)
+    if not callbacks:
+        del hass.data[_TRACK_STATE_CHANGE_DATA]
 
 
 @bind_hass
@@ -383,18 +389,39 @@ def _async_track_state_change_event(
     action: Callable[[Event[EventStateChangedData]], Any],
     job_type: HassJobType | None,
 ) -> CALLBACK_TYPE:
-    """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
-    )
+    """async_track_state_change_event without lowercasing.
 
+    Each tracked entity_id gets a single listener in the entity_id index
+    of the bus which dispatches to all jobs tracking that entity_id.
+    """
+    hass_data = hass.data
+    if (track_data := hass_data.get(_TRACK_STATE_CHANGE_DATA)) is None:
+        track_data = _EntityKeyedEventData({}, {})
+        hass_data[_TRACK_STATE_CHANGE_DATA] = track_data
+    callbacks = track_data.callbacks
+    listeners = track_data.listeners
+
+    job = HassJob(action, f"track state_changed event {entity_ids}", job_type=job_type)
+
+    if isinstance(entity_ids, str):
+        entity_ids = (entity_ids,)
+    for entity_id in entity_ids:
+        if (entity_callbacks := callbacks.get(entity_id)) is not None:
+            entity_callbacks.append(job)
+            continue
+        callbacks[entity_id] = [job]
+        listeners[entity_id] = hass.bus.async_listen_entity(
+            EVENT_STATE_CHANGED,
+            entity_id,
+            partial(
+                _async_dispatch_entity_id_event_soon,
+                hass,
+                callbacks,  # type: ignore[arg-type]
+            ),
+            HassJobType.Callback,
+        )
 
-_KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
-    event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
-)
+    return partial(_remove_state_change_listener, hass, entity_ids, job, track_data)
 
 
 def async_track_state_report_event(
@@ -404,8 +431,10 @@ def async_track_state_report_event(
     job_type: HassJobType | None = None,
 ) -> CALLBACK_TYPE:
     """Track EVENT_STATE_REPORTED by entity_id without lowercasing."""
-    return _async_track_event(
-        _KEYED_TRACK_STATE_REPORT, hass, entity_ids, action, job_type
+    if not entity_ids:
+        return _remove_empty_listener
+    return hass.bus.async_listen_entity(
+        EVENT_STATE_REPORTED, entity_ids, action, job_type
     )
 
 
@@ -999,6 +1028,11 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        # The states read by the last render of templates which only depend
+        # on specific entities, used to skip re-renders when they did not change.
+        # Keyed by the id of the TrackTemplate as equal templates can be tracked
+        # more than once.
+        self._read_states: dict[int, dict[str, State | None]] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -1022,6 +1056,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._record_read_states(super_template, info)
 
             # If the super template did not render to True, don't update other templates
             try:
@@ -1043,6 +1078,7 @@ class TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._record_read_states(track_template_, info)
 
             if info.exception:
                 if not log_fn:
@@ -1121,6 +1157,51 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _record_read_states(
+        self, track_template_: TrackTemplate, info: RenderInfo
+    ) -> None:
+        """Remember the states read by a render of a template."""
+        if (
+            info.exception
+            or info.has_time
+            or info.all_states
+            or info.all_states_lifecycle
+            or info.domains
+            or info.domains_lifecycle
+        ):
+            self._read_states.pop(id(track_template_), None)
+            return
+        get_state = self.hass.states.get
+        self._read_states[id(track_template_)] = {
+            entity_id: get_state(entity_id) for entity_id in info.entities
+        }
+
+    @callback
+    def _read_states_unchanged(
+        self, track_template_: TrackTemplate, info: RenderInfo
+    ) -> bool:
+        """Return if the states read by the last render did not change value.
+
+        The state objects are compared by identity, except for entities of
+        which the template only read the state value.
+        """
+        if (read_states := self._read_states.get(id(track_template_))) is None:
+            return False
+        get_state = self.hass.states.get
+        state_only = info.entities_state_only
+        for entity_id, old_state in read_states.items():
+            if (new_state := get_state(entity_id)) is old_state:
+                continue
+            if (
+                new_state is None
+                or old_state is None
+                or entity_id not in state_only
+                or new_state.state != old_state.state
+            ):
+                return False
+        return True
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1145,6 +1226,14 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if self._read_states_unchanged(track_template_, info):
+                _LOGGER.debug(
+                    "Template update %s skipped, inputs unchanged by event: %s",
+                    template.template,
+                    event,
+                )
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1168,6 +1257,7 @@ class TrackTemplateResultInfo:
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._record_read_states(track_template_, info)
 
         try:
             result: str | TemplateError = info.result()
@@ -38,9 +38,11 @@ from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.util.hass_dict import HassKey
 
 from .integration_platform import async_process_integration_platforms
+from .singleton import singleton
 
 PLATFORM = "significant_change"
 DATA_FUNCTIONS: HassKey[dict[str, CheckTypeFunc]] = HassKey("significant_change")
+_DATA_INITIALIZED = "significant_change_initialized"
 type CheckTypeFunc = Callable[
     [
         HomeAssistant,
@@ -86,16 +88,17 @@ async def create_checker(
     extra_significant_check: ExtraCheckTypeFunc | None = None,
 ) -> SignificantlyChangedChecker:
     """Create a significantly changed checker for a domain."""
-    await _initialize(hass)
+    await async_initialize(hass)
     return SignificantlyChangedChecker(hass, extra_significant_check)
 
 
-# Marked as singleton so multiple calls all wait for same output.
-async def _initialize(hass: HomeAssistant) -> None:
-    """Initialize the functions."""
-    if DATA_FUNCTIONS in hass.data:
-        return
+@singleton(_DATA_INITIALIZED)
+async def async_initialize(hass: HomeAssistant) -> None:
+    """Initialize the functions.
 
+    Marked as singleton so all callers wait until the significant_change
+    platforms of the loaded integrations have been processed.
+    """
     functions = hass.data[DATA_FUNCTIONS] = {}
 
     @callback
@@ -110,6 +113,36 @@ async def _initialize(hass: HomeAssistant) -> None:
     await async_process_integration_platforms(hass, PLATFORM, process_platform)
 
 
+@callback
+def async_check_significant_change(
+    hass: HomeAssistant,
+    old_state: State,
+    new_state: str,
+    new_attrs: dict[str, Any],
+) -> bool | None:
+    """Test if a new state of an entity is a significant change of old_state.
+
+    Returns None if the integration of the entity domain does not know.
+    async_initialize must have been called before.
+    """
+    # Handle state unknown or unavailable
+    if new_state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        return new_state != old_state.state
+
+    # If last state was unknown/unavailable, also significant.
+    if old_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        return True
+
+    if (
+        check_significantly_changed := hass.data[DATA_FUNCTIONS].get(old_state.domain)
+    ) is None:
+        return None
+
+    return check_significantly_changed(
+        hass, old_state.state, old_state.attributes, new_state, new_attrs
+    )
+
+
 def either_one_none(val1: Any | None, val2: Any | None) -> bool:
     """Test if exactly one value is None."""
     return (val1 is None and val2 is not None) or (val1 is not None and val2 is None)
@@ -7,12 +7,13 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 from functools import cached_property
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -33,8 +34,10 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
+from .json import json_bytes, json_fragment
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -48,6 +51,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the stored file when it is larger than
+# this ratio of the stored file
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +234,11 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+def _item_digest(item_bytes: bytes) -> bytes:
+    """Return the digest identifying a serialized item in a journaled store."""
+    return hashlib.blake2b(item_bytes, digest_size=16).digest()
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +254,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_key: str | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal_key is set, the data must be a dict of lists of items
+        identified by their journal_key value. Delayed saves then append
+        the changed and removed items to a journal instead of rewriting
+        the whole file.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +278,27 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal_key = journal_key
+        # List name -> digest of serialized item -> item id, as written to disk
+        self._journaled_items: dict[str, dict[bytes, Any]] | None = None
+        # Object id -> fragment and its digest, fragments are immutable and
+        # most of them are saved again unchanged
+        self._journaled_fragments: dict[int, tuple[json_fragment, bytes]] = {}
+        self._journal_id: str | None = None
+        self._journal_size = 0
+        self._file_size = 0
+        self._compact_journal = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal of changes since the last full write."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -325,6 +360,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal_key is not None:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +424,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal_key is not None:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -420,6 +460,47 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    def _replay_journal(self, data: dict[str, Any]) -> None:
+        """Apply the changes journaled since the last full write to data."""
+        try:
+            with open(self.journal_path, "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        journal_key = cast(str, self._journal_key)
+        stored: dict[str, list[dict[str, Any]]] = data["data"]
+        items_by_list: dict[str, dict[Any, dict[str, Any]]] = {}
+
+        def _items(name: str) -> dict[Any, dict[str, Any]]:
+            if (items := items_by_list.get(name)) is None:
+                items = items_by_list[name] = {
+                    item[journal_key]: item for item in stored.get(name, ())
+                }
+            return items
+
+        for line in lines:
+            try:
+                change: dict[str, Any] = json_util.json_loads_object(line)
+            except ValueError:
+                # Only the last change can be incomplete
+                _LOGGER.warning("Ignoring incomplete change in %s", self.journal_path)
+                break
+            if change["journal_id"] != data.get("journal_id"):
+                # Left over from before the last full write
+                break
+            for name, upserted in change["upsert"].items():
+                items = _items(name)
+                for item in upserted:
+                    items[item[journal_key]] = item
+            for name, deleted in change["delete"].items():
+                items = _items(name)
+                for item_id in deleted:
+                    items.pop(item_id, None)
+
+        for name, items in items_by_list.items():
+            stored[name] = list(items.values())
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -517,6 +598,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        # Leave a file readable without the journal behind
+        self._compact_journal = True
+        if self._data is None and self._journal_size and not self._read_only:
+            async with self._write_lock:
+                if self._data is None and self._journal_size:
+                    await self.hass.async_add_executor_job(self._write_journaled_data)
+                    return
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -524,7 +612,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         async with self._write_lock:
             self._manager.async_invalidate(self.key)
             self._async_cleanup_delay_listener()
-            self._async_cleanup_final_write_listener()
+            if not self._journal_size:
+                # A journal is compacted into the file at shutdown
+                self._async_cleanup_final_write_listener()
 
             if self._data is None:
                 # Another write already consumed the data
@@ -541,6 +631,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal_size:
+                self._async_ensure_final_write_listener()
+            else:
+                self._async_cleanup_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -548,9 +643,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
-        if "data_func" in data:
+        delayed = "data_func" in data
+        if delayed:
             data["data"] = data.pop("data_func")()
 
+        if self._journal_key is not None:
+            compact = self._compact_journal
+            self._compact_journal = False
+            if delayed and not compact and self._append_journal(data):
+                return
+            data["journal_id"] = ulid_now()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +663,139 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal_key is not None:
+            self._reset_journal(path, data)
+
+    def _write_journaled_data(self) -> None:
+        """Write the stored file with the journaled changes applied."""
+        try:
+            data = json_util.load_json(self.path)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error compacting the journal of %s: %s", self.key, err)
+            return
+        if not isinstance(data, dict) or not isinstance(data.get("data"), dict):
+            return
+        self._replay_journal(data)
+        try:
+            self._write_data(self.path, data)
+        except (json_util.SerializationError, WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
+    def _append_journal(self, data: dict) -> bool:
+        """Append the items changed since the last write to the journal.
+
+        Return False if the whole file must be written instead.
+        """
+        if (
+            (journaled_items := self._journaled_items) is None
+            or self._journal_size > self._file_size * JOURNAL_COMPACT_RATIO
+            or not isinstance(stored := data["data"], dict)
+            or stored.keys() != journaled_items.keys()
+        ):
+            return False
+
+        journal_key = cast(str, self._journal_key)
+        upsert: dict[str, list[json_fragment]] = {}
+        delete: dict[str, list[Any]] = {}
+        new_journaled_items: dict[str, dict[bytes, Any]] = {}
+        fragments = self._journaled_fragments
+        new_fragments: dict[int, tuple[json_fragment, bytes]] = {}
+        try:
+            for name, items in stored.items():
+                if not isinstance(items, list):
+                    return False
+                previous = journaled_items[name]
+                current = new_journaled_items[name] = {}
+                changed: list[json_fragment] = []
+                for item in items:
+                    item_bytes: bytes | None = None
+                    if type(item) is not json_fragment:
+                        item_bytes = json_bytes(item)
+                        digest = _item_digest(item_bytes)
+                    elif (fragment := fragments.get(id(item))) is not None:
+                        digest = fragment[1]
+                        new_fragments[id(item)] = fragment
+                    else:
+                        item_bytes = json_bytes(item)
+                        digest = _item_digest(item_bytes)
+                        new_fragments[id(item)] = (item, digest)
+                    if (item_id := previous.get(digest)) is None:
+                        if item_bytes is None:
+                            item_bytes = json_bytes(item)
+                        item_id = json_util.json_loads_object(item_bytes)[journal_key]
+                        changed.append(json_fragment(item_bytes))
+                    current[digest] = item_id
+                if changed:
+                    upsert[name] = changed
+                item_ids = set(current.values())
+                if deleted := [
+                    item_id for item_id in previous.values() if item_id not in item_ids
+                ]:
+                    delete[name] = deleted
+        except (TypeError, KeyError):
+            # Let the full write report unserializable data
+            return False
+
+        self._journaled_items = new_journaled_items
+        self._journaled_fragments = new_fragments
+        if not upsert and not delete:
+            return True
+
+        change = json_bytes(
+            {
+                "journal_id": self._journal_id,
+                "upsert": upsert,
+                "delete": delete,
+            }
+        )
+        _LOGGER.debug("Journaling changes for %s to %s", self.key, self.journal_path)
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, change + b"\n")
+                if self._atomic_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            # The journal may be missing the change, write the whole file
+            _LOGGER.error("Failed to journal changes for %s: %s", self.key, err)
+            self._journaled_items = None
+            return False
+        self._journal_size += len(change) + 1
+        return True
+
+    def _reset_journal(self, path: str, data: dict) -> None:
+        """Start a new journal after writing the whole file."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_id = data["journal_id"]
+        self._journal_size = 0
+        self._file_size = os.path.getsize(path)
+        self._journaled_items = None
+        stored = data["data"]
+        if not isinstance(stored, dict) or not all(
+            isinstance(items, list) for items in stored.values()
+        ):
+            return
+        journal_key = cast(str, self._journal_key)
+        journaled_items: dict[str, dict[bytes, Any]] = {}
+        fragments: dict[int, tuple[json_fragment, bytes]] = {}
+        for name, items in stored.items():
+            journaled = journaled_items[name] = {}
+            for item in items:
+                item_bytes = json_bytes(item)
+                digest = _item_digest(item_bytes)
+                if type(item) is json_fragment:
+                    fragments[id(item)] = (item, digest)
+                journaled[digest] = json_util.json_loads_object(item_bytes)[journal_key]
+        self._journaled_items = journaled_items
+        self._journaled_fragments = fragments
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +808,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_key is not None:
+            self._journaled_items = None
+            self._journal_size = 0
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
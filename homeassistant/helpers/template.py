@@ -24,7 +24,6 @@ import sys
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -122,6 +121,9 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# Properties of a state which only depend on the state value or the entity_id
+_STATE_VALUE_ATTRIBUTES = {"state", "domain", "object_id"}
+
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
 
@@ -150,11 +152,23 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+#
+# CACHED_COMPILED_TEMPLATES is the number of compiled templates kept
+# in memory by source. Templates are compiled once for the process and
+# every Template object with the same source shares the compiled code.
+#
+CACHED_COMPILED_TEMPLATES = 4096
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+# Compiled code is keyed by the kind of environment it was compiled with and
+# the source, see TemplateEnvironment.compile_key
+COMPILED_TEMPLATE_LRU: LRU[tuple[tuple[bool, bool, bool, bool], str], CodeType] = LRU(
+    CACHED_COMPILED_TEMPLATES
+)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -180,6 +194,17 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+def compiled_template_cache_stats() -> dict[str, int]:
+    """Return the statistics of the compiled template cache."""
+    hits, misses = COMPILED_TEMPLATE_LRU.get_stats()
+    return {
+        "hits": hits,
+        "misses": misses,
+        "size": len(COMPILED_TEMPLATE_LRU),
+        "max_size": COMPILED_TEMPLATE_LRU.get_size(),
+    }
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -383,6 +408,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entities_state_only",
         "rate_limit",
         "has_time",
     )
@@ -401,6 +427,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which only the state value was read, collected
+        # separately during the render and merged into entities once frozen
+        self.entities_state_only: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -455,7 +484,8 @@ class RenderInfo:
         self.all_states = False
 
     def _freeze_sets(self) -> None:
-        self.entities = frozenset(self.entities)
+        self.entities_state_only = frozenset(self.entities_state_only - self.entities)
+        self.entities = frozenset(self.entities | self.entities_state_only)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -565,14 +595,15 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        env = self._env
+        if compiled := COMPILED_TEMPLATE_LRU.get((env.compile_key, self.template)):
             self._compiled_code = compiled
             return
 
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
-                self._compiled_code = self._env.compile(self.template)
+                self._compiled_code = env.compile(self.template)
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
 
@@ -826,8 +857,6 @@ class Template:
         log_fn: Callable[[int, str], None] | None = None,
     ) -> jinja2.Template:
         """Bind a template to a specific hass instance."""
-        self.ensure_valid()
-
         assert self.hass is not None, "hass variable not set on template"
         assert (
             self._limited is None or self._limited == limited
@@ -839,11 +868,14 @@ class Template:
         assert (
             self._log_fn is None or self._log_fn == log_fn
         ), "can't change custom log function"
-        assert self._compiled_code is not None, "template code was not compiled"
 
         self._limited = limited
         self._strict = strict
         self._log_fn = log_fn
+        # Compile with the environment the template is rendered with, the
+        # filters and tests available at compile time differ between them
+        self.ensure_valid()
+        assert self._compiled_code is not None, "template code was not compiled"
         env = self._env
 
         self._compiled = jinja2.Template.from_code(
@@ -1040,6 +1072,10 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_state_value(self) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entities_state_only.add(self._entity_id)  # type: ignore[attr-defined]
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
@@ -1047,7 +1083,10 @@ class TemplateStateBase(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item in _STATE_VALUE_ATTRIBUTES:
+                    render_info.entities_state_only.add(self._entity_id)  # type: ignore[attr-defined]
+                else:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1066,7 +1105,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
@@ -1102,13 +1141,13 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.object_id
 
     @property
@@ -2846,9 +2885,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        # The kind of environment, code compiled by environments of the same
+        # kind is shared through COMPILED_TEMPLATE_LRU
+        self.compile_key = (
+            hass is None,
+            bool(limited),
+            bool(strict),
+            log_fn is not None,
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3202,7 +3246,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        if isinstance(source, str):
+            COMPILED_TEMPLATE_LRU[(self.compile_key, source)] = compiled
         return compiled
 
 
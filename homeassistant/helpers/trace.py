@@ -14,6 +14,8 @@ import homeassistant.util.dt as dt_util
 
 from .typing import TemplateVarsType
 
+_MISSING = object()
+
 
 class TraceElement:
     """Container for trace data."""
@@ -66,17 +68,37 @@ class TraceElement:
         self._result = {**old_result, **kwargs}
 
     def update_variables(self, variables: TemplateVarsType) -> None:
-        """Update variables."""
+        """Update variables.
+
+        Only a shallow copy of the variables is kept, the changed variables
+        are found when the trace is serialized. The copy of the last
+        variables is reused when no variable was set to another object.
+        """
         if variables is None:
             variables = {}
         last_variables = self._last_variables
-        variables_cv.set(dict(variables))
-        changed_variables = {
+        if len(variables) == len(last_variables):
+            for key, value in variables.items():
+                if last_variables.get(key, _MISSING) is not value:
+                    break
+            else:
+                self._variables = last_variables
+                variables_cv.set(last_variables)
+                return
+        self._variables = dict(variables)
+        variables_cv.set(self._variables)
+
+    def _changed_variables(self) -> dict[str, Any]:
+        """Return the variables changed compared to the last variables."""
+        last_variables = self._last_variables
+        return {
             key: value
-            for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            for key, value in self._variables.items()
+            if key not in last_variables
+            or (
+                (last_value := last_variables[key]) is not value and last_value != value
+            )
         }
-        self._variables = changed_variables
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
@@ -88,8 +110,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self._changed_variables():
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error) or self._error.__class__.__name__
         if self._result is not None:
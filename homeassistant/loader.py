@@ -16,7 +16,9 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,7 +31,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -132,6 +134,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -651,6 +657,129 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+def _read_manifest(
+    manifest_path: pathlib.Path,
+) -> tuple[Manifest, set[str] | None] | None:
+    """Read a manifest and the top level files of its integration.
+
+    Returns None if the manifest does not exist.
+    """
+    if not manifest_path.is_file():
+        return None
+    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+    # Avoid the listdir for virtual integrations
+    # as they cannot have any platforms
+    if manifest.get("integration_type") == "virtual":
+        return manifest, None
+    return manifest, set(os.listdir(manifest_path.parent))
+
+
+class ManifestCache:
+    """Persist the manifests of integrations between restarts.
+
+    A cached manifest and the top level files of its integration are
+    reused as long as the modification times of the manifest and of the
+    integration directory did not change, which only needs two stat calls
+    instead of reading and parsing the manifest and listing the directory.
+    The cache is dropped when the version of Home Assistant changes.
+
+    Manifests are read from the executor, the lock guards the entries
+    against the event loop serializing them for saving.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        # Path of the integration -> manifest mtime, directory mtime,
+        # manifest and top level files
+        self._entries: dict[str, list[Any]] = {}
+        self._lock = threading.Lock()
+        self._save_scheduled = False
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the manifests cached for this version of Home Assistant."""
+        if (data := await self._store.async_load()) is not None and data.get(
+            "version"
+        ) == __version__:
+            self._entries = data["integrations"]
+
+    def read_manifest(
+        self, manifest_path: pathlib.Path
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Read a manifest and the top level files of its integration.
+
+        Returns None if the manifest does not exist.
+        """
+        file_path = manifest_path.parent
+        key = str(file_path)
+        try:
+            manifest_stat = manifest_path.stat()
+            dir_stat = file_path.stat()
+        except OSError:
+            manifest_stat = None
+        if manifest_stat is None or not stat.S_ISREG(manifest_stat.st_mode):
+            with self._lock:
+                if self._entries.pop(key, None) is not None:
+                    self._async_schedule_save_threadsafe()
+            return None
+
+        mtimes = [manifest_stat.st_mtime_ns, dir_stat.st_mtime_ns]
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None and entry[:2] == mtimes:
+                self.hits += 1
+                files: list[str] | None = entry[3]
+                # The integration adds keys to its manifest
+                manifest = cast(Manifest, dict(entry[2]))
+                return manifest, None if files is None else set(files)
+            self.misses += 1
+
+        if (manifest_and_files := _read_manifest(manifest_path)) is None:
+            return None
+        manifest, top_level_files = manifest_and_files
+        with self._lock:
+            self._entries[key] = [
+                *mtimes,
+                dict(manifest),
+                None if top_level_files is None else sorted(top_level_files),
+            ]
+            self._async_schedule_save_threadsafe()
+        return manifest_and_files
+
+    def _async_schedule_save_threadsafe(self) -> None:
+        """Schedule saving the cache, the lock must be held."""
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        with self._lock:
+            self._save_scheduled = False
+            return {"version": __version__, "integrations": self._entries.copy()}
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> ManifestCache:
+    """Load the persisted manifest cache and use it to resolve integrations."""
+    manifest_cache = ManifestCache(hass)
+    await manifest_cache.async_load()
+    hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+    return manifest_cache
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -659,30 +788,29 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is not None:
+            read_manifest = manifest_cache.read_manifest
+        else:
+            read_manifest = _read_manifest
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if (manifest_and_files := read_manifest(manifest_path)) is None:
+                    continue
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            manifest, top_level_files = manifest_and_files
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
-                file_path,
+                manifest_path.parent,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
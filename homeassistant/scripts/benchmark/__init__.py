@@ -6,49 +6,174 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import json
 import logging
+import os
+import pathlib
+import platform
+import sys
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
-
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from types import MappingProxyType
+
+from homeassistant import bootstrap, config_entries, core, loader
+from homeassistant.auth.models import RefreshToken, User
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
+    __version__,
+)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_template_result,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.recorder import async_initialize_recorder
+from homeassistant.helpers.template import Template
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
 
 BENCHMARKS: dict[str, Callable] = {}
 
+_LOGGER = logging.getLogger(__name__)
+
+# Number of runs of each benchmark when the results are saved or compared
+DEFAULT_RUNS = 3
+
+# Database the recorder benchmarks write to, set with --db-url, a temporary
+# SQLite database is used by default
+RECORDER_DB_URL: str | None = None
+
 
 def run(args):
     """Handle benchmark commandline script."""
     # Disable logging
+    logging.getLogger("homeassistant").setLevel(logging.WARNING)
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("name", choices=[*BENCHMARKS, "all"])
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=0,
+        help=(
+            "Number of runs of each benchmark, by default a single benchmark "
+            f"runs until interrupted, otherwise {DEFAULT_RUNS} runs"
+        ),
+    )
+    parser.add_argument(
+        "--json", metavar="PATH", help="Write the results as JSON to PATH"
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Compare the results with a baseline written with --json",
+    )
+    parser.add_argument(
+        "--db-url",
+        metavar="URL",
+        help=(
+            "Database URL the recorder benchmarks write to, for example a "
+            "MariaDB or PostgreSQL database, instead of a temporary SQLite database"
+        ),
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10,
+        help="Percentage slower than the baseline which is a regression",
+    )
 
     args = parser.parse_args()
 
-    bench = BENCHMARKS[args.name]
+    global RECORDER_DB_URL  # noqa: PLW0603
+    RECORDER_DB_URL = args.db_url
+
+    names = list(BENCHMARKS) if args.name == "all" else [args.name]
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
 
-    with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
+    runs = args.runs
+    if not runs and len(names) == 1 and not args.json and not args.compare:
+        with suppress(KeyboardInterrupt):
+            while True:
+                asyncio.run(run_benchmark(BENCHMARKS[names[0]]))
+        return 0
+
+    results = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "benchmarks": {
+            name: _summarize(
+                [
+                    asyncio.run(run_benchmark(BENCHMARKS[name]))
+                    for _ in range(runs or DEFAULT_RUNS)
+                ]
+            )
+            for name in names
+        },
+    }
+
+    if args.json:
+        pathlib.Path(args.json).write_text(
+            json.dumps(results, indent=2), encoding="utf-8"
+        )
+
+    if args.compare:
+        baseline = json.loads(pathlib.Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare_results(baseline, results, args.threshold)
+        return 1 if regressions else 0
+
+    return 0
+
+
+def _summarize(runtimes: list[float]) -> dict[str, float | list[float]]:
+    """Summarize the runtimes of a benchmark."""
+    return {
+        "runs": runtimes,
+        "best": min(runtimes),
+        "mean": sum(runtimes) / len(runtimes),
+    }
+
+
+def compare_results(baseline: dict, results: dict, threshold: float) -> list[str]:
+    """Print the results compared to a baseline and return the regressions.
+
+    The best runtimes are compared, they are the least affected by noise.
+    """
+    regressions = []
+    print(f"Compared to {baseline['version']} (Python {baseline['python']}):")
+    for name, result in results["benchmarks"].items():
+        if (base_result := baseline["benchmarks"].get(name)) is None:
+            print(f"  {name}: {result['best']:.4f}s (not in baseline)")
+            continue
+        change = (result["best"] - base_result["best"]) / base_result["best"] * 100
+        regression = change > threshold
+        print(
+            f"  {name}: {result['best']:.4f}s vs {base_result['best']:.4f}s "
+            f"({change:+.1f}%){' REGRESSION' if regression else ''}"
+        )
+        if regression:
+            regressions.append(name)
+    return regressions
 
 
 async def run_benchmark(bench):
-    """Run a benchmark."""
+    """Run a benchmark and return its runtime."""
     hass = core.HomeAssistant("")
     runtime = await bench(hass)
     print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
+    return runtime
 
 
 def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
@@ -308,3 +433,533 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+async def _recorder_write_states(
+    hass: core.HomeAssistant, bulk_insert: bool, in_memory: bool = False
+) -> float:
+    """Record 100k state changes of 1000 entities and return the write time.
+
+    The states are written to the database set with --db-url, unless
+    in_memory is set.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder
+
+    entity_id = "sensor.benchmark"
+    with TemporaryDirectory() as db_dir:
+        async_initialize_recorder(hass)
+        instance = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=1,
+            commit_interval=1,
+            uri="sqlite://"
+            if in_memory
+            else RECORDER_DB_URL or f"sqlite:///{db_dir}/benchmark.db",
+            db_max_retries=10,
+            db_retry_wait=3,
+            entity_filter=None,
+            exclude_event_types=set(),
+            bulk_insert=bulk_insert,
+        )
+        instance.async_initialize()
+        instance.async_register()
+        instance.start()
+        await hass.async_start()
+        await instance.async_db_ready
+        await instance.async_block_till_done()
+
+        start = timer()
+        for idx in range(10**5):
+            hass.states.async_set(
+                f"{entity_id}{idx % 1000}", str(idx), {"unit_of_measurement": "W"}
+            )
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        runtime = timer() - start
+
+        await hass.async_stop()
+        await hass.async_add_executor_job(instance.join)
+    return runtime
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 100k state changes through the ORM unit of work."""
+    return await _recorder_write_states(hass, False)
+
+
+@benchmark
+async def recorder_bulk_write_states(hass):
+    """Record 100k state changes with executemany bulk inserts."""
+    return await _recorder_write_states(hass, True)
+
+
+@benchmark
+async def recorder_write_states_in_memory(hass):
+    """Record 100k state changes in an in-memory SQLite database."""
+    return await _recorder_write_states(hass, False, True)
+
+
+@benchmark
+async def track_template_results(hass):
+    """Re-render templates of 1000 template trackers for 100k state changes."""
+    count = 0
+    entity_id = "sensor.benchmark"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle template result."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.states.async_set(f"{entity_id}{idx}", "0")
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    Template(
+                        f"{{{{ states('{entity_id}{idx}') | float(0) > 50 }}}}", hass
+                    ),
+                    None,
+                )
+            ],
+            listener,
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.states.async_set(f"{entity_id}{idx % 1000}", str(idx % 100))
+    await hass.async_block_till_done()
+
+    assert count
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_subscribe_entities(hass):
+    """Fan out 10k state changes to 100 subscribe_entities connections."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import async_register_command
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import (
+        handle_subscribe_entities,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.http import WebSocketAdapter
+
+    count = 0
+    entity_id = "light.benchmark"
+    events_to_fire = 10**4
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    refresh_token = RefreshToken(
+        user=user, client_id=None, access_token_expiration=timedelta(minutes=30)
+    )
+
+    @core.callback
+    def send_message(message):
+        """Handle a message sent to the connection."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.states.async_set(f"{entity_id}{idx}", "off")
+
+    async_register_command(hass, handle_subscribe_entities)
+    for idx in range(100):
+        connection = ActiveConnection(
+            WebSocketAdapter(_LOGGER, {"connid": idx}),
+            hass,
+            send_message,
+            user,
+            refresh_token,
+        )
+        connection.async_handle({"id": 1, "type": "subscribe_entities"})
+    count = 0
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.states.async_set(
+            f"{entity_id}{idx % 1000}", "on" if idx % 2000 < 1000 else "off"
+        )
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire * 100
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_dispatch(hass):
+    """Dispatch 100k MQTT messages to 1000 simple and 101 wildcard subscriptions.
+
+    The messages are sent to more distinct topics than the match cache holds,
+    most of them match a wildcard subscription, so the topic trie is used.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttData
+
+    count = 0
+    messages_to_dispatch = 10**5
+    config_entry = config_entries.ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain="mqtt",
+        minor_version=1,
+        options={},
+        source=config_entries.SOURCE_USER,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+    mqtt_client = MQTT(hass, config_entry, {})
+    # The client is not started, only the data used by received messages is set
+    mqtt_client._mqtt_data = MqttData(client=mqtt_client, config=[])  # noqa: SLF001
+
+    @core.callback
+    def msg_callback(msg):
+        """Handle a message."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        mqtt_client.async_subscribe(
+            f"benchmark/device{idx}/state", msg_callback, 0, "utf-8"
+        )
+    for idx in range(100):
+        mqtt_client.async_subscribe(
+            f"benchmark/device{idx}/+/set", msg_callback, 0, "utf-8"
+        )
+    mqtt_client.async_subscribe("benchmark/+/availability", msg_callback, 0, "utf-8")
+
+    topics = []
+    for idx in range(5000):
+        topics.append(f"benchmark/device{idx}/availability")
+        topics.append(f"benchmark/device{idx % 100}/attribute{idx // 100}/set")
+        if idx < 1000:
+            topics.append(f"benchmark/device{idx}/state")
+    messages = []
+    for topic in topics:
+        msg = MQTTMessage(topic=topic.encode())
+        msg.payload = b"on"
+        messages.append(msg)
+
+    start = timer()
+
+    for idx in range(messages_to_dispatch):
+        mqtt_client._async_mqtt_on_message(  # noqa: SLF001
+            None, None, messages[idx % len(messages)]
+        )
+
+    assert count == messages_to_dispatch
+
+    runtime = timer() - start
+    mqtt_client.cleanup()
+    return runtime
+
+
+class _BenchmarkEntity(Entity):
+    """Entity which is written to the state machine."""
+
+    _attr_should_poll = False
+
+    def __init__(self, idx: int) -> None:
+        """Initialize the entity."""
+        self._attr_name = f"Benchmark {idx}"
+        self._attr_unique_id = f"benchmark_{idx}"
+        self._attr_extra_state_attributes = {"index": idx}
+
+
+@benchmark
+async def entity_write_ha_state(hass):
+    """Write the state of 1000 entities 100k times."""
+    events_to_write = 10**5
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await er.async_load(hass)
+        entity_platform = EntityPlatform(
+            hass=hass,
+            logger=_LOGGER,
+            domain="sensor",
+            platform_name="benchmark",
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        entities = [_BenchmarkEntity(idx) for idx in range(1000)]
+        await entity_platform.async_add_entities(entities)
+
+        start = timer()
+
+        for idx in range(events_to_write):
+            entity = entities[idx % 1000]
+            entity._attr_state = str(idx)  # noqa: SLF001
+            entity.async_write_ha_state()
+
+        return timer() - start
+
+
+@benchmark
+async def entity_registry_load(hass):
+    """Load an entity registry with 10k entities from storage."""
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        for idx in range(10**4):
+            registry.async_get_or_create(
+                "sensor",
+                "benchmark",
+                f"benchmark_{idx}",
+                original_name=f"Benchmark {idx}",
+                unit_of_measurement="W",
+            )
+        # Write the pending changes to storage and unload the registry
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        del hass.data[er.DATA_REGISTRY]
+
+        start = timer()
+
+        await er.async_load(hass)
+
+        assert len(er.async_get(hass).entities) == 10**4
+
+        return timer() - start
+
+
+async def _entity_registry_save(hass, journal):
+    """Rename 1000 entities of a registry with 10k entities, saving each rename."""
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        store = registry._store  # noqa: SLF001
+        if not journal:
+            store._journal_key = None  # noqa: SLF001
+        entity_ids = [
+            registry.async_get_or_create(
+                "sensor",
+                "benchmark",
+                f"benchmark_{idx}",
+                original_name=f"Benchmark {idx}",
+                unit_of_measurement="W",
+            ).entity_id
+            for idx in range(10**4)
+        ]
+        await store._async_handle_write_data()  # noqa: SLF001
+
+        def file_stat(path):
+            """Return the inode and size of a file."""
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return (None, 0)
+            return (stat.st_ino, stat.st_size)
+
+        written = 0
+        file = file_stat(store.path)
+        journal_size = 0
+
+        start = timer()
+
+        for idx, entity_id in enumerate(entity_ids[:1000]):
+            registry.async_update_entity(entity_id, name=f"Renamed {idx}")
+            await store._async_handle_write_data()  # noqa: SLF001
+            # The file is replaced when it is written
+            if (new_file := file_stat(store.path)) != file:
+                written += new_file[1]
+                file = new_file
+            new_journal_size = file_stat(store.journal_path)[1]
+            # The journal is removed when the file is written
+            if new_journal_size >= journal_size:
+                written += new_journal_size - journal_size
+            else:
+                written += new_journal_size
+            journal_size = new_journal_size
+
+        runtime = timer() - start
+        print(f"Wrote {written} bytes to storage for 1000 renames")
+        return runtime
+
+
+@benchmark
+async def entity_registry_save(hass):
+    """Save 1000 renames of entities to a registry with 10k entities."""
+    return await _entity_registry_save(hass, False)
+
+
+@benchmark
+async def entity_registry_save_journal(hass):
+    """Journal 1000 renames of entities to a registry with 10k entities."""
+    return await _entity_registry_save(hass, True)
+
+
+@benchmark
+async def bootstrap_integrations(hass):
+    """Bootstrap 100 custom integrations without dependencies."""
+    logging.getLogger("homeassistant.loader").setLevel(logging.ERROR)
+    domains = {f"benchmark_{idx}" for idx in range(100)}
+    config: dict = {domain: {} for domain in domains}
+
+    # Make sure the custom integrations of a previous run are not reused
+    for module in [
+        module
+        for module in sys.modules
+        if module == "custom_components" or module.startswith("custom_components.")
+    ]:
+        del sys.modules[module]
+
+    with TemporaryDirectory() as config_dir:
+        for domain in domains:
+            integration_dir = pathlib.Path(config_dir, "custom_components", domain)
+            integration_dir.mkdir(parents=True)
+            (integration_dir / "manifest.json").write_text(
+                json.dumps(
+                    {
+                        "domain": domain,
+                        "name": domain,
+                        "codeowners": [],
+                        "documentation": "https://example.com",
+                        "requirements": [],
+                        "version": "1.0.0",
+                    }
+                ),
+                encoding="utf-8",
+            )
+            (integration_dir / "__init__.py").write_text(
+                "async def async_setup(hass, config):\n    return True\n",
+                encoding="utf-8",
+            )
+
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+
+        start = timer()
+
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, config)
+        await bootstrap.async_load_base_functionality(hass)
+        await bootstrap.async_setup_multi_components(hass, domains, config)
+
+        assert domains <= hass.config.components
+
+        return timer() - start
+
+
+@benchmark
+async def automation_state_triggers(hass):
+    """Change the state of 50 entities 10k times with 1500 automations on them."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    triggered = 0
+
+    @core.callback
+    def automation_triggered(event):
+        """Count the automations passing their conditions."""
+        nonlocal triggered
+        triggered += 1
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        hass.set_state(core.CoreState.running)
+        for idx in range(10):
+            hass.states.async_set(f"switch.benchmark_{idx}", "on" if idx else "off")
+        assert await async_setup_component(
+            hass,
+            "automation",
+            {
+                "automation": [
+                    {
+                        "id": f"benchmark_{idx}",
+                        "trigger": {
+                            "platform": "state",
+                            "entity_id": f"sensor.benchmark_{idx % 50}",
+                            "to": f"state_{idx // 50}",
+                        },
+                        "condition": {
+                            "condition": "state",
+                            "entity_id": f"switch.benchmark_{idx % 10}",
+                            "state": "on",
+                        },
+                        "action": {"event": "benchmark"},
+                    }
+                    for idx in range(1500)
+                ]
+            },
+        )
+        hass.bus.async_listen("benchmark", automation_triggered)
+
+        start = timer()
+
+        for idx in range(10**4):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx % 50}", f"state_{idx // 50 % 30}"
+            )
+            await hass.async_block_till_done()
+
+        runtime = timer() - start
+        # Every change triggers 1 of the 30 automations of the entity, the
+        # conditions of 1 in 10 automations fail
+        assert triggered == 10**4 * 9 // 10
+        return runtime
+
+
+@benchmark
+async def conversation_slot_lists(hass):
+    """Rebuild the conversation slot lists 1k times for 5000 entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.conversation.default_agent import DefaultAgent
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.setup import async_setup_component
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        assert await async_setup_component(hass, "homeassistant", {})
+        entity_registry = er.async_get(hass)
+        for idx in range(5000):
+            entry = entity_registry.async_get_or_create("light", "benchmark", f"{idx}")
+            hass.states.async_set(entry.entity_id, "on", {"friendly_name": f"{idx}"})
+        await hass.async_block_till_done()
+        agent = DefaultAgent(hass, {})
+        agent._make_slot_lists()  # noqa: SLF001
+
+        start = timer()
+
+        for idx in range(1000):
+            entity_registry.async_update_entity(
+                f"light.benchmark_{idx}", aliases={f"alias {idx}"}
+            )
+            await hass.async_block_till_done()
+            agent._make_slot_lists()  # noqa: SLF001
+
+        return timer() - start
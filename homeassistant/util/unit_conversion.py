@@ -73,6 +73,8 @@ class BaseUnitConverter:
 
     UNIT_CLASS: str
     VALID_UNITS: set[str | None]
+    # True if all conversions are a multiplication by a constant ratio
+    LINEAR: bool = True
 
     _UNIT_CONVERSION: dict[str | None, float]
 
@@ -331,6 +333,7 @@ class SpeedConverter(BaseUnitConverter):
     """Utility to convert speed values."""
 
     UNIT_CLASS = "speed"
+    LINEAR = False
     _UNIT_CONVERSION: dict[str | None, float] = {
         UnitOfVolumetricFlux.INCHES_PER_DAY: _DAYS_TO_SECS / _IN_TO_M,
         UnitOfVolumetricFlux.INCHES_PER_HOUR: _HRS_TO_SECS / _IN_TO_M,
@@ -429,6 +432,7 @@ class TemperatureConverter(BaseUnitConverter):
     """Utility to convert temperature values."""
 
     UNIT_CLASS = "temperature"
+    LINEAR = False
     VALID_UNITS = {
         UnitOfTemperature.CELSIUS,
         UnitOfTemperature.FAHRENHEIT,
@@ -108,6 +108,77 @@ class Secrets:
         return secrets
 
 
+class YamlFileCache:
+    """Cache the parsed content of YAML files between loads.
+
+    A file is only parsed again when its modification time or its size
+    changed. Files using !include, !secret or !env_var are not cached as
+    their content depends on other files or on the environment, the
+    files they include are cached on their own.
+
+    A copy of the cached content is returned as the configuration is
+    modified while it is processed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        # Path -> modification time and size, parsed content
+        self._files: dict[str, tuple[tuple[int, int], JSON_TYPE | None]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load_yaml(self, fname: str, secrets: Secrets | None) -> JSON_TYPE | None:
+        """Load a YAML file, reusing its content if it did not change."""
+        version: tuple[int, int] | None = None
+        try:
+            file_stat = os.stat(fname)
+        except OSError:
+            # Opening the file raises the error
+            pass
+        else:
+            version = (file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self._files.get(fname)
+            if cached is not None and cached[0] == version:
+                self.hits += 1
+                return _copy_nodes(cached[1])
+
+        self.misses += 1
+        with open(fname, encoding="utf-8") as conf_file:
+            text = conf_file.read()
+        stream = StringIO(text)
+        # Used by the loader to name the file in references and errors
+        stream.name = fname
+        content = parse_yaml(stream, secrets, self)
+        if version is None or any(tag in text for tag in _DEPENDENT_TAGS):
+            self._files.pop(fname, None)
+            return content
+        self._files[fname] = (version, content)
+        return _copy_nodes(content)
+
+
+_DEPENDENT_TAGS = ("!include", "!secret", "!env_var")
+
+
+def _copy_nodes(obj: Any) -> Any:
+    """Copy the dictionaries and lists of parsed YAML content.
+
+    Strings are immutable and shared with the cached content.
+    """
+    copied: NodeDictClass | NodeListClass
+    if isinstance(obj, dict):
+        copied = NodeDictClass({key: _copy_nodes(value) for key, value in obj.items()})
+    elif isinstance(obj, list):
+        copied = NodeListClass([_copy_nodes(value) for value in obj])
+    else:
+        return obj
+    try:  # suppress is much slower
+        copied.__config_file__ = obj.__config_file__
+        copied.__line__ = obj.__line__
+    except AttributeError:
+        pass
+    return copied
+
+
 class _LoaderMixin:
     """Mixin class with extensions for YAML loader."""
 
@@ -128,7 +199,12 @@ class _LoaderMixin:
 class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
     """The fastest available safe loader, either C or Python."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        file_cache: YamlFileCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         self.stream = stream
 
@@ -142,6 +218,7 @@ class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
 
         super().__init__(stream)
         self.secrets = secrets
+        self.file_cache = file_cache
 
 
 class SafeLoader(FastSafeLoader):
@@ -178,10 +255,16 @@ class SafeLoader(FastSafeLoader):
 class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
     """Python safe loader."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        file_cache: YamlFileCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.file_cache = file_cache
 
 
 class SafeLineLoader(PythonSafeLoader):
@@ -219,7 +302,9 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    file_cache: YamlFileCache | None = None,
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
@@ -227,6 +312,8 @@ def load_yaml(
     except for FileNotFoundError which will be re-raised.
     """
     try:
+        if file_cache is not None:
+            return file_cache.load_yaml(os.fspath(fname), secrets)
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
@@ -239,14 +326,19 @@ def load_yaml(
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    file_cache: YamlFileCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    if file_cache is None:
+        loaded_yaml = load_yaml(fname, secrets)
+    else:
+        loaded_yaml = load_yaml(fname, secrets, file_cache=file_cache)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -255,28 +347,32 @@ def load_yaml_dict(
 
 
 def parse_yaml(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    file_cache: YamlFileCache | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
     if not HAS_C_LOADER:
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, file_cache)
     try:
-        return _parse_yaml(FastSafeLoader, content, secrets)
+        return _parse_yaml(FastSafeLoader, content, secrets, file_cache)
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, file_cache)
 
 
 def _parse_yaml_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    file_cache: YamlFileCache | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the python loader (this is very slow)."""
     try:
-        return _parse_yaml(PythonSafeLoader, content, secrets)
+        return _parse_yaml(PythonSafeLoader, content, secrets, file_cache)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -286,9 +382,12 @@ def _parse_yaml(
     loader: type[FastSafeLoader | PythonSafeLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
+    file_cache: YamlFileCache | None = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
-    return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]
+    return yaml.load(  # type: ignore[arg-type]
+        content, Loader=lambda stream: loader(stream, secrets, file_cache)
+    )
 
 
 @overload
@@ -379,7 +478,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.get_name), node.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.file_cache)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
         return _add_reference(loaded_yaml, loader, node)
@@ -413,7 +512,7 @@ def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDi
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.file_cache)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
@@ -432,7 +531,7 @@ def _include_dir_merge_named_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.file_cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference_to_node_class(mapping, loader, node)
@@ -448,7 +547,7 @@ def _include_dir_list_yaml(
         loaded_yaml
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        and (loaded_yaml := load_yaml(f, loader.secrets, loader.file_cache)) is not None
     ]
 
 
@@ -462,7 +561,7 @@ def _include_dir_merge_list_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.file_cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
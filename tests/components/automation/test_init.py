@@ -3153,6 +3153,66 @@ async def test_websocket_config(
     assert msg["error"]["code"] == "not_found"
 
 
+async def test_websocket_evaluation_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, calls: list[ServiceCall]
+) -> None:
+    """Test evaluation stats command."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "triggers": {"trigger": "event", "event_type": "test_event"},
+                "conditions": {
+                    "condition": "state",
+                    "entity_id": "test.entity",
+                    "state": "on",
+                },
+                "actions": {"action": "test.automation"},
+            }
+        },
+    )
+    hass.states.async_set("test.entity", "on")
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    hass.states.async_set("test.entity", "off")
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {
+            "id": 5,
+            "type": "automation/evaluation_stats",
+            "entity_id": "automation.hello",
+        }
+    )
+
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "triggered": 2,
+        "conditions_evaluated": 2,
+        "conditions_failed": 1,
+        "conditions_time": ANY,
+    }
+    assert msg["result"]["conditions_time"] > 0
+
+    await client.send_json(
+        {
+            "id": 6,
+            "type": "automation/evaluation_stats",
+            "entity_id": "automation.not_exist",
+        }
+    )
+
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
 def test_all() -> None:
     """Test module.__all__ is correctly set."""
     help_test_all(automation)
@@ -0,0 +1,160 @@
+"""Test the camera image cache."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.camera import Image
+from homeassistant.components.camera.image_cache import (
+    MAX_CACHED_SIZES,
+    CameraImageCache,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+
+def _mock_scale_jpeg_camera_image(image: Image, width: int, height: int) -> bytes:
+    """Mock scaling an image."""
+    return image.content + f"@{width}x{height}".encode()
+
+
+@pytest.fixture(autouse=True)
+def mock_scale_jpeg_camera_image() -> None:
+    """Mock scaling images."""
+    with patch(
+        "homeassistant.components.camera.image_cache.scale_jpeg_camera_image",
+        side_effect=_mock_scale_jpeg_camera_image,
+    ):
+        yield
+
+
+async def test_image_cache(hass: HomeAssistant) -> None:
+    """Test snapshots are reused during the max age and shared by running fetches."""
+    fetches = 0
+    release = asyncio.Event()
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        nonlocal fetches
+        assert width is None
+        assert height is None
+        fetches += 1
+        await release.wait()
+        return Image("image/jpeg", f"snapshot-{fetches}".encode())
+
+    image_cache = CameraImageCache(hass, fetch)
+    requests = [
+        hass.async_create_task(image_cache.async_get_image(None, None, 10))
+        for _ in range(3)
+    ]
+    scaled = hass.async_create_task(image_cache.async_get_image(100, 50, 10))
+    await asyncio.sleep(0)
+    # A cancelled request does not cancel the shared fetch
+    requests.pop().cancel()
+    release.set()
+
+    images = await asyncio.gather(*requests)
+    assert images[0] is images[1]
+    assert images[0].content == b"snapshot-1"
+    assert (await scaled).content == b"snapshot-1@100x50"
+    assert fetches == 1
+    assert (image_cache.hits, image_cache.misses, image_cache.shared) == (0, 1, 3)
+
+    assert await image_cache.async_get_image(None, None, 10) is images[0]
+    # Other sizes are scaled from the cached snapshot once
+    other_scaled = await image_cache.async_get_image(200, 100, 10)
+    assert other_scaled.content == b"snapshot-1@200x100"
+    assert await image_cache.async_get_image(200, 100, 10) is other_scaled
+    assert fetches == 1
+    assert image_cache.hits == 3
+
+    # Expired snapshots are fetched again
+    image = await image_cache.async_get_image(100, 50, 0)
+    assert image.content == b"snapshot-2@100x50"
+    assert fetches == 2
+    assert image_cache.misses == 2
+
+
+async def test_image_cache_not_scaling_other_images(hass: HomeAssistant) -> None:
+    """Test only jpeg snapshots are scaled."""
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        return Image("image/png", b"image")
+
+    image_cache = CameraImageCache(hass, fetch)
+    image = await image_cache.async_get_image(None, None, 10)
+    assert await image_cache.async_get_image(100, 50, 10) is image
+    assert await image_cache.async_get_image(100, None, 10) is image
+
+
+async def test_image_cache_fetching_sizes(hass: HomeAssistant) -> None:
+    """Test images which cannot be scaled are fetched at the requested size."""
+    fetches: list[tuple[int | None, int | None]] = []
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        fetches.append((width, height))
+        return Image("image/png", f"image-{width}x{height}".encode())
+
+    image_cache = CameraImageCache(hass, fetch)
+    image = await image_cache.async_get_image(100, 50, 10, False)
+    assert image.content == b"image-100x50"
+    assert await image_cache.async_get_image(100, 50, 10, False) is image
+    assert (await image_cache.async_get_image(None, None, 10, False)).content == (
+        b"image-NonexNone"
+    )
+    assert fetches == [(100, 50), (None, None)]
+
+    # Expired images are fetched again
+    assert await image_cache.async_get_image(100, 50, 0, False) is not image
+    assert fetches == [(100, 50), (None, None), (100, 50)]
+
+    # The number of sizes fetched is limited
+    for width in range(MAX_CACHED_SIZES + 1):
+        await image_cache.async_get_image(width, width, 10, False)
+    assert len(image_cache._images) == MAX_CACHED_SIZES + 1
+    assert None in image_cache._images
+    assert (0, 0) not in image_cache._images
+
+
+async def test_image_cache_errors_not_cached(hass: HomeAssistant) -> None:
+    """Test failed fetches are not cached."""
+    fail = True
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        if fail:
+            raise HomeAssistantError("Unable to get image")
+        return Image("image/jpeg", b"image")
+
+    image_cache = CameraImageCache(hass, fetch)
+    with pytest.raises(HomeAssistantError):
+        await image_cache.async_get_image(None, None, 10)
+
+    fail = False
+    assert (await image_cache.async_get_image(None, None, 10)).content == b"image"
+
+
+async def test_image_cache_size_limit(hass: HomeAssistant) -> None:
+    """Test the least recently scaled size is dropped."""
+    scaled = 0
+
+    def scale(image: Image, width: int, height: int) -> bytes:
+        nonlocal scaled
+        scaled += 1
+        return image.content
+
+    async def fetch(width: int | None, height: int | None) -> Image:
+        return Image("image/jpeg", b"image")
+
+    image_cache = CameraImageCache(hass, fetch)
+    with patch(
+        "homeassistant.components.camera.image_cache.scale_jpeg_camera_image",
+        side_effect=scale,
+    ):
+        for width in range(MAX_CACHED_SIZES + 1):
+            await image_cache.async_get_image(width, width, 10)
+        assert scaled == MAX_CACHED_SIZES + 1
+
+        await image_cache.async_get_image(MAX_CACHED_SIZES, MAX_CACHED_SIZES, 10)
+        assert scaled == MAX_CACHED_SIZES + 1
+        await image_cache.async_get_image(0, 0, 10)
+        assert scaled == MAX_CACHED_SIZES + 2
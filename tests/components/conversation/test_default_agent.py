@@ -1170,6 +1170,69 @@ async def test_empty_aliases(
         assert floors.values[0].text_in.text == floor_1.name
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_updated_incrementally(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that only the names of changed entities are recreated."""
+    area_registry.async_create("kitchen")
+    for number in range(3):
+        light = entity_registry.async_get_or_create("light", "demo", f"{number}")
+        hass.states.async_set(
+            light.entity_id, "on", attributes={ATTR_FRIENDLY_NAME: f"light {number}"}
+        )
+    await hass.async_block_till_done()
+
+    agent = hass.data[DATA_DEFAULT_ENTITY]
+    slot_lists = agent._make_slot_lists()
+    assert [value.text_in.text for value in slot_lists["name"].values] == [
+        "light 0",
+        "light 1",
+        "light 2",
+    ]
+
+    # Adding an alias only recreates the names of that entity
+    entity_registry.async_update_entity("light.demo_1", aliases={"lamp"})
+    await hass.async_block_till_done()
+    with patch.object(
+        agent, "_make_entity_values", wraps=agent._make_entity_values
+    ) as mock_make_entity_values:
+        new_slot_lists = agent._make_slot_lists()
+    assert mock_make_entity_values.call_count == 1
+    assert [value.text_in.text for value in new_slot_lists["name"].values] == [
+        "light 0",
+        "lamp",
+        "light 1",
+        "light 2",
+    ]
+    assert new_slot_lists["name"].values[0] is slot_lists["name"].values[0]
+    assert new_slot_lists["area"] is slot_lists["area"]
+
+    # Removed entities are dropped, new entities are added at the end
+    hass.states.async_remove("light.demo_0")
+    hass.states.async_set("light.new", "on", attributes={ATTR_FRIENDLY_NAME: "new"})
+    await hass.async_block_till_done()
+    slot_lists = agent._make_slot_lists()
+    assert [value.text_in.text for value in slot_lists["name"].values] == [
+        "lamp",
+        "light 1",
+        "light 2",
+        "new",
+    ]
+
+    # Area changes do not touch the entity names
+    area_registry.async_create("bedroom")
+    await hass.async_block_till_done()
+    new_slot_lists = agent._make_slot_lists()
+    assert [value.text_in.text for value in new_slot_lists["area"].values] == [
+        "kitchen",
+        "bedroom",
+    ]
+    assert new_slot_lists["name"].values == slot_lists["name"].values
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_all_domains_loaded(hass: HomeAssistant) -> None:
     """Test that sentences for all domains are always loaded."""
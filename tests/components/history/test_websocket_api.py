@@ -7,7 +7,7 @@ from unittest.mock import ANY, patch
 from freezegun import freeze_time
 import pytest
 
-from homeassistant.components import history
+from homeassistant.components import history, websocket_api as ws_api
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
@@ -543,6 +543,131 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_compact_states(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream with attribute keys replaced by references."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "1", {"unit": "W", "name": "One"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "2", {"unit": "W", "name": "One"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "3", {"name": "Two"})
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {ws_api.FEATURE_COMPACT_STATES: 1},
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": False,
+            "minimal_response": False,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["event"]["k"] == ["unit", "name"]
+    assert response["event"]["states"] == {
+        "sensor.one": [
+            {"a": {"0": "W", "1": "One"}, "lu": ANY, "s": "1"},
+            {"a": {"0": "W", "1": "One"}, "lu": ANY, "s": "2"},
+        ],
+        "sensor.two": [{"a": {"1": "Two"}, "lu": ANY, "s": "3"}],
+    }
+
+
+async def test_history_stream_historical_only_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends long periods in chunks."""
+    now = dt_util.utcnow()
+    start_time = now - timedelta(days=3, hours=1)
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+
+    last_updated_timestamps = {}
+    with freeze_time(now - timedelta(days=3)) as freezer:
+        hass.states.async_set("sensor.one", "1")
+        last_updated_timestamps["1"] = hass.states.get(
+            "sensor.one"
+        ).last_updated_timestamp
+        await async_recorder_block_till_done(hass)
+        freezer.move_to(now - timedelta(days=2))
+        hass.states.async_set("sensor.one", "2")
+        last_updated_timestamps["2"] = hass.states.get(
+            "sensor.one"
+        ).last_updated_timestamp
+        await async_recorder_block_till_done(hass)
+        # Exactly at the start of the last chunk
+        freezer.move_to(now - timedelta(hours=1))
+        hass.states.async_set("sensor.one", "3")
+        last_updated_timestamps["3"] = hass.states.get(
+            "sensor.one"
+        ).last_updated_timestamp
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": start_time.isoformat(),
+            "end_time": now.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    # The third chunk has no states and is not sent
+    for state, chunk_start_time in (
+        ("1", start_time),
+        ("2", start_time + timedelta(days=1, microseconds=-1)),
+        ("3", start_time + timedelta(days=3, microseconds=-1)),
+    ):
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": pytest.approx(last_updated_timestamps[state]),
+                "start_time": pytest.approx(chunk_start_time.timestamp()),
+                "states": {
+                    "sensor.one": [
+                        {
+                            "lu": pytest.approx(last_updated_timestamps[state]),
+                            "s": state,
+                        }
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1627,6 +1752,69 @@ async def test_overflow_queue(
     ) == listeners_without_writes(init_listeners)
 
 
+async def test_overflow_queue_while_sending_historical_states(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test overflowing the queue while sending historical states does not cancel."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    async def _async_drain_and_change_states(
+        _connection: ws_api.ActiveConnection,
+    ) -> None:
+        for val in range(5):
+            hass.states.async_set("sensor.one", str(val))
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api, "MAX_PENDING_HISTORY_STATES", 2),
+        patch.object(
+            ws_api.ActiveConnection,
+            "async_drain",
+            side_effect=_async_drain_and_change_states,
+            autospec=True,
+        ),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one"],
+                "start_time": (now - timedelta(days=1, hours=1)).isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert [state["s"] for state in response["event"]["states"]["sensor.one"]] == [
+            "on"
+        ]
+
+        # The dropped states are fetched from the database instead
+        response = await client.receive_json()
+        assert [state["s"] for state in response["event"]["states"]["sensor.one"]] == [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+
+    hass.states.async_set("sensor.one", "live")
+    response = await client.receive_json()
+    assert [state["s"] for state in response["event"]["states"]["sensor.one"]] == [
+        "live"
+    ]
+
+
 async def test_history_during_period_for_invalid_entity_ids(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
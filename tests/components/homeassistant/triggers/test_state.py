@@ -1,5 +1,6 @@
 """The test for state automation."""
 
+from collections.abc import Callable
 from datetime import timedelta
 from unittest.mock import patch
 
@@ -14,7 +15,14 @@ from homeassistant.const import (
     SERVICE_TURN_OFF,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -1771,3 +1779,45 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(hass: HomeAssistant) -> None:
+    """Test the index runs the listeners matching the new state in order."""
+    index = state_trigger.async_get_state_trigger_index(hass)
+    assert state_trigger.async_get_state_trigger_index(hass) is index
+    calls: list[tuple[str, str]] = []
+
+    def listener(name: str) -> Callable[[Event[EventStateChangedData]], None]:
+        @callback
+        def async_listener(event: Event[EventStateChangedData]) -> None:
+            calls.append((name, event.data["new_state"].state))
+
+        return async_listener
+
+    remove_any = index.async_add(["test.entity"], None, listener("any"))
+    remove_on = index.async_add(["test.entity", "test.other"], ["on"], listener("on"))
+    index.async_add("TEST.entity", ["on", "off"], listener("on_off"))
+
+    hass.states.async_set("test.entity", "on")
+    hass.states.async_set("test.entity", "off")
+    hass.states.async_set("test.entity", "unknown")
+    hass.states.async_set("test.other", "on")
+    await hass.async_block_till_done()
+    assert calls == [
+        ("any", "on"),
+        ("on", "on"),
+        ("on_off", "on"),
+        ("any", "off"),
+        ("on_off", "off"),
+        ("any", "unknown"),
+        ("on", "on"),
+    ]
+
+    calls.clear()
+    remove_any()
+    remove_on()
+    hass.states.async_set("test.entity", "on")
+    hass.states.async_set("test.other", "off")
+    hass.states.async_set("test.other", "on")
+    await hass.async_block_till_done()
+    assert calls == [("on_off", "on")]
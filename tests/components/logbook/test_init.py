@@ -46,6 +46,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_to_bytes
 
 from .common import MockRow, mock_humanify
 
@@ -125,6 +126,45 @@ async def test_service_call_create_logbook_entry(hass_: HomeAssistant) -> None:
     assert last_call.data.get(logbook.ATTR_DOMAIN) == "logbook"
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_recent_contexts_index_described_events(hass: HomeAssistant) -> None:
+    """Test only the events logbook describes are indexed as recent contexts."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await hass.async_block_till_done()
+    recent_contexts = hass.data[logbook.DOMAIN].recent_contexts
+
+    state_context = ha.Context()
+    hass.states.async_set("light.kitchen", STATE_ON, context=state_context)
+    automation_context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=automation_context,
+    )
+    service_context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+        context=service_context,
+    )
+    await hass.async_block_till_done()
+
+    assert recent_contexts.get(ulid_to_bytes(state_context.id)) is None
+    assert (
+        recent_contexts.get(ulid_to_bytes(automation_context.id)).event_type
+        == EVENT_AUTOMATION_TRIGGERED
+    )
+    assert (
+        recent_contexts.get(ulid_to_bytes(service_context.id)).event_type
+        == EVENT_CALL_SERVICE
+    )
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_service_call_create_logbook_entry_invalid_entity_id(
     hass: HomeAssistant,
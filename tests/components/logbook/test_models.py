@@ -2,7 +2,13 @@
 
 from unittest.mock import Mock
 
-from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
+from homeassistant.components.logbook.models import (
+    EventAsRow,
+    LazyEventPartialState,
+    RecentContexts,
+)
+from homeassistant.core import Context, Event
+from homeassistant.util.ulid import ulid_to_bytes
 
 
 def test_lazy_event_partial_state_context() -> None:
@@ -31,3 +37,24 @@ def test_lazy_event_partial_state_context() -> None:
     assert state.event_type == "event_type"
     assert state.entity_id == "entity_id"
     assert state.state == "state"
+
+
+def test_recent_contexts() -> None:
+    """Test the events originating contexts are indexed."""
+    recent_contexts = RecentContexts(2)
+    context = Context()
+    origin_event = Event("automation_triggered", {"name": "Lights"}, context=context)
+    recent_contexts.async_add(origin_event)
+    # Only the first event of a context is indexed
+    recent_contexts.async_add(Event("script_started", context=context))
+    context_row = recent_contexts.get(ulid_to_bytes(context.id))
+    assert context_row.event_type == "automation_triggered"
+    assert context_row.data == {"name": "Lights"}
+
+    other_context = Context()
+    recent_contexts.async_add(Event("script_started", context=other_context))
+
+    # The oldest context is dropped when the index is full
+    recent_contexts.async_add(Event("script_started", context=Context()))
+    assert recent_contexts.get(ulid_to_bytes(context.id)) is None
+    assert recent_contexts.get(ulid_to_bytes(other_context.id)) is not None
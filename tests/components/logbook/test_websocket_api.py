@@ -1467,6 +1467,72 @@ async def test_subscribe_unsubscribe_logbook_stream(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_logbook_stream_parent_context_from_memory(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the live stream looks up parent contexts in memory."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {"id": 7, "type": "logbook/event_stream", "start_time": now.isoformat()}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["success"]
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["event"]["partial"] is True
+    await hass.async_block_till_done()
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["event"]["events"] == []
+
+    parent_context = core.Context(id="01GTDGKBCH00GW0X276W5TEDDD")
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=parent_context,
+    )
+    hass.bus.async_fire(
+        EVENT_SCRIPT_STARTED,
+        {ATTR_NAME: "Mock script", ATTR_ENTITY_ID: "script.mock_script"},
+        context=core.Context(parent_id=parent_context.id),
+    )
+    await hass.async_block_till_done()
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["event"]["events"] == [
+        {
+            "context_id": "01GTDGKBCH00GW0X276W5TEDDD",
+            "domain": "automation",
+            "entity_id": "automation.alarm",
+            "message": "triggered",
+            "name": "Mock automation",
+            "source": None,
+            "when": ANY,
+        },
+        {
+            "context_domain": "automation",
+            "context_entity_id": "automation.alarm",
+            "context_event_type": "automation_triggered",
+            "context_id": ANY,
+            "context_message": "triggered",
+            "context_name": "Mock automation",
+            "domain": "script",
+            "entity_id": "script.mock_script",
+            "message": "started",
+            "name": "Mock script",
+            "when": ANY,
+        },
+    ]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_entities(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
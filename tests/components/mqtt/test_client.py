@@ -649,6 +649,49 @@ async def test_subscribe_special_characters(
     assert recorded_calls[0].payload == payload
 
 
+async def test_subscribe_invalidates_cached_matches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the matches of received topics are cached until subscriptions change."""
+    mqtt_mock = await mqtt_mock_entry()
+    stats = mqtt_mock.async_get_subscription_stats()
+    unsub_simple = await mqtt.async_subscribe(hass, "test-topic/bier/on", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 2
+
+    new_stats = mqtt_mock.async_get_subscription_stats()
+    assert new_stats["match_cache_hits"] - stats["match_cache_hits"] == 1
+    assert new_stats["match_cache_misses"] - stats["match_cache_misses"] == 1
+
+    # A new wildcard subscription matching the cached topic
+    unsub_wildcard = await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    # A new wildcard subscription not matching the cached topic
+    unsub_other = await mqtt.async_subscribe(hass, "other-topic/#", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 4
+
+    unsub_simple()
+    unsub_other()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 5
+
+    unsub_wildcard()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 5
+
+    with pytest.raises(HomeAssistantError):
+        unsub_wildcard()
+
+
 async def test_subscribe_same_topic(
     hass: HomeAssistant,
     mock_debouncer: asyncio.Event,
@@ -40,6 +40,14 @@ async def test_entry_diagnostics(
         "devices": [],
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
+        "subscription_stats": {
+            "simple_subscriptions": 0,
+            "wildcard_subscriptions": ANY,
+            "match_cache_size": 0,
+            "match_cache_max_size": 8192,
+            "match_cache_hits": 0,
+            "match_cache_misses": 0,
+        },
     }
 
     # Discover a device with an entity and a trigger
@@ -125,6 +133,14 @@ async def test_entry_diagnostics(
         "devices": [expected_device],
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
+        "subscription_stats": {
+            "simple_subscriptions": 1,
+            "wildcard_subscriptions": ANY,
+            "match_cache_size": 2,
+            "match_cache_max_size": 8192,
+            "match_cache_hits": 0,
+            "match_cache_misses": 2,
+        },
     }
 
     assert await get_diagnostics_for_device(
@@ -254,6 +270,7 @@ async def test_redact_diagnostics(
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
+        "subscription_stats": ANY,
     }
 
     assert await get_diagnostics_for_device(
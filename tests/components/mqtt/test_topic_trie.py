@@ -0,0 +1,57 @@
+"""The tests for the MQTT topic trie."""
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("test/bier/on", {"test/bier/on", "test/+/on", "test/#", "#", "+/+/+"}),
+        ("test/bier", {"test/#", "#", "test/+"}),
+        ("test", {"test/#", "#", "test"}),
+        ("test/", {"test/#", "#", "test/+"}),
+        ("other/bier/on", {"#", "+/+/+"}),
+        ("$SYS/broker", {"$SYS/#"}),
+    ],
+)
+def test_topic_trie_match(topic: str, expected: set[str]) -> None:
+    """Test matching topics against topic filters with wildcards."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in (
+        "test/bier/on",
+        "test/+/on",
+        "test/+",
+        "test/#",
+        "test",
+        "#",
+        "+/+/+",
+        "$SYS/#",
+    ):
+        trie.add(topic_filter, topic_filter)
+    assert len(trie) == 8
+    assert set(trie.match(topic)) == expected
+
+
+def test_topic_trie_remove() -> None:
+    """Test removing values from the trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("test/+/on", "a")
+    trie.add("test/+/on", "b")
+    trie.add("test/+/on", "b")
+    trie.add("test/#", "c")
+    assert len(trie) == 3
+    assert sorted(trie.match("test/bier/on")) == ["a", "b", "c"]
+
+    trie.remove("test/+/on", "a")
+    assert sorted(trie.match("test/bier/on")) == ["b", "c"]
+    trie.remove("test/+/on", "b")
+    trie.remove("test/#", "c")
+    assert len(trie) == 0
+    assert trie.match("test/bier/on") == []
+
+    with pytest.raises(KeyError):
+        trie.remove("test/+/on", "b")
+    with pytest.raises(KeyError):
+        trie.remove("unknown", "b")
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from typing import Any
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder import CONF_HISTORY_CACHE_SIZE, Recorder, history
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
@@ -1014,3 +1016,136 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_HISTORY_CACHE_SIZE: 1}])
+async def test_history_from_recent_states_cache(hass: HomeAssistant) -> None:
+    """Test history answered from the recent states cache matches the database."""
+    instance = recorder.get_instance(hass)
+    recent_states_cache = instance.recent_states_cache
+    assert recent_states_cache is not None
+    entity_ids = ["media_player.test", "climate.test", "sensor.test"]
+    start = dt_util.utcnow()
+    times = [start + timedelta(seconds=idx) for idx in range(12)]
+
+    def set_states(idx: int) -> None:
+        for entity_id in entity_ids:
+            hass.states.async_set(
+                entity_id, f"state{idx // 2}", {"attr": idx % 3, "entity": entity_id}
+            )
+
+    # The first states are recorded before the cache is used
+    instance.recent_states_cache = None
+    with freeze_time(times[0]) as freezer:
+        for idx in range(3):
+            freezer.move_to(times[idx])
+            set_states(idx)
+        await async_wait_recording_done(hass)
+        instance.recent_states_cache = recent_states_cache
+        for idx in range(3, 11):
+            freezer.move_to(times[idx])
+            set_states(idx)
+        freezer.move_to(times[11])
+        hass.states.async_remove("sensor.test")
+    await async_wait_recording_done(hass)
+
+    def _as_dicts(
+        result: dict[str, list[State | dict[str, Any]]],
+    ) -> dict[str, list[Any]]:
+        return {
+            entity_id: [
+                state
+                if isinstance(state, dict)
+                else (state.as_dict(), state.last_reported)
+                for state in states
+            ]
+            for entity_id, states in result.items()
+        }
+
+    def _query(
+        func: Callable[..., dict[str, list[State | dict[str, Any]]]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> dict[str, list[Any]]:
+        instance.recent_states_cache = recent_states_cache
+        cached = _as_dicts(func(hass, *args, **kwargs))
+        instance.recent_states_cache = None
+        uncached = _as_dicts(func(hass, *args, **kwargs))
+        instance.recent_states_cache = recent_states_cache
+        assert cached == uncached
+        return cached
+
+    for start_time, end_time in (
+        (times[0], None),
+        (times[1], times[7]),
+        (times[3], None),
+        (times[3], times[4]),
+        (times[5], times[9]),
+        (times[6] + timedelta(microseconds=1), None),
+        (times[11], None),
+    ):
+        for entity_id in entity_ids:
+            for kwargs in (
+                {},
+                {"no_attributes": True},
+                {"include_start_time_state": False},
+                {"limit": 2},
+                {"limit": 2, "descending": True},
+            ):
+                _query(
+                    history.state_changes_during_period,
+                    start_time,
+                    end_time,
+                    entity_id,
+                    **kwargs,
+                )
+        for kwargs in (
+            {},
+            {"significant_changes_only": False},
+            {"minimal_response": True},
+            {"minimal_response": True, "compressed_state_format": True},
+            {"no_attributes": True, "include_start_time_state": False},
+        ):
+            _query(
+                history.get_significant_states,
+                start_time,
+                end_time,
+                entity_ids,
+                **kwargs,
+            )
+
+    # Windows starting after the first cached state are not queried
+    expected_states = _query(
+        history.state_changes_during_period, times[5], None, "climate.test"
+    )
+    expected_significant_states = _query(
+        history.get_significant_states, times[5], None, entity_ids
+    )
+    with patch(
+        "homeassistant.components.recorder.history.modern.execute_stmt_lambda_element"
+    ) as execute_stmt_mock:
+        assert (
+            _as_dicts(
+                history.state_changes_during_period(
+                    hass, times[5], None, "climate.test"
+                )
+            )
+            == expected_states
+        )
+        assert (
+            _as_dicts(history.get_significant_states(hass, times[5], None, entity_ids))
+            == expected_significant_states
+        )
+    assert execute_stmt_mock.call_count == 0
+    assert len(expected_states["climate.test"]) == 4
+
+    # Purging evicts the cached states which are purged
+    await hass.services.async_call(
+        recorder.DOMAIN,
+        "purge_entities",
+        {"entity_id": "climate.test", "keep_days": 0},
+        blocking=True,
+    )
+    await async_wait_recording_done(hass)
+    assert recent_states_cache.get("climate.test") is None
+    assert recent_states_cache.get("media_player.test")
@@ -21,6 +21,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -33,6 +34,10 @@ from homeassistant.components.recorder import (
     migration,
     statistics,
 )
+from homeassistant.components.recorder.bulk_insert import (
+    BulkStatesWriter,
+    PendingStatesRow,
+)
 from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
@@ -258,6 +263,7 @@ async def test_state_gets_saved_when_set_before_start_event(
         assert db_states[0].event_id is None
 
 
+@pytest.mark.parametrize("recorder_config", [None, {CONF_BULK_INSERT: True}])
 async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving and restoring a state."""
     entity_id = "test.recorder"
@@ -331,12 +337,15 @@ async def test_saving_state_with_nul(
     assert state.as_dict() == expected.as_dict()
 
 
+@pytest.mark.parametrize("bulk_insert", [False, True])
 async def test_saving_many_states(
-    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert: bool,
 ) -> None:
     """Test we expire after many commits."""
     instance = await async_setup_recorder_instance(
-        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0, CONF_BULK_INSERT: bulk_insert}
     )
 
     entity_id = "test.recorder"
@@ -827,6 +836,7 @@ async def test_saving_state_include_domain_glob_exclude_entity(
     assert _state_with_context(hass, "test.ok").state == "state2"
 
 
+@pytest.mark.parametrize("recorder_config", [None, {CONF_BULK_INSERT: True}])
 async def test_saving_state_and_removing_entity(
     hass: HomeAssistant,
     setup_recorder: None,
@@ -1440,6 +1450,7 @@ async def test_compile_missing_statistics(
         await hass.async_stop()
 
 
+@pytest.mark.parametrize("recorder_config", [None, {CONF_BULK_INSERT: True}])
 async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving sets old state."""
     hass.states.async_set("test.one", "s1", {})
@@ -1468,6 +1479,63 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT: True}])
+async def test_bulk_insert_links_old_state_across_commits(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test bulk inserted states link to states written in the same and earlier commits."""
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.one", "s2", {"attr": 2})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s4", {"attr": 1})
+    hass.states.async_remove("test.one")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).order_by(States.last_updated_ts)
+        )
+    assert [state.state for state in states] == ["s1", "s2", "s3", "s4", None]
+    assert states[0].old_state_id is None
+    for old_state, state in zip(states, states[1:], strict=False):
+        assert state.old_state_id == old_state.state_id
+    assert states[0].attributes_id == states[3].attributes_id
+    assert states[1].attributes_id == states[2].attributes_id
+    assert states[0].attributes_id != states[1].attributes_id
+
+
+async def test_bulk_insert_multi_row_verifies_ids(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test the ids of multi-row INSERTs are verified before they are assigned."""
+    rows = [
+        PendingStatesRow(f"s{i}", None, 1000.0 + i, None, None, 0, None, None, None)
+        for i in range(3)
+    ]
+    writer = BulkStatesWriter()
+    writer._auto_increment_increment = 1
+    with session_scope(hass=hass) as session:
+        # The last inserted id of a single row INSERT is the id of the row
+        writer._write_multi_row(session, rows[:1], [rows[0].as_params()])
+        assert writer._multi_row_insert is True
+        # SQLite reports the id of the last row of a multi-row INSERT, the
+        # mismatch is detected and the rows are inserted one at a time
+        writer._write_multi_row(
+            session, rows[1:], [row.as_params() for row in rows[1:]]
+        )
+        assert writer._multi_row_insert is False
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = dict(session.query(States.state_id, States.state))
+    assert states == {row.state_id: row.state for row in rows}
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -0,0 +1,83 @@
+"""The tests for the recorder recent states cache."""
+
+from homeassistant.components.recorder.recent_states import (
+    RecentState,
+    RecentStatesCache,
+)
+
+
+def _recent_state(last_updated_ts: float, attributes: str = "{}") -> RecentState:
+    return RecentState("on", last_updated_ts, None, None, attributes)
+
+
+def test_recent_states_cache_evicts_least_recently_used() -> None:
+    """Test the oldest states of the least recently used entities are evicted."""
+    cache = RecentStatesCache(1300)
+    for ts in range(3):
+        cache.add("light.kitchen", _recent_state(ts))
+        cache.add("light.bedroom", _recent_state(ts))
+    assert [state.last_updated_ts for state in cache.get("light.kitchen")] == [0, 1, 2]
+
+    # The bedroom light was not queried, its oldest states are evicted first
+    for ts in range(3, 6):
+        cache.add("light.kitchen", _recent_state(ts))
+    assert cache.get("light.bedroom") is None
+    assert [state.last_updated_ts for state in cache.get("light.kitchen")] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+    cache.add("light.kitchen", _recent_state(6))
+    assert [state.last_updated_ts for state in cache.get("light.kitchen")] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+
+
+def test_recent_states_cache_shares_attributes() -> None:
+    """Test unchanged attributes are shared with the previous state."""
+    cache = RecentStatesCache(10000)
+    cache.add("light.kitchen", _recent_state(0, "x" * 1000))
+    cache.add("light.kitchen", _recent_state(1, "x" * 1000))
+    cache.add("light.kitchen", _recent_state(2, "y" * 1000))
+    states = cache.get("light.kitchen")
+    assert states[0].attributes is states[1].attributes
+    assert states[0].size == states[2].size
+    assert states[1].size < states[0].size
+
+
+def test_recent_states_cache_evict() -> None:
+    """Test evicting states by time and by entity."""
+    cache = RecentStatesCache(100000)
+    for ts in range(3):
+        cache.add("light.kitchen", _recent_state(ts))
+        cache.add("light.bedroom", _recent_state(ts))
+        cache.add("switch.fan", _recent_state(ts))
+
+    cache.update_last_reported("switch.fan", 5)
+    assert cache.get("switch.fan")[-1].last_reported_ts == 5
+
+    cache.evict_before(2)
+    assert cache.get("light.kitchen") == [_recent_state(2)]
+
+    cache.evict_entity_ids(["light.kitchen", "light.unknown"])
+    assert cache.get("light.kitchen") is None
+
+    cache.evict_entities(lambda entity_id: entity_id.startswith("switch."))
+    assert cache.get("switch.fan") is None
+    assert cache.get("light.bedroom") == [_recent_state(2)]
+
+    cache.evict_before(3)
+    assert cache.get("light.bedroom") is None
+
+    cache.add("light.kitchen", _recent_state(4))
+    cache.clear()
+    assert cache.get("light.kitchen") is None
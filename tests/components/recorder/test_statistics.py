@@ -1,7 +1,8 @@
 """The tests for sensor recorder platform."""
 
 from datetime import timedelta
-from typing import Any
+import math
+from typing import Any, Literal
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -9,8 +10,13 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsMeta,
+    StatisticsRollup,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
+    StatisticMetaData,
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
@@ -1844,6 +1850,279 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize("period", ["hour", "day", "week", "month"])
+@pytest.mark.parametrize(
+    "units", [None, {"energy": "Wh", "temperature": "°F"}, {"energy": "MWh"}]
+)
+@pytest.mark.freeze_time("2022-12-01 00:00:00+00:00")
+async def test_statistics_during_period_columns(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+    period: Literal["hour", "day", "week", "month"],
+    units: dict[str, str] | None,
+) -> None:
+    """Test statistics columns match the statistics rows."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    sum_statistics = []
+    mean_statistics = []
+    for hour in range(24 * 50):
+        sum_statistics.append(
+            {
+                "start": start + timedelta(hours=hour * 3),
+                "last_reset": None,
+                "state": hour % 24,
+                "sum": None if hour == 500 else hour * 1.5,
+            }
+        )
+        mean_statistics.append(
+            {
+                "start": start + timedelta(hours=hour * 3),
+                "max": hour + 10,
+                "mean": None if hour % 100 == 7 else hour - 5.5,
+                "min": hour - 20,
+            }
+        )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        sum_statistics,
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Temperature",
+            "source": "test",
+            "statistic_id": "test:temperature",
+            "unit_of_measurement": "°C",
+        },
+        mean_statistics,
+    )
+    await async_wait_recording_done(hass)
+
+    def _columns_to_rows(
+        columns: dict[str, statistics.StatisticsColumns],
+    ) -> dict[str, list[dict[str, Any]]]:
+        return {
+            statistic_id: [
+                {
+                    "start": start,
+                    "end": column.end[idx],
+                    **{
+                        key: None if math.isnan(values[idx]) else values[idx]
+                        for key, values in column.values.items()
+                    },
+                }
+                for idx, start in enumerate(column.start)
+            ]
+            for statistic_id, column in columns.items()
+        }
+
+    statistic_ids = {"test:total_energy_import", "test:temperature"}
+    for start_time, types in (
+        (start, {"last_reset", "max", "mean", "min", "state", "sum"}),
+        (start + timedelta(days=10), {"change", "max", "mean", "min", "sum"}),
+        (start + timedelta(days=20), {"change"}),
+        (start + timedelta(days=10), {"mean"}),
+    ):
+        rows = statistics.statistics_during_period(
+            hass, start_time, None, statistic_ids, period, units, types
+        )
+        columns = statistics.statistics_during_period_columns(
+            hass, start_time, None, statistic_ids, period, units, types
+        )
+        assert rows
+        assert _columns_to_rows(columns) == rows
+
+    assert (
+        statistics.statistics_during_period_columns(
+            hass, start + timedelta(days=500), None, statistic_ids, period, units, {}
+        )
+        == {}
+    )
+
+
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test statistics rollups are maintained and rebuilt on time zone change."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.use_statistics_rollups is True
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    sum_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": hour % 24,
+            "sum": hour * 1.5,
+            "max": hour + 10,
+            "mean": hour - 5.5,
+            "min": hour - 20,
+        }
+        for hour in range(24 * 40)
+    ]
+    metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, metadata, sum_statistics)
+    await async_wait_recording_done(hass)
+
+    def _get_rollups() -> dict[int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            rows = session.execute(
+                select(StatisticsRollup.period, StatisticsRollup.start_ts)
+            ).all()
+        periods: dict[int, int] = {}
+        for period, _ in rows:
+            periods[period] = periods.get(period, 0) + 1
+        return periods
+
+    # 40 days starting on a Saturday span 7 weeks and 2 months
+    assert _get_rollups() == {1: 40, 2: 7, 3: 2}
+
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    statistic_ids = {"test:total_energy_import"}
+
+    def _query(period: Literal["day", "week", "month"]) -> dict[str, Any]:
+        return statistics.statistics_during_period(
+            hass, start, None, statistic_ids, period, None, types
+        )
+
+    rollup_stats = {period: _query(period) for period in ("day", "week", "month")}
+    instance.use_statistics_rollups = False
+    assert {
+        period: _query(period) for period in ("day", "week", "month")
+    } == rollup_stats
+
+    # Adjusting a statistic updates the rollups
+    instance.use_statistics_rollups = True
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [{**sum_statistics[5], "max": 1000, "sum": 1000}],
+    )
+    await async_wait_recording_done(hass)
+    day_stats = _query("day")
+    assert day_stats["test:total_energy_import"][0]["max"] == 1000
+    instance.use_statistics_rollups = False
+    assert _query("day") == day_stats
+
+    # Changing the time zone falls back to reducing the hourly statistics
+    # and queues a rebuild of the rollups
+    instance.use_statistics_rollups = True
+    await hass.config.async_set_time_zone("America/Regina")
+    rebuild_task = instance.queue_task
+    with patch.object(instance, "queue_task", wraps=rebuild_task) as queue_task:
+        day_stats = _query("day")
+    assert instance.use_statistics_rollups is False
+    assert queue_task.call_count == 1
+    assert day_stats == _query("day")
+    assert day_stats["test:total_energy_import"][0]["start"] == (
+        start.timestamp() - 18 * 3600
+    )
+    # The rollups are rebuilt one month at a time
+    for _ in range(5):
+        await async_wait_recording_done(hass)
+    assert instance.use_statistics_rollups is True
+    assert _query("day") == day_stats
+    assert _get_rollups() == {1: 41, 2: 7, 3: 3}
+
+
+async def test_statistics_rollups_compiled_hours(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test compiled hours are folded into the rollups of their periods."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    end = start + timedelta(hours=30)
+    metadata: StatisticMetaData = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": "sensor.test",
+        "unit_of_measurement": "kWh",
+    }
+    columns = (
+        StatisticsRollup.period,
+        StatisticsRollup.start_ts,
+        StatisticsRollup.end_ts,
+        StatisticsRollup.mean,
+        StatisticsRollup.min,
+        StatisticsRollup.max,
+        StatisticsRollup.state,
+        StatisticsRollup.sum,
+        StatisticsRollup.mean_count,
+        StatisticsRollup.last_start_ts,
+    )
+
+    def _compile_hours() -> tuple[list[tuple], list[tuple]]:
+        with session_scope(hass=hass) as session:
+            session.add(statistics_meta := StatisticsMeta.from_meta(metadata))
+            session.flush()
+            metadata_id = statistics_meta.id
+            for hour in range(30):
+                hour_start = start + timedelta(hours=hour)
+                session.add_all(
+                    StatisticsShortTerm.from_stats(
+                        metadata_id,
+                        {
+                            "start": hour_start + timedelta(minutes=minute),
+                            # Hours without a mean are not counted
+                            "mean": hour * 2.5 + minute if hour % 5 else None,
+                            "min": hour - minute,
+                            "max": hour + minute,
+                            "state": hour,
+                            "sum": hour * 1.5 + minute,
+                        },
+                    )
+                    for minute in range(0, 60, 5)
+                )
+                statistics._compile_hourly_statistics(session, hour_start)
+            stmt = select(*columns).order_by(
+                StatisticsRollup.period, StatisticsRollup.start_ts
+            )
+            folded = [tuple(row) for row in session.execute(stmt)]
+            statistics._update_statistics_rollups(
+                session, None, start.timestamp(), end.timestamp()
+            )
+            session.flush()
+            rebuilt = [tuple(row) for row in session.execute(stmt)]
+        return folded, rebuilt
+
+    folded, rebuilt = await instance.async_add_executor_job(_compile_hours)
+    # 30 hours starting on a Saturday span 2 days, 1 week and 1 month
+    assert [row[0] for row in folded] == [1, 1, 2, 3]
+    assert folded == pytest.approx(rebuilt)
+    assert folded[1][-2:] == (5, end.timestamp() - 3600)
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
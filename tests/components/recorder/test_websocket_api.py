@@ -1,7 +1,10 @@
 """The tests for sensor recorder platform."""
 
+from array import array
+from base64 import b64decode
 import datetime
 from datetime import timedelta
+import math
 from statistics import fmean
 import sys
 from unittest.mock import ANY, patch
@@ -1340,6 +1343,96 @@ async def test_statistics_during_period_unit_conversion(
     }
 
 
+@pytest.mark.parametrize(
+    ("custom_units", "converted_value"),
+    [
+        (None, 10),
+        ({"temperature": "°F"}, 50),
+        ({"temperature": "K"}, 283.15),
+    ],
+)
+async def test_statistics_during_period_columns(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    custom_units: dict[str, str] | None,
+    converted_value: float,
+) -> None:
+    """Test statistics_during_period_columns."""
+    now = get_start_time(dt_util.utcnow())
+
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set(
+        "sensor.test",
+        10,
+        attributes=TEMPERATURE_SENSOR_C_ATTRIBUTES,
+        timestamp=now.timestamp(),
+    )
+    await async_wait_recording_done(hass)
+
+    do_adhoc_statistics(hass, start=now)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/statistics_during_period_columns",
+            "start_time": now.isoformat(),
+            "statistic_ids": ["sensor.test"],
+            "period": "5minute",
+            "units": custom_units or {},
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    def _decode(column: str) -> list[float]:
+        values = array("d", b64decode(column))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+
+    columns = response["result"]["sensor.test"]
+    assert columns.keys() == {"start", "end", "last_reset", "max", "mean", "min"}
+    assert _decode(columns["start"]) == [now.timestamp()]
+    assert _decode(columns["end"]) == [(now + timedelta(minutes=5)).timestamp()]
+    assert math.isnan(_decode(columns["last_reset"])[0])
+    for key in ("max", "mean", "min"):
+        assert _decode(columns[key]) == [pytest.approx(converted_value)]
+
+
+async def test_statistics_during_period_columns_bad_time(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test statistics_during_period_columns with invalid times."""
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/statistics_during_period_columns",
+            "start_time": "cats",
+            "statistic_ids": ["sensor.test"],
+            "period": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/statistics_during_period_columns",
+            "start_time": dt_util.utcnow().isoformat(),
+            "end_time": "dogs",
+            "statistic_ids": ["sensor.test"],
+            "period": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_end_time"
+
+
 @pytest.mark.parametrize(
     ("attributes", "state", "value", "custom_units", "converted_value"),
     [
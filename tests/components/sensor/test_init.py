@@ -34,6 +34,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfLength,
     UnitOfMass,
+    UnitOfPower,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
@@ -2713,3 +2714,58 @@ async def test_suggested_unit_guard_valid_unit(
     assert entry.options == {
         "sensor.private": {"suggested_unit_of_measurement": suggested_unit},
     }
+
+
+async def test_unchanged_attributes_reused(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the attributes are reused while only the sensor value changes."""
+
+    class PowerSensor(SensorEntity):
+        _attr_device_class = SensorDeviceClass.POWER
+        _attr_name = "Power"
+        _attr_native_unit_of_measurement = UnitOfPower.WATT
+        _attr_native_value = 100
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _attr_unique_id = "power"
+
+    entity = PowerSensor()
+    setup_test_component_platform(hass, sensor.DOMAIN, [entity])
+    assert await async_setup_component(hass, "sensor", {"sensor": {"platform": "test"}})
+    await hass.async_block_till_done()
+
+    state1 = hass.states.get(entity.entity_id)
+    assert state1.state == "100"
+    assert state1.attributes == {
+        "device_class": "power",
+        "friendly_name": "Power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+
+    entity._attr_native_value = 200
+    entity.async_write_ha_state()
+    state2 = hass.states.get(entity.entity_id)
+    assert state2.state == "200"
+    assert state2.attributes is state1.attributes
+
+    # Changing the unit in the entity options updates the attributes
+    entity_registry.async_update_entity_options(
+        entity.entity_id, "sensor", {"unit_of_measurement": UnitOfPower.KILO_WATT}
+    )
+    await hass.async_block_till_done()
+    entity.async_write_ha_state()
+    state3 = hass.states.get(entity.entity_id)
+    assert state3.state == "0.2"
+    assert state3.attributes["unit_of_measurement"] == "kW"
+
+    # Changing the capability attributes updates the attributes
+    entity._attr_state_class = SensorStateClass.TOTAL
+    entity.async_write_ha_state()
+    state4 = hass.states.get(entity.entity_id)
+    assert state4.attributes == {
+        "device_class": "power",
+        "friendly_name": "Power",
+        "state_class": "total",
+        "unit_of_measurement": "kW",
+    }
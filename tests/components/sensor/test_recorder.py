@@ -13,6 +13,7 @@ import pytest
 
 from homeassistant import loader
 from homeassistant.components.recorder import (
+    CONF_ACCUMULATE_STATISTICS_STATES,
     CONF_COMMIT_INTERVAL,
     DOMAIN as RECORDER_DOMAIN,
     Recorder,
@@ -36,7 +37,16 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
-from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
+from homeassistant.components.sensor.recorder import (
+    STATISTICS_STATE_ACCUMULATOR,
+    StatisticsStateAccumulator,
+)
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.setup import async_setup_component
@@ -723,6 +733,125 @@ async def test_compile_hourly_statistics_purged_state_changes(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_does_not_accumulate_states_by_default(
+    hass: HomeAssistant,
+) -> None:
+    """Test statistics are compiled from the database by default."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    mock.assert_called()
+    assert STATISTICS_STATE_ACCUMULATOR not in hass.data
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_ACCUMULATE_STATISTICS_STATES: True}])
+async def test_compile_statistics_from_accumulated_states(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test compiling statistics from states accumulated in memory."""
+    zero = get_start_time(dt_util.utcnow())
+    period1 = zero + timedelta(minutes=5)
+    freezer.move_to(zero - timedelta(minutes=5))
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    # The first compile starts accumulating states
+    do_adhoc_statistics(hass, start=zero - timedelta(hours=1))
+    await async_wait_recording_done(hass)
+
+    for offset, state in ((-1, "10"), (1, "20"), (3, "40"), (6, "1000")):
+        freezer.move_to(zero + timedelta(minutes=offset))
+        hass.states.async_set("sensor.test1", state, POWER_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+
+    with patch.object(history, "get_full_significant_states_with_session") as mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+        do_adhoc_statistics(hass, start=period1)
+        await async_wait_recording_done(hass)
+    mock.assert_not_called()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(period1).timestamp(),
+                "mean": pytest.approx((10 * 1 + 20 * 2 + 40 * 2) / 5),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(40.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": process_timestamp(period1).timestamp(),
+                "end": process_timestamp(period1 + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx((40 * 1 + 1000 * 4) / 5),
+                "min": pytest.approx(40.0),
+                "max": pytest.approx(1000.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ]
+    }
+
+    # Compiling an earlier period falls back to the database
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as mock:
+        do_adhoc_statistics(hass, start=zero - timedelta(minutes=30))
+        await async_wait_recording_done(hass)
+    mock.assert_called()
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+async def test_statistics_state_accumulator(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the accumulator forgets removed sensors and stops with the recorder."""
+    zero = get_start_time(dt_util.utcnow())
+    freezer.move_to(zero - timedelta(minutes=1))
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    accumulator = StatisticsStateAccumulator()
+    accumulator.async_start(hass)
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    freezer.move_to(zero + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "20", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_remove("sensor.test2")
+    await hass.async_block_till_done()
+
+    end = zero + timedelta(minutes=5)
+    sensor_states = [hass.states.get("sensor.test1")]
+    history_list = accumulator.history_during_period(zero, end, sensor_states, set())
+    assert list(history_list) == ["sensor.test1"]
+    assert accumulator._num_states == 1
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+    assert accumulator.history_during_period(end, end, sensor_states, set()) is None
+
+
 @pytest.mark.parametrize("attributes", [TEMPERATURE_SENSOR_ATTRIBUTES])
 async def test_compile_hourly_statistics_wrong_unit(
     hass: HomeAssistant,
@@ -44,6 +44,7 @@ async def _setup_automation_or_script(
     configs: list[dict[str, Any]],
     script_config: dict[str, Any] | None = None,
     stored_traces: int | None = None,
+    sample_interval: int | None = None,
 ) -> None:
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -67,6 +68,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if sample_interval is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config.setdefault("trace", {})["sample_interval"] = sample_interval
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -602,6 +607,103 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_sample_interval(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test only the trace of 1 in every sample_interval runs is stored."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], stored_traces=10, sample_interval=3
+    )
+    client = await hass_ws_client()
+
+    for _ in range(7):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 3
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_overflow_all_traces(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test the least recently used traces are evicted when all traces overflow."""
+    msg_id = 1
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+    client = await hass_ws_client()
+
+    async def list_traces() -> tuple[list[str], list[str]]:
+        await client.send_json(
+            {"id": next_id(), "type": "trace/list", "domain": domain}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return (
+            [
+                trace["run_id"]
+                for trace in _find_traces(response["result"], domain, "sun")
+            ],
+            [
+                trace["run_id"]
+                for trace in _find_traces(response["result"], domain, "moon")
+            ],
+        )
+
+    with patch("homeassistant.components.trace.MAX_STORED_TRACES", 3):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+        sun_run_ids, moon_run_ids = await list_traces()
+        assert (len(sun_run_ids), len(moon_run_ids)) == (1, 1)
+
+        # Viewing the trace of sun keeps it when the oldest traces are evicted
+        await client.send_json(
+            {
+                "id": next_id(),
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "sun",
+                "run_id": sun_run_ids[0],
+            }
+        )
+        assert (await client.receive_json())["success"]
+
+        for _ in range(2):
+            await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+            await hass.async_block_till_done()
+
+        new_sun_run_ids, new_moon_run_ids = await list_traces()
+        assert new_sun_run_ids == sun_run_ids
+        assert len(new_moon_run_ids) == 2
+        assert moon_run_ids[0] not in new_moon_run_ids
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
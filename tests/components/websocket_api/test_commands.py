@@ -17,7 +17,11 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.const import (
+    FEATURE_COALESCE_MESSAGES,
+    FEATURE_COMPACT_STATES,
+    URL,
+)
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
@@ -1310,6 +1314,157 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_compact_states(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities with entity ids replaced by references."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_COMPACT_STATES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.one", "on", {"color": "red"})
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "e": ["light.one", "light.two"],
+        "a": {
+            "0": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "on"},
+            "1": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+        },
+    }
+
+    hass.states.async_set("light.two", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {"c": {"1": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+
+    hass.states.async_set("light.three", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "e": ["light.three"],
+        "a": {"2": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+    }
+
+    hass.states.async_remove("light.one")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": [0]}
+
+
+async def test_subscribe_entities_shared_hub(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test multiple subscribe entities subscriptions share one listener."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.other": True}}}
+    )
+    init_count = sum(hass.bus.async_listeners().values())
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await websocket_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.other"]}
+    )
+    for msg_id in (7, 7, 8, 8):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+
+    # One state changed listener and the listeners invalidating the index
+    assert sum(hass.bus.async_listeners().values()) == init_count + 5
+
+    hass.states.async_set("light.permitted", "on")
+    hass.states.async_set("light.other", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert "light.permitted" in msg["event"]["c"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert "light.other" in msg["event"]["c"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert "light.other" in msg["event"]["c"]
+
+    # Changing the permissions invalidates the index
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.other": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert "light.other" in msg["event"]["c"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert "light.other" in msg["event"]["c"]
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_subscribe_entities_permissions_changed(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test changed permissions are applied to entities already indexed."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.denied", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+
+    # Warm the index for both entities
+    hass.states.async_set("light.permitted", "on")
+    hass.states.async_set("light.denied", "on")
+    msg = await websocket_client.receive_json()
+    assert "light.permitted" in msg["event"]["c"]
+
+    # Downgrade the permissions and change an entity missing from the index
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.new": True}}})
+    hass.states.async_set("light.new", "on")
+    msg = await websocket_client.receive_json()
+    assert "light.new" in msg["event"]["a"]
+
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.new", "off")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.new"]
+
+    # Upgrade the permissions to an entity the subscription was denied
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.denied": True}}})
+    hass.states.async_set("light.denied", "off")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.denied"]
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
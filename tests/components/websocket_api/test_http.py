@@ -8,18 +8,30 @@ from unittest.mock import patch
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
 
+from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api import (
     async_register_command,
     const,
     http,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -345,6 +357,50 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_drain_message_queue(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a command can wait for the queued messages to be written."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    queue_sizes: list[int] = []
+
+    @websocket_command({"type": "send_many"})
+    @websocket_api.async_response
+    async def send_many(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        for idx in range(10):
+            connection.send_event(msg["id"], idx)
+        instance = cast(http.WebSocketHandler, setup_instance)
+        queue_sizes.append(len(instance._message_queue))
+        await connection.async_drain()
+        queue_sizes.append(len(instance._message_queue))
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, send_many)
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    await websocket_client.send_json({"id": 5, "type": "send_many"})
+    for idx in range(10):
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == idx
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert queue_sizes == [10, 0]
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -523,3 +579,112 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_compress_large_messages(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test only the large messages are compressed with permessage-deflate."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    assert await async_setup_component(hass, "websocket_api", {})
+    hass.states.async_set("light.kitchen", "on", {"large": "x" * 2000})
+    client = await hass_client_no_auth()
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        ws = await client.ws_connect(const.URL, compress=15)
+
+    assert (await ws.receive_json())["type"] == TYPE_AUTH_REQUIRED
+    await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+    assert (await ws.receive_json())["type"] == TYPE_AUTH_OK
+    stats = cast(http.WebSocketHandler, setup_instance).stats
+    assert stats.compressed_writes == 0
+
+    await ws.send_json({"id": 1, "type": "get_states"})
+    msg = await ws.receive_json()
+    assert msg["result"][0]["attributes"]["large"] == "x" * 2000
+    assert stats.compressed_writes == 1
+    bytes_sent = stats.bytes_sent
+
+    await ws.send_json({"id": 2, "type": "ping"})
+    msg = await ws.receive_json()
+    assert msg["type"] == "pong"
+    assert stats.compressed_writes == 1
+    assert stats.bytes_sent > bytes_sent
+    await ws.close()
+
+
+async def test_batch_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test messages queued right after a write are batched."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    batch_timers: list[bool] = []
+
+    @websocket_command({"type": "send_burst"})
+    @websocket_api.async_response
+    async def send_burst(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        instance = cast(http.WebSocketHandler, setup_instance)
+        connection.send_event(msg["id"], 0)
+        await connection.async_drain()
+        for idx in range(1, 4):
+            connection.send_event(msg["id"], idx)
+        batch_timers.append(instance._batch_timer is not None)
+        await connection.async_drain()
+        connection.send_event(msg["id"], 4)
+        batch_timers.append(instance._batch_timer is not None)
+        # A result is not held back by the batch window
+        connection.send_result(msg["id"])
+        batch_timers.append(instance._batch_timer is not None)
+
+    async_register_command(hass, send_burst)
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    await websocket_client.send_json({"id": 2, "type": "send_burst"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == 0
+    # The remaining events are written at once
+    msg = json_loads(await websocket_client.receive_str())
+    assert [event["event"] for event in msg] == [1, 2, 3]
+    msg = json_loads(await websocket_client.receive_str())
+    assert msg[0]["event"] == 4
+    assert msg[1]["success"]
+    assert batch_timers == [True, True, False]
+
+    stats = cast(http.WebSocketHandler, setup_instance).stats
+    assert stats.writes == 4
+    assert stats.peak_queue_size == 3
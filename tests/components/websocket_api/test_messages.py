@@ -2,11 +2,15 @@
 
 import pytest
 
+from homeassistant.components.websocket_api.commands import pong_message
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    event_message,
+    is_event_message,
     message_to_json_bytes,
+    result_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
@@ -299,3 +303,15 @@ async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_is_event_message(hass: HomeAssistant) -> None:
+    """Test detecting serialized event messages."""
+    event = Event("test_event", {"type": "event"})
+    assert is_event_message(cached_event_message(b"12", event))
+    assert is_event_message(message_to_json_bytes(event_message(12, {"a": 1})))
+    assert not is_event_message(
+        message_to_json_bytes(result_message(12, {"type": "event"}))
+    )
+    assert not is_event_message(message_to_json_bytes(pong_message(12)))
+    assert not is_event_message(b'{"type":"auth_ok"}')
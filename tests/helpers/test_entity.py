@@ -33,7 +33,12 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    significant_change,
+)
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
@@ -44,6 +49,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     mock_integration,
     mock_registry,
 )
@@ -2652,3 +2658,157 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_static_attributes_cached(hass: HomeAssistant) -> None:
+    """Test static state attributes are reused until they are invalidated."""
+
+    class CachedEntity(entity.Entity):
+        _attr_name = "Cached"
+        _attr_unit_of_measurement = "W"
+
+    ent = CachedEntity()
+    ent.entity_id = "test.cached"
+    ent.hass = hass
+    ent._attr_state = "1"
+    ent.async_write_ha_state()
+    state1 = hass.states.get(ent.entity_id)
+    assert state1.attributes == {"friendly_name": "Cached", "unit_of_measurement": "W"}
+
+    ent._attr_state = "2"
+    ent.async_write_ha_state()
+    state2 = hass.states.get(ent.entity_id)
+    assert state2.state == "2"
+    assert state2.attributes is state1.attributes
+
+    # Changing a property invalidates the static attributes
+    ent._attr_icon = "mdi:flash"
+    ent.async_write_ha_state()
+    state3 = hass.states.get(ent.entity_id)
+    assert state3.attributes == {
+        "friendly_name": "Cached",
+        "icon": "mdi:flash",
+        "unit_of_measurement": "W",
+    }
+
+    # Invalidating the cached property directly also invalidates them
+    ent.__dict__.pop("unit_of_measurement")
+    ent._attr_unit_of_measurement = "kW"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["unit_of_measurement"] == "kW"
+
+    # The cached property is calculated again before the state is written
+    ent._attr_supported_features = 1
+    assert ent.supported_features == 1
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["supported_features"] == 1
+    ent._attr_supported_features = None
+
+    # Dynamic attributes are merged with the static attributes
+    ent._attr_extra_state_attributes = {"power": 5, "icon": "mdi:overridden"}
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {
+        "friendly_name": "Cached",
+        "icon": "mdi:flash",
+        "power": 5,
+        "unit_of_measurement": "kW",
+    }
+
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    state4 = hass.states.get(ent.entity_id)
+    assert state4.state == STATE_UNAVAILABLE
+    assert state4.attributes == {
+        "friendly_name": "Cached",
+        "icon": "mdi:flash",
+        "unit_of_measurement": "kW",
+    }
+
+
+async def test_static_attributes_compared_for_properties(
+    hass: HomeAssistant,
+) -> None:
+    """Test static state attributes follow the values of plain properties."""
+
+    class PropertyEntity(entity.Entity):
+        _attr_state = "on"
+        icon_value = "mdi:one"
+
+        @property
+        def icon(self) -> str:
+            return self.icon_value
+
+    ent = PropertyEntity()
+    ent.entity_id = "test.property"
+    ent.hass = hass
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {"icon": "mdi:one"}
+
+    ent.icon_value = "mdi:two"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes == {"icon": "mdi:two"}
+
+
+async def test_write_rate_policy(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test state writes are coalesced unless they are significant."""
+
+    class CoalescedEntity(entity.Entity):
+        _attr_should_poll = False
+        _attr_state = "1"
+        write_rate_policy = entity.WriteRatePolicy(interval=10, track_min_max=True)
+
+    ent = CoalescedEntity()
+    ent.entity_id = "test.coalesced"
+    platform = MockEntityPlatform(hass, domain="test")
+    await platform.async_add_entities([ent])
+    hass.data[significant_change.DATA_FUNCTIONS]["test"] = (
+        lambda _hass, old_state, _old_attrs, new_state, _new_attrs: abs(
+            float(old_state) - float(new_state)
+        )
+        >= 10
+    )
+    state = hass.states.get("test.coalesced")
+    assert state.state == "1"
+    assert state.attributes == {"coalesced_min": 1, "coalesced_max": 1}
+
+    for value in ("3", "0", "2"):
+        ent._attr_state = value
+        ent.async_write_ha_state()
+    assert hass.states.get("test.coalesced").state == "1"
+
+    # A significant change is written immediately
+    ent._attr_state = "20"
+    ent.async_write_ha_state()
+    state = hass.states.get("test.coalesced")
+    assert state.state == "20"
+    assert state.attributes == {"coalesced_min": 0, "coalesced_max": 20}
+
+    # The latest state is written when the interval has passed
+    ent._attr_state = "22"
+    ent.async_write_ha_state()
+    ent._attr_state = "21"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.coalesced").state == "20"
+    freezer.tick(10)
+    async_fire_time_changed(hass)
+    state = hass.states.get("test.coalesced")
+    assert state.state == "21"
+    assert state.attributes == {"coalesced_min": 21, "coalesced_max": 22}
+
+    # Becoming unavailable is always significant
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    assert hass.states.get("test.coalesced").state == STATE_UNAVAILABLE
+
+    # The delayed write is cancelled when the entity is removed
+    ent._attr_available = True
+    ent.async_write_ha_state()
+    ent._attr_state = "25"
+    ent.async_write_ha_state()
+    assert hass.states.get("test.coalesced").state == "21"
+    await platform.async_remove_entity(ent.entity_id)
+    freezer.tick(10)
+    async_fire_time_changed(hass)
+    assert hass.states.get("test.coalesced") is None
@@ -30,7 +30,11 @@ from homeassistant.helpers import (
     issue_registry as ir,
 )
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import Entity, async_generate_entity_id
+from homeassistant.helpers.entity import (
+    Entity,
+    WriteRatePolicy,
+    async_generate_entity_id,
+)
 from homeassistant.helpers.entity_component import (
     DEFAULT_SCAN_INTERVAL,
     EntityComponent,
@@ -389,6 +393,33 @@ async def test_parallel_updates_async_platform_with_constant(
     assert handle._update_in_sequence is False
 
 
+async def test_write_rate_policy_with_constant(hass: HomeAssistant) -> None:
+    """Test platform can set the write rate policy of its entities."""
+    platform = MockPlatform()
+    platform.WRITE_RATE_POLICY = WriteRatePolicy(interval=5)
+
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+
+    class OwnPolicyEntity(MockEntity):
+        """Mock entity with its own write rate policy."""
+
+        write_rate_policy = WriteRatePolicy(interval=1)
+
+    entity = MockEntity()
+    own_policy_entity = OwnPolicyEntity()
+    await handle.async_add_entities([entity, own_policy_entity])
+    assert entity.write_rate_policy == WriteRatePolicy(interval=5)
+    assert own_policy_entity.write_rate_policy == WriteRatePolicy(interval=1)
+
+
 async def test_parallel_updates_sync_platform(hass: HomeAssistant) -> None:
     """Test sync platform parallel_updates default set to 1."""
     platform = MockPlatform()
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 from functools import partial
+import gc
 from typing import Any
 from unittest.mock import patch
 
@@ -19,7 +20,9 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import MaxLengthExceeded
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util.dt import utc_from_timestamp
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     ANY,
@@ -458,6 +461,54 @@ async def test_filter_on_load(
     assert entry_disabled_user.disabled_by is er.RegistryEntryDisabler.USER
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_shares_values(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test loaded entries share the values they have in common."""
+    # Decoded JSON has a separate copy of every value
+    hass_storage[er.STORAGE_KEY] = json_loads(
+        json_dumps(
+            {
+                "version": er.STORAGE_VERSION_MAJOR,
+                "minor_version": 1,
+                "data": {
+                    "entities": [
+                        {
+                            "entity_id": f"test.entity_{idx}",
+                            "platform": "super_platform",
+                            "unique_id": f"unique-{idx}",
+                            "device_id": "device_id",
+                        }
+                        for idx in range(2)
+                    ]
+                },
+            }
+        )
+    )
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    entry_1, entry_2 = registry.entities.values()
+    assert entry_1.platform == "super_platform"
+    assert entry_1.platform is entry_2.platform
+    assert entry_1.device_id is entry_2.device_id
+    assert entry_1.created_at is entry_2.modified_at
+    assert entry_1.options == {}
+    assert entry_1.options is entry_2.options
+    assert gc.isenabled()
+
+    # Options are still protected and not shared once set
+    entry_1 = registry.async_update_entity_options(
+        entry_1.entity_id, "light", {"minimum_brightness": 20}
+    )
+    assert entry_1.options == {"light": {"minimum_brightness": 20}}
+    assert entry_2.options == {}
+    with pytest.raises(RuntimeError):
+        entry_1.options["light"]["minimum_brightness"] = 10
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_load_bad_data(
     hass: HomeAssistant,
@@ -1143,6 +1143,67 @@ async def test_track_template_result_none(hass: HomeAssistant) -> None:
     assert wildercard_runs == [(None, 5), (5, 10)]
 
 
+async def test_track_template_result_skips_unchanged_inputs(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are not re-rendered when the states they read are unchanged."""
+    runs = []
+
+    hass.states.async_set("sensor.power", "10", {"voltage": 230})
+    hass.states.async_set("sensor.other", "on", {"level": 1})
+    template_state = Template("{{ states('sensor.power') | int > 5 }}", hass)
+    template_attrs = Template(
+        "{{ states('sensor.power') }} {{ state_attr('sensor.other', 'level') }}",
+        hass,
+    )
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend((update.template, update.result) for update in updates)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_state, None), TrackTemplate(template_attrs, None)],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    assert template_state._renders == 2
+    assert template_attrs._renders == 2
+
+    # Only the attributes of sensor.power changed, neither template re-renders
+    hass.states.async_set("sensor.power", "10", {"voltage": 231})
+    await hass.async_block_till_done()
+    assert template_state._renders == 2
+    assert template_attrs._renders == 2
+
+    # The attributes of sensor.other are read by the second template
+    hass.states.async_set("sensor.other", "on", {"level": 1, "extra": True})
+    await hass.async_block_till_done()
+    assert template_state._renders == 2
+    assert template_attrs._renders == 4
+    assert runs == [(template_attrs, "10 1")]
+
+    hass.states.async_set("sensor.power", "11", {"voltage": 231})
+    await hass.async_block_till_done()
+    assert template_state._renders == 4
+    assert template_attrs._renders == 6
+    assert runs == [
+        (template_attrs, "10 1"),
+        (template_state, True),
+        (template_attrs, "11 1"),
+    ]
+
+    # A forced refresh always re-renders
+    info.async_refresh()
+    assert template_state._renders == 6
+    assert template_attrs._renders == 8
+
+    info.async_remove()
+
+
 async def test_track_template_result_super_template(hass: HomeAssistant) -> None:
     """Test tracking template with super template listening to same entity."""
     specific_runs = []
@@ -1,7 +1,9 @@
 """Test significant change helper."""
 
+import asyncio
 from types import MappingProxyType
 from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -90,6 +92,61 @@ async def test_significant_change_extra(
     assert checker.async_is_significant_change(State(ent_id, "200", attrs), extra_arg=2)
 
 
+async def test_check_significant_change(
+    hass: HomeAssistant,
+    checker: significant_change.SignificantlyChangedChecker,
+) -> None:
+    """Test checking a single state against the previous state."""
+    old_state = State("test_domain.test_entity", "100", {})
+
+    assert not significant_change.async_check_significant_change(
+        hass, old_state, "96", {}
+    )
+    assert significant_change.async_check_significant_change(hass, old_state, "95", {})
+    assert significant_change.async_check_significant_change(
+        hass, old_state, STATE_UNKNOWN, {}
+    )
+    assert not significant_change.async_check_significant_change(
+        hass, State("test_domain.test_entity", STATE_UNKNOWN, {}), STATE_UNKNOWN, {}
+    )
+    assert significant_change.async_check_significant_change(
+        hass, State("test_domain.test_entity", STATE_UNAVAILABLE, {}), "100", {}
+    )
+
+    # Unknown if the domain does not have a significant change platform
+    assert (
+        significant_change.async_check_significant_change(
+            hass, State("other_domain.test_entity", "100", {}), "200", {}
+        )
+        is None
+    )
+
+
+async def test_initialize_waits_for_platforms(hass: HomeAssistant) -> None:
+    """Test all callers of async_initialize wait for the platforms."""
+    processing = asyncio.Event()
+
+    async def _mock_process_integration_platforms(hass, platform, process_platform):
+        await processing.wait()
+        process_platform(
+            hass, "test_domain", Mock(async_check_significant_change=Mock())
+        )
+
+    with patch(
+        "homeassistant.helpers.significant_change.async_process_integration_platforms",
+        _mock_process_integration_platforms,
+    ):
+        first = hass.async_create_task(significant_change.async_initialize(hass))
+        second = hass.async_create_task(significant_change.async_initialize(hass))
+        await asyncio.sleep(0)
+        assert not first.done()
+        assert not second.done()
+
+        processing.set()
+        await asyncio.gather(first, second)
+        assert "test_domain" in hass.data[significant_change.DATA_FUNCTIONS]
+
+
 async def test_check_valid_float() -> None:
     """Test extra significant checker works."""
     assert significant_change.check_valid_float("1")
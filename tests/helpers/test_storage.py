@@ -21,7 +21,7 @@ from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAs
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import (
@@ -1180,3 +1180,106 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal(tmpdir: py.path.local, caplog: pytest.LogCaptureFixture) -> None:
+    """Test delayed saves only journal the changed items of a journaled store."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+        items = {str(idx): {"id": str(idx), "value": idx} for idx in range(100)}
+
+        def data_func() -> dict[str, Any]:
+            return {"items": list(items.values()), "deleted": []}
+
+        async def load() -> dict[str, Any] | None:
+            return await storage.Store(
+                hass, MOCK_VERSION, MOCK_KEY, journal_key="id"
+            ).async_load()
+
+        def file_sizes() -> tuple[int, int]:
+            return (
+                os.path.getsize(store.path),
+                os.path.getsize(store.journal_path)
+                if os.path.exists(store.journal_path)
+                else 0,
+            )
+
+        # The first write writes the whole file
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+        file_size, journal_size = await hass.async_add_executor_job(file_sizes)
+        assert journal_size == 0
+
+        items["5"] = {"id": "5", "value": "changed"}
+        del items["7"]
+        items["new"] = {"id": "new", "value": "new"}
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+        # Only the changes are written
+        new_file_size, journal_size = await hass.async_add_executor_job(file_sizes)
+        assert new_file_size == file_size
+        assert 0 < journal_size < file_size / 10
+        # Nothing is journaled without changes
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+        assert (await hass.async_add_executor_job(file_sizes))[1] == journal_size
+
+        # The journal is replayed when loading, keeping the order of the items
+        assert await load() == data_func()
+
+        # An incomplete change is ignored
+        def append_to_journal(content: bytes) -> None:
+            with open(store.journal_path, "ab") as journal:
+                journal.write(content)
+
+        await hass.async_add_executor_job(append_to_journal, b'{"journal_id')
+        assert await load() == data_func()
+        assert "Ignoring incomplete change" in caplog.text
+
+        # The final write compacts the journal into the file
+        items["8"] = {"id": "8", "value": "final"}
+        store.async_delay_save(data_func, 10)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert (await hass.async_add_executor_job(file_sizes))[1] == 0
+        assert await load() == data_func()
+
+        # A journal left over from before the last full write is ignored
+        await hass.async_add_executor_job(
+            append_to_journal,
+            json_bytes({"journal_id": "old", "upsert": {}, "delete": {"items": ["1"]}}),
+        )
+        assert await load() == data_func()
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted at shutdown without a pending save."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_key="id")
+        items = [{"id": "1", "value": 1}, {"id": "2", "value": 2}]
+
+        def data_func() -> dict[str, Any]:
+            return {"items": items}
+
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+        items = [{"id": "1", "value": "changed"}]
+        store.async_delay_save(data_func)
+        await store._async_handle_write_data()
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        # The file is readable without the journal
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        stored = await hass.async_add_executor_job(json_util.load_json, store.path)
+        assert stored["data"] == {"items": [{"id": "1", "value": "changed"}]}
+        await hass.async_stop(force=True)
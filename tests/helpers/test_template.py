@@ -5147,27 +5147,106 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared by source."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    template.COMPILED_TEMPLATE_LRU.clear()
+    stats = template.compiled_template_cache_stats()
 
-    tpl2 = template.Template(
-        (template_string),
+    def lookups() -> tuple[int, int]:
+        """Return the hits and misses since the start of the test."""
+        new_stats = template.compiled_template_cache_stats()
+        return (
+            new_stats["hits"] - stats["hits"],
+            new_stats["misses"] - stats["misses"],
+        )
+
+    # The first template is compiled after a miss
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    assert lookups() == (0, 1)
+    assert template.COMPILED_TEMPLATE_LRU.get((tpl._env.compile_key, template_string))
+    assert not template.COMPILED_TEMPLATE_LRU.get(
+        (template._NO_HASS_ENV.compile_key, template_string)
     )
+    assert lookups() == (1, 2)
+
+    # The second template reuses the compiled code
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl2._compiled_code is tpl._compiled_code
+    assert lookups() == (2, 2)
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    # Templates without hass are compiled with a different environment
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    assert tpl3._compiled_code is not tpl._compiled_code
+    assert lookups() == (2, 3)
+
+    # The compiled code outlives the templates
+    compile_key = tpl._env.compile_key
+    del tpl, tpl2, tpl3
+    assert template.COMPILED_TEMPLATE_LRU.get((compile_key, template_string))
+    assert lookups() == (3, 3)
+
+    new_stats = template.compiled_template_cache_stats()
+    assert new_stats["size"] == 2
+    assert new_stats["max_size"] == template.CACHED_COMPILED_TEMPLATES
+
+
+async def test_compiled_template_cache_per_environment(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test compiled templates are not shared between kinds of environments."""
+    area = area_registry.async_get_or_create("Kitchen")
+    entity_registry.async_get_or_create(
+        "light", "hue", "5678", suggested_object_id="kitchen"
+    )
+    entity_registry.async_update_entity("light.kitchen", area_id=area.id)
+    template_string = "{{ 'light.kitchen' | area_id }}"
+    template.COMPILED_TEMPLATE_LRU.clear()
+
+    limited_tpl = template.Template(template_string, hass)
+    with pytest.raises(TemplateError, match="not supported in limited templates"):
+        limited_tpl.async_render(limited=True)
+
+    # The code compiled for the limited environment is not reused
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == area.id
+    assert tpl._compiled_code is not limited_tpl._compiled_code
+
+    # Nor the code compiled for the full environment by limited templates
+    limited_tpl = template.Template(template_string, hass)
+    with pytest.raises(TemplateError, match="not supported in limited templates"):
+        limited_tpl.async_render(limited=True)
+    assert limited_tpl._compiled_code is not tpl._compiled_code
+
+
+async def test_render_info_entities_state_only(hass: HomeAssistant) -> None:
+    """Test entities of which only the state was read are collected."""
+    hass.states.async_set("sensor.a", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.b", "2")
+    hass.states.async_set("sensor.c", "3")
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.a') }} {{ states.sensor.b.state }}"
+        " {{ state_attr('sensor.c', 'x') }} {{ states.sensor.b.domain }}",
+    )
+    assert info.entities == {"sensor.a", "sensor.b", "sensor.c"}
+    assert info.entities_state_only == {"sensor.a", "sensor.b"}
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.a') }} {{ states('sensor.a', with_unit=True) }}"
+        " {{ states.sensor.b['state'] }} {{ states.sensor.c.last_updated }}",
+    )
+    assert info.entities == {"sensor.a", "sensor.b", "sensor.c"}
+    assert info.entities_state_only == {"sensor.b"}
 
 
 def test_is_template_string() -> None:
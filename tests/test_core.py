@@ -1169,6 +1169,54 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_entity_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test listening for events indexed by entity_id."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_entity("test", ["light.a", "light.b"], listener)
+    unsub_single = hass.bus.async_listen_entity("test", "light.a", listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.c"})
+    hass.bus.async_fire("test", {"other": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": ["light.a"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert calls[-1].data == {"entity_id": "light.b"}
+
+    unsub_single()
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    # Should log and do nothing now
+    unsub()
+    assert "Unable to remove unknown job listener" in caplog.text
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
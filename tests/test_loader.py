@@ -5,21 +5,29 @@ import os
 import pathlib
 import sys
 import threading
+from types import ModuleType
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
 from awesomeversion import AwesomeVersion
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -1999,3 +2007,72 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant,
+    tmp_path: pathlib.Path,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test manifests are reused until the manifest or the integration changes."""
+    root_module = ModuleType("custom_components")
+    root_module.__path__ = [str(tmp_path)]
+    integration_path = tmp_path / "test_cached"
+    integration_path.mkdir()
+    manifest_path = integration_path / "manifest.json"
+    manifest_path.write_text(
+        json_dumps({"domain": "test_cached", "name": "Test", "version": "1.0.0"})
+    )
+    (integration_path / "__init__.py").touch()
+
+    def resolve() -> loader.Integration | None:
+        return loader.Integration.resolve_from_root(hass, root_module, "test_cached")
+
+    manifest_cache = await loader.async_load_manifest_cache(hass)
+    integration = await hass.async_add_executor_job(resolve)
+    assert integration.name == "Test"
+    assert integration.has_translations is False
+    assert (manifest_cache.hits, manifest_cache.misses) == (0, 1)
+    integration = await hass.async_add_executor_job(resolve)
+    assert integration.name == "Test"
+    assert (manifest_cache.hits, manifest_cache.misses) == (1, 1)
+    assert (
+        await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root, hass, root_module, "not_there"
+        )
+        is None
+    )
+
+    # Adding a file to the integration invalidates its entry
+    (integration_path / "translations").mkdir()
+    os.utime(integration_path, ns=(1, 1))
+    integration = await hass.async_add_executor_job(resolve)
+    assert integration.has_translations is True
+    assert (manifest_cache.hits, manifest_cache.misses) == (1, 2)
+
+    freezer.tick(loader.MANIFEST_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["version"] == __version__
+    assert data["integrations"][str(integration_path)][2]["name"] == "Test"
+
+    # The entries are reused by the next start
+    manifest_cache = await loader.async_load_manifest_cache(hass)
+    assert (await hass.async_add_executor_job(resolve)).name == "Test"
+    assert (manifest_cache.hits, manifest_cache.misses) == (1, 0)
+
+    # Changing the manifest invalidates its entry
+    manifest_path.write_text(
+        json_dumps({"domain": "test_cached", "name": "Changed", "version": "1.0.0"})
+    )
+    os.utime(manifest_path, ns=(1, 1))
+    assert (await hass.async_add_executor_job(resolve)).name == "Changed"
+    assert (manifest_cache.hits, manifest_cache.misses) == (1, 1)
+
+    # The cache of another version of Home Assistant is dropped
+    data["version"] = "0.1.0"
+    manifest_cache = await loader.async_load_manifest_cache(hass)
+    assert (await hass.async_add_executor_job(resolve)).name == "Changed"
+    assert (manifest_cache.hits, manifest_cache.misses) == (0, 1)
@@ -639,6 +639,25 @@ def test_convert_invalid_unit(
         converter.convert(5, valid_unit, INVALID_SYMBOL)
 
 
+@pytest.mark.parametrize(
+    ("converter", "valid_units"),
+    [
+        (converter, valid_units)
+        for converter, valid_units in _ALL_CONVERTERS.items()
+        if converter.LINEAR
+    ],
+)
+def test_linear_converters(
+    converter: type[BaseUnitConverter], valid_units: list[str | None]
+) -> None:
+    """Test the conversions of linear converters are a constant ratio."""
+    for from_unit in valid_units:
+        for to_unit in valid_units:
+            ratio = converter.convert(1, from_unit, to_unit)
+            assert converter.convert(0, from_unit, to_unit) == 0
+            assert converter.convert(5, from_unit, to_unit) == pytest.approx(5 * ratio)
+
+
 @pytest.mark.parametrize(
     ("converter", "from_unit", "to_unit"),
     [
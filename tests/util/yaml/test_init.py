@@ -767,3 +767,36 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_file_cache(tmp_path: pathlib.Path) -> None:
+    """Test only changed files are parsed again when using the file cache."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text("automation: !include automations.yaml\n")
+    automations_path = tmp_path / "automations.yaml"
+    automations_path.write_text("- alias: one\n")
+    file_cache = yaml.YamlFileCache()
+
+    config = load_yaml_config_file(str(config_path), None, file_cache)
+    assert config == {"automation": [{"alias": "one"}]}
+    assert (file_cache.hits, file_cache.misses) == (0, 2)
+
+    # The cached content is copied as the configuration is modified
+    config["automation"][0]["alias"] = "modified"
+    config = load_yaml_config_file(str(config_path), None, file_cache)
+    assert config == {"automation": [{"alias": "one"}]}
+    automation = config["automation"][0]
+    assert automation.__config_file__ == str(automations_path)
+    assert automation["alias"].__line__ == 1
+    # The configuration includes another file and is not cached
+    assert (file_cache.hits, file_cache.misses) == (1, 3)
+
+    automations_path.write_text("- alias: one\n- alias: two\n")
+    config = load_yaml_config_file(str(config_path), None, file_cache)
+    assert config == {"automation": [{"alias": "one"}, {"alias": "two"}]}
+    assert (file_cache.hits, file_cache.misses) == (1, 5)
+
+    automations_path.unlink()
+    with pytest.raises(HomeAssistantError, match="Unable to read file"):
+        load_yaml_config_file(str(config_path), None, file_cache)